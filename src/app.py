@@ -51,6 +51,7 @@ from src.windows.Permissions.FlatpakPermissionRequest import FlatpakPermissionRe
 from src.Signals import Signals
 from src.api import start_dbus_service, stop_dbus_service
 from src.backend.Utils.AtomicSaveUtils import atomic_write
+from src.backend.PluginManager.BackendHost import BackendHost
 
 # Import globals
 import globals as gl
@@ -283,6 +284,9 @@ class App(Adw.Application):
         for child in multiprocessing.active_children():
             child.terminate()
 
+        # Plugin backend processes, started with subprocess so not among the children above
+        BackendHost.stop_all()
+
         gl.tray_icon.stop()
 
         if self.daemon_hold:
@@ -300,6 +304,10 @@ class App(Adw.Application):
 
     def force_quit(self):
         log.info("Forcing quit...")
+        # Bounded, a hung thread holding a store lock must not keep the app from quitting
+        saver = threading.Thread(target=gl.deck_manager.flush_pending_saves, name="flush_pending_saves", daemon=True)
+        saver.start()
+        saver.join(timeout=2)
         os._exit(1)
 
     def register_sigint_handler(self):
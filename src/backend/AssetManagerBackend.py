@@ -19,10 +19,13 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, Adw, GLib
 
 # Import Python modules
+import atexit
 import json
 import os
 import shutil
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger as log
 from PIL import Image
 
@@ -36,7 +39,24 @@ import globals as gl
 
 class AssetManagerBackend(list):
     JSON_PATH = os.path.join(gl.DATA_PATH, "Assets", "AssetManager", "Assets.json")
+    # Seconds to wait for more changes before writing Assets.json
+    SAVE_DELAY = 1
+    # Workers used by add_many to hash and check files
+    IMPORT_WORKERS = min(8, os.cpu_count() or 1)
+
     def __init__(self):
+        # Guards the list and the lookup tables, never held during file I/O
+        self.lock = threading.RLock()
+        # Picking a free file name and copying to it has to happen in one go
+        self.copy_lock = threading.Lock()
+        self.save_timer: threading.Timer = None
+
+        # Lookup tables, kept in sync with the list
+        self.by_id: dict[str, dict] = {}
+        self.by_sha256: dict[str, dict] = {}
+        self.by_name: dict[str, dict] = {}
+        self.by_internal_path: dict[str, dict] = {}
+
         self.load_json()
 
         self.fill_missing_data()
@@ -51,9 +71,50 @@ class AssetManagerBackend(list):
             self.clear()
             content = json.load(f)
             self.extend(content)
+        self.rebuild_indexes()
 
     def save_json(self):
-        atomic_save_json(self.JSON_PATH, self, indent=4)
+        with self.lock:
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+                self.save_timer = None
+            atomic_save_json(self.JSON_PATH, self, indent=4)
+
+    def schedule_save(self) -> None:
+        """Saves once no further change came in for SAVE_DELAY seconds"""
+        with self.lock:
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+            else:
+                # Don't lose the changes if the app quits before the timer fires
+                atexit.register(self.flush)
+            self.save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+
+    def flush(self) -> None:
+        """Writes pending changes now"""
+        with self.lock:
+            if self.save_timer is None:
+                return
+            atexit.unregister(self.flush)
+            self.save_json()
+
+    def rebuild_indexes(self) -> None:
+        with self.lock:
+            self.by_id.clear()
+            self.by_sha256.clear()
+            self.by_name.clear()
+            self.by_internal_path.clear()
+            for asset in self:
+                self.index_asset(asset)
+
+    def index_asset(self, asset: dict) -> None:
+        # setdefault so lookups still return the first match like the old linear scans
+        self.by_id.setdefault(asset.get("id"), asset)
+        self.by_sha256.setdefault(asset.get("sha256"), asset)
+        self.by_name.setdefault(asset.get("name"), asset)
+        self.by_internal_path.setdefault(asset.get("internal-path"), asset)
 
     def add(self, asset_path: str, licence_name: str = None, licence_url: str = None, author: str = None) -> str:
         if not os.path.exists(asset_path):
@@ -71,43 +132,93 @@ class AssetManagerBackend(list):
             return
 
         hash = sha256(asset_path)
-        if self.has_by_sha256(hash):
+        asset_id = self.add_hashed(asset_path, hash, licence_name, licence_url, author)
+        self.schedule_save()
+        return asset_id
+
+    def add_many(self, asset_paths: list[str], licence_name: str = None, licence_url: str = None, author: str = None) -> list[str]:
+        """
+        Adds all files at once: they are checked and hashed in parallel and Assets.json
+        is only written once. Returns the ids in the order of the paths, None for files
+        that could not be added.
+        """
+        def prepare(asset_path: str) -> str:
+            if not os.path.exists(asset_path):
+                log.warning(f"File {asset_path} not found.")
+                return
+            if not self.is_decodable(asset_path):
+                log.warning(f"File {asset_path} is not a valid/decodable image, gif, svg or video. Refusing to add it.")
+                return
+            return sha256(asset_path)
+
+        with ThreadPoolExecutor(max_workers=self.IMPORT_WORKERS, thread_name_prefix="asset-import") as executor:
+            hashes = list(executor.map(prepare, asset_paths))
+
+        ids = []
+        for asset_path, hash in zip(asset_paths, hashes):
+            if hash is None:
+                ids.append(None)
+                continue
+            ids.append(self.add_hashed(asset_path, hash, licence_name, licence_url, author))
+
+        n_invalid = sum(1 for asset_path, hash in zip(asset_paths, hashes) if hash is None and os.path.exists(asset_path))
+        if n_invalid > 0:
+            dial = Gtk.AlertDialog(
+                message="Some files are invalid.",
+                detail=f"{n_invalid} files could not be read as an image, gif, svg or video.",
+                modal=True
+            )
+            GLib.idle_add(dial.show)
+
+        self.schedule_save()
+        return ids
+
+    def add_hashed(self, asset_path: str, hash: str, licence_name: str = None, licence_url: str = None, author: str = None) -> str:
+        """
+        Adds the already checked file without saving, returns the id of the (possibly existing) asset.
+        The file is copied and its thumbnail created without holding the lock.
+        """
+        with self.lock:
+            existing = self.get_by_sha256(hash)
+        if existing is not None:
             #TODO: It is possible that the some image has the same sha but not the name because it got renamed
             log.warning(f"Tried to add already existing asset. Ignoring. File: {asset_path}")
-            id = self.get_by_sha256(hash)["id"]
-            asset = self.get_by_id(id)
-            return id
-        
+            return existing["id"]
+
         # Copy asset to internal folder if it does not exist
+        internal_path = asset_path
         if not file_in_dir(os.path.basename(asset_path), os.path.join(gl.DATA_PATH, "cache")):
             internal_path = self.copy_asset(asset_path)
         
         thumbnail_path = internal_path
         
-        if is_video(asset_path):
+        if is_video(asset_path) or is_svg(asset_path):
             thumbnail_path = self.save_thumbnail(asset_path, hash)
 
-        if is_svg(asset_path):
-            thumbnail_path = self.save_thumbnail(asset_path, hash)
-            
-
-        asset = {
-            "name": os.path.splitext(os.path.basename(asset_path))[0],
-            "original-path": asset_path,
-            "internal-path": internal_path,
-            "sha256": hash,
-            "id": self.create_unique_uuid(),
-            "license": {
-                "name": licence_name,
-                "url": licence_url,
-                "author": author
-            },
-            "thumbnail": thumbnail_path
-        }
-        self.append(asset)
-
-        # Save json
-        self.save_json()
+        with self.lock:
+            existing = self.get_by_sha256(hash)
+            if existing is None:
+                asset = {
+                    "name": os.path.splitext(os.path.basename(asset_path))[0],
+                    "original-path": asset_path,
+                    "internal-path": internal_path,
+                    "sha256": hash,
+                    "id": self.create_unique_uuid(),
+                    "license": {
+                        "name": licence_name,
+                        "url": licence_url,
+                        "author": author
+                    },
+                    "thumbnail": thumbnail_path
+                }
+                self.append(asset)
+                self.index_asset(asset)
+
+        if existing is not None:
+            # Added by another thread meanwhile, drop the second copy
+            if internal_path not in (asset_path, existing["internal-path"]) and os.path.exists(internal_path):
+                os.remove(internal_path)
+            return existing["id"]
 
         # Return id of added asset
         return asset["id"]
@@ -150,11 +261,17 @@ class AssetManagerBackend(list):
 
         os.remove(internal_path)
 
-        self.remove(asset)
+        with self.lock:
+            self.remove(asset)
+            self.rebuild_indexes()
         self.save_json()
         
         
     def copy_asset(self, asset_path: str) -> str:
+        with self.copy_lock:
+            return self._copy_asset(asset_path)
+
+    def _copy_asset(self, asset_path: str) -> str:
         file_name = os.path.basename(asset_path)
         dst_path = None
         if not file_in_dir(file_name, os.path.join(gl.DATA_PATH, "Assets", "AssetManager", "Assets")):
@@ -201,24 +318,16 @@ class AssetManagerBackend(list):
         return self.get_by_internal_path(internal_path) is not None
 
     def get_by_name(self, name: str) -> dict:
-        for asset in self:
-            if asset["name"] == name:
-                return asset
+        return self.by_name.get(name)
             
     def get_by_sha256(self, sha256: str) -> dict:
-        for asset in self:
-            if asset["sha256"] == sha256:
-                return asset
+        return self.by_sha256.get(sha256)
             
     def get_by_id(self, id: str) -> dict:
-        for asset in self:
-            if asset["id"] == id:
-                return asset
+        return self.by_id.get(id)
             
     def get_by_internal_path(self, internal_path: str) -> dict:
-        for asset in self:
-            if asset["internal-path"] == internal_path:
-                return asset
+        return self.by_internal_path.get(internal_path)
             
     def get_all(self) -> list:
         return self
@@ -266,6 +375,7 @@ class AssetManagerBackend(list):
                         log.warning(f"Failed to remove {path}: {e}")
 
             self.remove(asset)
+        self.rebuild_indexes()
         self.save_json()
 
     def add_custom_media_set_by_ui(self, url: str, path: str):
@@ -14,12 +14,16 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 import gc
 import hashlib
+import heapq
+import itertools
 import os
 import statistics
 import threading
 import time
 # Import Python modules
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import copy
 from dataclasses import dataclass
 from queue import Queue
@@ -39,16 +43,19 @@ from src.backend.DeckManagement.HelperMethods import *
 from src.backend.DeckManagement.ImageHelpers import *
 from src.backend.DeckManagement.InputIdentifier import Input, InputEvent, InputIdentifier
 from src.backend.DeckManagement.Subclasses.ActionPermissionManager import ActionPermissionManager
+from src.backend.DeckManagement.Subclasses.ActionWorkerPool import ActionWorkerPool, LANE_EVENT
 from src.backend.DeckManagement.Subclasses.FakeDeck import FakeDeck
 from src.backend.DeckManagement.Subclasses.KeyImage import InputImage
 from src.backend.DeckManagement.Subclasses.KeyLabel import KeyLabel
 from src.backend.DeckManagement.Subclasses.KeyLayout import ImageLayout
+from src.backend.DeckManagement.Subclasses.KeyRenderCache import key_render_cache
 from src.backend.DeckManagement.Subclasses.KeyVideo import InputVideo
 from src.backend.DeckManagement.Subclasses.ScreenSaver import ScreenSaver
 from src.backend.DeckManagement.Subclasses.SingleKeyAsset import SingleKeyAsset
 from src.backend.DeckManagement.Subclasses.background_video_cache import BackgroundVideoCache
 from src.backend.PageManagement.Page import ActionOutdated, Page, NoActionHolderFound
 from src.backend.Utils.AtomicSaveUtils import atomic_save_json
+from src.backend.Utils.PageMediaCache import PageMediaCache
 from src.api import notify_active_page_changed
 
 process = psutil.Process()
@@ -74,6 +81,10 @@ TASK_PRIORITY_LOW = 10
 TASK_PRIORITY_NORMAL = 50
 TASK_PRIORITY_HIGH = 100
 TASK_PRIORITY_BOOST_WINDOW = 0.25
+# Share of a frame the low priority key writes of one tick may take, the rest carries over
+KEY_WRITE_FRAME_SHARE = 0.6
+# Fitted touchscreen backgrounds kept around, one strip is ~320 KB
+TOUCHSCREEN_BACKGROUND_CACHE_SIZE = 8
 
 
 def _hash_payload(data: bytes) -> bytes:
@@ -84,6 +95,34 @@ def _hash_image(image: Image.Image) -> bytes:
     return _hash_payload(image.tobytes())
 
 
+class RenderSettings:
+    """
+    App settings the render code checks for every key and frame.
+    Derived once per saved version of the settings instead of looked up every time.
+    """
+    def __init__(self, settings_manager):
+        self.settings_manager = settings_manager
+        self.update(settings_manager.get_app_settings_snapshot())
+        settings_manager.subscribe_app_settings(self.update)
+
+    def update(self, snapshot) -> None:
+        general = snapshot.get("general", {})
+        self.rolling_labels: bool = general.get("rolling-labels", True)
+        self.shrink_background_on_press: bool = general.get("shrink-background-on-press", True)
+        self.persistent_states: bool = general.get("persistent-states", False)
+        self.version: int = snapshot.version
+
+
+_render_settings: RenderSettings = None
+
+def get_render_settings() -> RenderSettings:
+    global _render_settings
+    # Headless tools create their own settings manager
+    if _render_settings is None or _render_settings.settings_manager is not gl.settings_manager:
+        _render_settings = RenderSettings(gl.settings_manager)
+    return _render_settings
+
+
 @dataclass
 class MediaPlayerTask:
     deck_controller: "DeckController"
@@ -197,7 +236,7 @@ class MediaPlayerSetTouchscreenImageTask:
         except StreamDeck.TransportError as e:
             log.error(f"Failed to set deck touchscreen image. Error: {e}")
 
-            beta_resume = gl.settings_manager.get_app_settings().get("system", {}).get("beta-resume-mode", True)
+            beta_resume = gl.settings_manager.get_app_settings_snapshot().get("system", {}).get("beta-resume-mode", True)
             if beta_resume:
                 # Transient HID failures are expected right after resume - keep the controller alive and retry
                 return
@@ -238,7 +277,7 @@ class MediaPlayerSetScreenImageTask:
         except StreamDeck.TransportError as e:
             log.error(f"Failed to set deck screen image. Error: {e}")
 
-            beta_resume = gl.settings_manager.get_app_settings().get("system", {}).get("beta-resume-mode", True)
+            beta_resume = gl.settings_manager.get_app_settings_snapshot().get("system", {}).get("beta-resume-mode", True)
             if beta_resume:
                 return
 
@@ -263,6 +302,8 @@ class MediaPlayerSetImageTask:
     native_image: bytes
     priority: int = TASK_PRIORITY_NORMAL
     image_hash: bytes = None
+    # Ticks this task was held back to stay within the write budget
+    deferred_ticks: int = 0
 
     n_failed_in_row: ClassVar[dict] = {}
 
@@ -281,7 +322,7 @@ class MediaPlayerSetImageTask:
         except StreamDeck.TransportError as e:
             log.error(f"Failed to set deck key image. Error: {e}")
 
-            beta_resume = gl.settings_manager.get_app_settings().get("system", {}).get("beta-resume-mode", True)
+            beta_resume = gl.settings_manager.get_app_settings_snapshot().get("system", {}).get("beta-resume-mode", True)
             if beta_resume:
                 return
 
@@ -300,6 +341,10 @@ class MediaPlayerSetImageTask:
 
 
 class MediaPlayerThread(threading.Thread):
+    # Schedule key of the background video, inputs are scheduled by their InputIdentifier.
+    # None because InputIdentifier refuses to be compared with anything else.
+    BACKGROUND = None
+
     def __init__(self, deck_controller: "DeckController"):
         super().__init__(name="MediaPlayerThread", daemon=True)
         self.deck_controller: DeckController = deck_controller
@@ -316,101 +361,165 @@ class MediaPlayerThread(threading.Thread):
         self.image_tasks = {}
         self.touchscreen_task = None
         self.screen_task = None
-        self._wake_event = threading.Event()
         self.touchscreen_region_tasks = {}
         self.last_key_image_hashes: dict[int, bytes] = {}
         self.last_screen_hash: bytes = None
         self.last_touchscreen_hashes: dict[tuple[int, int, int, int], bytes] = {}
         self.priority_boosts: dict[InputIdentifier, float] = {}
 
+        # Moving average of the transport time of one key write, used to size the
+        # number of low priority writes per tick
+        self.key_write_time: float = 0.0
+        self.key_writes = 0
+        self.deferred_key_writes = 0
+        # Low priority writes that didn't fit into the last frame, written once the next frame is due
+        self.deferred_image_tasks: dict[int, MediaPlayerSetImageTask] = {}
+        self._deferred_due: float = 0.0
+
+        # Animated content (GIF/video frames, scrolling labels, background video) registers
+        # the time its next frame is due. The heap may hold outdated entries, _deadlines has
+        # the one that counts for each key.
+        self._schedule: list[tuple[float, int, object]] = []
+        self._deadlines: dict[object, float] = {}
+        self._schedule_seq = itertools.count()
+        self._schedule_lock = threading.Lock()
+
+        # While a batch is open, rendered images are held back so they reach the deck together
+        self._image_batch_depth = 0
+        self._image_batch_lock = threading.Lock()
+
+        # Page switch latency: from load_page() until the images of the page were written
+        self._page_switch_start: tuple["Page", float] | None = None
+        self._page_switch_rendered = False
+        self.page_switch_latencies: deque[float] = deque(maxlen=50)
+
         self.fps: list[float] = []
         self.old_warning_state = False
 
-        self.show_fps_warnings = gl.settings_manager.get_app_settings().get("warnings", {}).get("enable-fps-warnings", True)
+        self.show_fps_warnings = gl.settings_manager.get_app_settings_snapshot().get("warnings", {}).get("enable-fps-warnings", True)
 
     # @log.catch
     def run(self):
         self.running = True
 
         while True:
-            start = time.time()
-
-            # self.check_connection()
-
-            has_bg_video = False
+            start = time.monotonic()
 
             if not self.pause:
                 # An uncaught exception here would end the thread and leave the deck
                 # frozen until the app is restarted, so one bad tick is only logged
                 # (issue #535)
                 try:
-                    if self.deck_controller.background.video is not None:
-                        if self.deck_controller.background.video.page is self.deck_controller.active_page:
-                            has_bg_video = True
-                            # There is a background video
-                            video_each_nth_frame = self.FPS // self.deck_controller.background.video.fps
-                            if self.media_ticks % video_each_nth_frame == 0:
-                                self.deck_controller.background.update_tiles()
-
-                    # Only iterate keys/dials if there is animated content to update
-                    if has_bg_video or self._needs_key_ticks():
-                        #TODO: generalize
-                        for key in self.deck_controller.inputs[Input.Key]:
-                            cast("ControllerKey", key).on_media_player_tick()
-
-                        for dial in self.deck_controller.inputs[Input.Dial]:
-                            cast("ControllerDial", dial).on_media_player_tick()
-                        # self.deck_controller.update_all_inputs()
+                    for key in self._pop_due(start):
+                        self._run_scheduled(key)
 
                     # Perform media player tasks
                     self.perform_media_player_tasks()
                 except Exception:
                     log.exception("Error in media player tick")
 
-            self.media_ticks += 1
+                self.media_ticks += 1
 
-            end = time.time()
-
-            # Use low FPS when idle (no animated content, no pending tasks)
-            has_pending = bool(self.tasks or self.image_tasks or self.touchscreen_task or self.touchscreen_region_tasks or self.screen_task)
-            if has_pending or has_bg_video or getattr(self, '_cached_needs_ticks', False):
-                target_fps = self.FPS
+                end = time.monotonic()
+                self.append_fps(1 / max(end - start, 1e-6))
+                self.update_low_fps_warning()
             else:
-                target_fps = 2  # Idle: just check for new tasks occasionally
-
-            self.append_fps(1 / (end - start))
-            self.update_low_fps_warning()
-            wait = max(0, 1/target_fps - (end - start))
-            if target_fps < self.FPS:
-                self._wake_event.wait(wait)
-                self._wake_event.clear()
-            else:
-                time.sleep(wait)
+                self.media_ticks += 1
 
             if self._stop_requested:
                 break
 
-        self.running = False
+            # Sleep until the next frame is due or a new task comes in - with nothing
+            # animated and nothing queued that is until the next task
+            self._wake_event.wait(self._get_wait_time())
+            self._wake_event.clear()
 
-    def _needs_key_ticks(self) -> bool:
-        # Check once per second whether any key/dial has animated content
-        # (video or scrolling text) that on_media_player_tick needs to advance.
-        if self.media_ticks % self.FPS != 0:
-            return getattr(self, '_cached_needs_ticks', False)
-        needs = False
-        for key in self.deck_controller.inputs.get(Input.Key, []):
-            state = key.get_active_state()
-            if state.key_video is not None or state.label_manager.get_has_scroll_labels():
-                needs = True
+            if self._stop_requested:
                 break
-        if not needs:
-            for dial in self.deck_controller.inputs.get(Input.Dial, []):
-                state = dial.get_active_state()
-                if state.video is not None or state.label_manager.get_has_scroll_labels():
-                    needs = True
-                    break
-        self._cached_needs_ticks = needs
-        return needs
+
+        self.running = False
+
+    def _get_wait_time(self) -> float | None:
+        if self.pause:
+            # Nothing is taken off the schedule while paused, so just check back shortly
+            return 1 / self.FPS
+        if self.tasks:
+            return 0
+        if self._image_batch_depth == 0 and (self.image_tasks or self.touchscreen_task or self.touchscreen_region_tasks or self.screen_task):
+            return 0
+
+        due = self._deferred_due if self.deferred_image_tasks else None
+        with self._schedule_lock:
+            if self._schedule and (due is None or self._schedule[0][0] < due):
+                due = self._schedule[0][0]
+        if due is None:
+            return None
+        return max(0, due - time.monotonic())
+
+    def schedule(self, key, delay: float) -> None:
+        """
+        Run the media tick of `key` in `delay` seconds. An earlier deadline that is
+        already registered for the key is kept.
+        """
+        due = time.monotonic() + max(delay, 1 / self.FPS)
+        with self._schedule_lock:
+            current = self._deadlines.get(key)
+            if current is not None and current <= due:
+                return
+            self._deadlines[key] = due
+            heapq.heappush(self._schedule, (due, next(self._schedule_seq), key))
+            is_earliest = self._schedule[0][2] is key
+        if is_earliest:
+            self._wake_event.set()
+
+    def unschedule(self, key) -> None:
+        with self._schedule_lock:
+            self._deadlines.pop(key, None)
+
+    def schedule_input(self, controller_input: "ControllerInput") -> None:
+        delay = controller_input.get_media_tick_delay()
+        if delay is None:
+            self.unschedule(controller_input.identifier)
+        else:
+            self.schedule(controller_input.identifier, delay)
+
+    def schedule_background(self) -> None:
+        video = self.deck_controller.background.video
+        if video is None or video.page is not self.deck_controller.active_page:
+            self.unschedule(self.BACKGROUND)
+            return
+        self.schedule(self.BACKGROUND, 1 / max(video.fps, 1))
+
+    def _pop_due(self, now: float) -> list:
+        due_keys = []
+        with self._schedule_lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                due, _, key = heapq.heappop(self._schedule)
+                # Skip entries that were replaced by an earlier deadline or unscheduled
+                if self._deadlines.get(key) != due:
+                    continue
+                del self._deadlines[key]
+                due_keys.append(key)
+        return due_keys
+
+    def _run_scheduled(self, key) -> None:
+        if key is self.BACKGROUND:
+            background = self.deck_controller.background
+            if background.video is None or background.video.page is not self.deck_controller.active_page:
+                return
+            background.update_tiles()
+            # Keys with their own video are re-rendered on their own schedule
+            for controller_key in self.deck_controller.inputs[Input.Key]:
+                if controller_key.get_active_state().key_video is None:
+                    controller_key.update(priority=TASK_PRIORITY_LOW)
+            self.schedule_background()
+            return
+
+        controller_input = self.deck_controller.get_input(key)
+        if controller_input is None:
+            return
+        controller_input.on_media_player_tick()
+        self.schedule_input(controller_input)
 
     def append_fps(self, fps: float) -> None:
         self.fps.append(fps)
@@ -471,6 +580,53 @@ class MediaPlayerThread(threading.Thread):
 
         return max(priority, TASK_PRIORITY_HIGH)
 
+    @contextmanager
+    def image_batch(self):
+        """
+        Hold back the images added while this is open, they are written to the deck
+        together once the outermost batch is closed.
+        """
+        with self._image_batch_lock:
+            self._image_batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._image_batch_lock:
+                self._image_batch_depth -= 1
+            self._wake_event.set()
+
+    def start_page_switch_timer(self, page: "Page") -> None:
+        self._page_switch_start = (page, time.perf_counter())
+        self._page_switch_rendered = False
+
+    def mark_page_rendered(self, page: "Page") -> None:
+        if self._page_switch_start is not None and self._page_switch_start[0] is page:
+            self._page_switch_rendered = True
+
+    def _finish_page_switch_timer(self) -> None:
+        if not self._page_switch_rendered or self._page_switch_start is None:
+            return
+        page, start = self._page_switch_start
+        self._page_switch_start = None
+        self._page_switch_rendered = False
+        if page is not self.deck_controller.active_page:
+            return
+
+        latency = time.perf_counter() - start
+        self.page_switch_latencies.append(latency)
+        log.info(f"[page-switch-latency] deck={self.deck_controller.safe_serial_number()} page={page.get_name()} ms={latency * 1000:.1f}")
+
+    def get_page_switch_latency_stats(self) -> dict:
+        latencies = list(self.page_switch_latencies)
+        if not latencies:
+            return {"count": 0}
+        return {
+            "count": len(latencies),
+            "last_ms": latencies[-1] * 1000,
+            "median_ms": statistics.median(latencies) * 1000,
+            "max_ms": max(latencies) * 1000,
+        }
+
     def add_task(self, method: callable, *args, task_label: str = "", **kwargs):
         self.tasks.append(MediaPlayerTask(
             deck_controller=self.deck_controller,
@@ -557,7 +713,7 @@ class MediaPlayerThread(threading.Thread):
         if existing is not None:
             existing.close()
 
-        self.image_tasks[key_index] = MediaPlayerSetImageTask(
+        task = MediaPlayerSetImageTask(
             deck_controller=self.deck_controller,
             page=self.deck_controller.active_page,
             key_index=key_index,
@@ -565,6 +721,13 @@ class MediaPlayerThread(threading.Thread):
             priority=priority,
             image_hash=image_hash,
         )
+        # Replaces a held back write of the key, but keeps its place in the line
+        deferred = self.deferred_image_tasks.pop(key_index, None)
+        if deferred is not None:
+            task.deferred_ticks = deferred.deferred_ticks
+            deferred.close()
+
+        self.image_tasks[key_index] = task
         self._wake_event.set()
 
     def add_screen_task(self, native_image: bytes):
@@ -616,8 +779,12 @@ class MediaPlayerThread(threading.Thread):
             except ValueError:
                 pass
 
+        if self._image_batch_depth > 0:
+            # Written once the batch is closed
+            return
+
         key_tasks: list[MediaPlayerSetImageTask] = []
-        for key in list(self.image_tasks.keys()):
+        for key in self._pop_key_tasks():
             try:
                 task = self.image_tasks.pop(key)
             except KeyError:
@@ -671,11 +838,15 @@ class MediaPlayerThread(threading.Thread):
             screen_task.close()
             screen_task = None
 
+        key_tasks = self._limit_key_writes(key_tasks)
+
         has_hardware_updates = any([key_tasks, full_touchscreen_task, valid_region_tasks, screen_task])
         if has_hardware_updates:
             with self.deck_controller.deck:
-                for task in sorted(key_tasks, key=lambda t: (-t.priority, t.key_index)):
+                for task in key_tasks:
+                    write_start = time.perf_counter()
                     task.run()
+                    self._record_key_write_time(time.perf_counter() - write_start)
                     self.last_key_image_hashes[task.key_index] = task.image_hash
 
                 if full_touchscreen_task is not None:
@@ -691,6 +862,67 @@ class MediaPlayerThread(threading.Thread):
                     screen_task.run()
                     self.last_screen_hash = screen_task.image_hash
 
+        self._finish_page_switch_timer()
+
+    def _pop_key_tasks(self) -> list[int]:
+        """
+        The keys with a write in image_tasks. Held back writes are moved back in once
+        their frame is due, until then they don't keep the loop busy.
+        """
+        if self.deferred_image_tasks and time.monotonic() >= self._deferred_due:
+            for key in list(self.deferred_image_tasks.keys()):
+                task = self.deferred_image_tasks.pop(key, None)
+                if task is None:
+                    continue
+                # A newer image for the key may have come in meanwhile
+                if self.image_tasks.setdefault(key, task) is not task:
+                    task.close()
+        return list(self.image_tasks.keys())
+
+    def _limit_key_writes(self, key_tasks: list[MediaPlayerSetImageTask]) -> list[MediaPlayerSetImageTask]:
+        """
+        Orders the key writes of this tick and holds back the low priority ones that
+        don't fit into the frame, so a pressed key doesn't wait behind a background
+        video that changed every key. Held back keys wait for the next frame and go
+        first among the low ones then.
+        """
+        key_tasks.sort(key=lambda t: (-t.priority, -t.deferred_ticks, t.key_index))
+
+        low_start = next((i for i, t in enumerate(key_tasks) if t.priority <= TASK_PRIORITY_LOW), len(key_tasks))
+        if low_start == len(key_tasks) or self.key_write_time <= 0:
+            return key_tasks
+
+        budget = KEY_WRITE_FRAME_SHARE / self.FPS - low_start * self.key_write_time
+        n_low = max(1, int(budget / self.key_write_time))
+        n_write = low_start + n_low
+        if n_write >= len(key_tasks):
+            return key_tasks
+
+        for task in key_tasks[n_write:]:
+            task.deferred_ticks += 1
+            # A newer image for the key may have come in meanwhile
+            if task.key_index in self.image_tasks:
+                task.close()
+                continue
+            self.deferred_image_tasks[task.key_index] = task
+        self._deferred_due = time.monotonic() + 1 / self.FPS
+        self.deferred_key_writes += len(key_tasks) - n_write
+        return key_tasks[:n_write]
+
+    def _record_key_write_time(self, duration: float) -> None:
+        if self.key_writes == 0:
+            self.key_write_time = duration
+        else:
+            self.key_write_time += (duration - self.key_write_time) * 0.1
+        self.key_writes += 1
+
+    def get_key_write_stats(self) -> dict:
+        return {
+            "writes": self.key_writes,
+            "avg_write_ms": self.key_write_time * 1000,
+            "deferred": self.deferred_key_writes,
+        }
+
     def check_connection(self):
         try:
             self.deck_controller.deck.get_firmware_version()
@@ -707,18 +939,20 @@ class MediaPlayerThread(threading.Thread):
                 gl.deck_manager.connect_new_decks()
 
 
-@lru_cache(maxsize=64)
-def _decode_page_media_cached(path: str, mtime: float, is_svg_media: bool) -> Image.Image:
-    # Keyed on (path, mtime) so re-visiting a page doesn't re-decode/re-rasterize
-    # media from disk every time. GIFs/videos aren't cached here since they animate.
-    if is_svg_media:
-        return svg_to_pil(path, 192)
+def _decode_page_media(path: str) -> Image.Image:
     with Image.open(path) as im:
         return im.copy()
 
 
+# Shared with the page prefetching, which drops what it decoded once its pages are evicted
+page_media_cache = PageMediaCache(max_entries=64)
+
+
 def get_page_media_image(path: str, is_svg_media: bool) -> Image.Image:
     # Returns a fresh copy each time, since callers may mutate/close it.
+    if is_svg_media:
+        # svg_to_pil has its own cache, shared with everything else that rasterizes svgs
+        return svg_to_pil(path, 192)
     try:
         mtime = os.path.getmtime(path)
     except OSError:
@@ -726,7 +960,20 @@ def get_page_media_image(path: str, is_svg_media: bool) -> Image.Image:
             return svg_to_pil(path, 192)
         with Image.open(path) as im:
             return im.copy()
-    return _decode_page_media_cached(path, mtime, is_svg_media).copy()
+    return page_media_cache.get(path, mtime, is_svg_media, lambda: _decode_page_media(path)).copy()
+
+
+def is_page_media_cached(path: str, is_svg_media: bool) -> bool:
+    if is_svg_media:
+        return svg_raster_cache.contains(path)
+    return page_media_cache.contains(path)
+
+
+def discard_page_media(path: str, is_svg_media: bool) -> int:
+    """Drops the decoded media from memory, returns the bytes freed"""
+    if is_svg_media:
+        return svg_raster_cache.discard(path)
+    return page_media_cache.discard(path)
 
 
 class DeckController:
@@ -761,7 +1008,7 @@ class DeckController:
             del self
             return
         
-        self.hold_time: float = gl.settings_manager.get_app_settings().get("general", {}).get("hold-time", 0.5)
+        self.hold_time: float = gl.settings_manager.get_app_settings_snapshot().get("general", {}).get("hold-time", 0.5)
         
         self.own_deck_stack_child: "DeckStackChild" = None
         self.own_key_grid: "KeyGridChild" = None
@@ -804,6 +1051,8 @@ class DeckController:
         self.media_player = MediaPlayerThread(deck_controller=self)
         self.media_player.start()
         self.input_load_executor = ThreadPoolExecutor(max_workers=max(2, min(8, os.cpu_count() or 4)))
+        # Ticks and event callbacks of the actions on this deck
+        self.action_workers = ActionWorkerPool(name=f"actions-{self.safe_serial_number()}")
 
         self.keep_actions_ticking = True
         self.TICK_DELAY = 1
@@ -830,7 +1079,7 @@ class DeckController:
         self.load_sticky_page()
 
         # If screen is locked start the screensaver - this happens when the deck gets reconnected during the screensaver
-        if gl.screen_locked and gl.settings_manager.get_app_settings().get("system", {}).get("lock-on-lock-screen", True):
+        if gl.screen_locked and gl.settings_manager.get_app_settings_snapshot().get("system", {}).get("lock-on-lock-screen", True):
             self.allow_interaction = False
             self.screen_saver.show()
         else:
@@ -925,9 +1174,11 @@ class DeckController:
             for i in self.inputs[Input.Dial]:
                 i.update()
             return
-        for t in self.inputs:
-            for i in self.inputs[t]:
-                i.update()
+        with self.media_player.image_batch():
+            for t in self.inputs:
+                for i in self.inputs[t]:
+                    i.update()
+        self.media_player.mark_page_rendered(self.active_page)
         log.debug(f"Updating all inputs took {time.time() - start} seconds")
 
     def event_callback(self, ident: InputIdentifier, *args, **kwargs):
@@ -1361,6 +1612,7 @@ class DeckController:
             return
 
         log.info(f"Loading page {page.get_name()} on deck {self.safe_serial_number()}")
+        self.media_player.start_page_switch_timer(page)
 
         # Stop queued tasks. Also waits out any in-flight media tick, so we don't
         # need a second wait here anymore.
@@ -1409,6 +1661,9 @@ class DeckController:
         # Notify DBus API of the page change
         notify_active_page_changed(self.serial_number(), page.get_name())
 
+        # Get the pages that are likely to come next ready in the background
+        gl.page_manager.prefetch_reachable_pages(self)
+
         total_ms = (time.time() - start) * 1000
         log.info(f"Loaded page {page.get_name()} on deck {self.safe_serial_number()}")
         log.info(f"[page-switch] deck={self.safe_serial_number()} page={page.get_name()} total_ms={total_ms:.1f}")
@@ -1502,6 +1757,9 @@ class DeckController:
         for t in self.inputs:
             for i in self.inputs[t]:
                 i._last_img_hash = None
+                if isinstance(i, ControllerKey):
+                    # Otherwise update() skips the key as already shown
+                    i._last_render_key = None
 
         self.media_player.last_key_image_hashes.clear()
         self.media_player.last_touchscreen_hashes.clear()
@@ -1573,9 +1831,10 @@ class DeckController:
             self.active_page.ready_to_clear = ready_to_clear
     
     def get_deck_settings(self):
+        """Read-only, use gl.settings_manager.get_deck_settings() to modify them"""
         if not self.get_alive():
             return {}
-        return gl.settings_manager.get_deck_settings(self.deck.get_serial_number())
+        return gl.settings_manager.get_deck_settings_snapshot(self.deck.get_serial_number())
 
     # -------------- #
     # Sticky actions #
@@ -1760,6 +2019,7 @@ class DeckController:
         ticks = self.media_player.media_ticks
         self.media_player.tasks.clear()
         self.media_player.image_tasks.clear()
+        self.media_player.deferred_image_tasks.clear()
         self.media_player.screen_task = None
 
         # Wake it up instead of waiting for its idle cycle to come around on its own
@@ -1821,6 +2081,8 @@ class DeckController:
             self.media_player.stop()
         if hasattr(self, "input_load_executor"):
             self.input_load_executor.shutdown(wait=False, cancel_futures=True)
+        if hasattr(self, "action_workers"):
+            self.action_workers.shutdown()
         if hasattr(self, "background_rotation"):
             self.background_rotation.stop()
         if hasattr(self, "background"):
@@ -1834,6 +2096,30 @@ class DeckController:
         self.keep_actions_ticking = False
         self.stop_reader()
 
+    def get_action_worker_stats(self) -> dict:
+        """
+        Queue depth, skipped ticks and per-action tick times of this deck's action workers.
+        """
+        return self.action_workers.get_stats()
+
+    def get_render_cache_stats(self) -> dict:
+        """
+        Hits, misses and skipped renders of the key render cache shared by all decks.
+        """
+        return key_render_cache.get_stats()
+
+    def get_page_switch_latency_stats(self) -> dict:
+        """
+        Time from load_page() until the whole page was written to the deck, over the last page switches.
+        """
+        return self.media_player.get_page_switch_latency_stats()
+
+    def get_key_write_stats(self) -> dict:
+        """
+        Number of key writes, their average transport time and how many were held back to the next tick.
+        """
+        return self.media_player.get_key_write_stats()
+
     def get_alive(self) -> bool:
         try:
             return self.deck.is_open()
@@ -1916,6 +2202,9 @@ class BackgroundRotation:
 
 
 class Background:
+    # Unique across all decks, the tiles are part of the cached key renders
+    _tiles_versions = itertools.count()
+
     def __init__(self, deck_controller: DeckController):
         self.deck_controller = deck_controller
 
@@ -1924,6 +2213,7 @@ class Background:
         self.standby_video: "BackgroundVideo | None" = None
 
         self.tiles: list[Image.Image] = [None] * deck_controller.deck.key_count()
+        self.tiles_version: int = next(self._tiles_versions)
 
     def _park_video(self, video: "BackgroundVideo | None") -> None:
         if video is None:
@@ -1957,6 +2247,7 @@ class Background:
         gc.collect()
 
         self.update_tiles()
+        self.deck_controller.media_player.schedule_background()
         if update:
             self.deck_controller.update_all_inputs()
 
@@ -1976,6 +2267,7 @@ class Background:
                     self.video.page = self.deck_controller.active_page
                     self.video.fps = fps
                     self.video.loop = loop
+                    self.deck_controller.media_player.schedule_background()
                     return
                 if self.video is None and self.standby_video is not None and self.standby_video.video_path == path:
                     self.standby_video.page = self.deck_controller.active_page
@@ -2000,6 +2292,7 @@ class Background:
             self.tiles = self.video.get_next_tiles()
         else:
             self.tiles = [self.deck_controller.generate_alpha_key() for _ in range(self.deck_controller.deck.key_count())]
+        self.tiles_version = next(self._tiles_versions)
 
         for tile in old_tiles:
             if tile is not None:
@@ -2454,7 +2747,7 @@ class LabelManager:
                 x_position = image.width / 2
                 anchor_x = "m"
 
-            rolling_labels_enabled = gl.settings_manager.get_app_settings().get("general", {}).get("rolling-labels", True)
+            rolling_labels_enabled = get_render_settings().rolling_labels
             if rolling_labels_enabled and image.width < w:
                 # Need to scroll - always use center anchor for scrolling
                 start = image.width / 2 - (image.width - w) / 2 + 10
@@ -2762,12 +3055,15 @@ class ControllerInputState:
 
     @log.catch
     def own_actions_tick(self) -> None:
+        action_workers = self.deck_controller.action_workers
         for action in self.get_own_actions():
             if not isinstance(action, ActionCore):
                 continue
             if not action.on_ready_called:
                 continue
+            start = time.perf_counter()
             action.on_tick()
+            action_workers.record_tick_time(action.action_id, time.perf_counter() - start)
 
     @log.catch
     def own_actions_event_callback(self, event: InputEvent, data: dict = None, show_notifications: bool = False) -> None:
@@ -2795,17 +3091,24 @@ class ControllerInputState:
 
             action._raw_event_callback(event, data)
 
+    # The *_threaded variants run on the deck's ActionWorkerPool. Calls for the same input
+    # never overlap: events run in order on their own lane and a tick is skipped while the
+    # previous one is still running, so a stalled plugin can't pile up threads.
+
     def own_actions_ready_threaded(self) -> None:
-        threading.Thread(target=self.own_actions_ready, name="own_actions_ready").start()
+        self.deck_controller.action_workers.submit(self.controller_input.identifier, self.own_actions_ready, lane=LANE_EVENT)
 
     def own_actions_update_threaded(self) -> None:
-        threading.Thread(target=self.own_actions_update, name="own_actions_update").start()
+        self.deck_controller.action_workers.submit(self.controller_input.identifier, self.own_actions_update, lane=LANE_EVENT)
 
     def own_actions_tick_threaded(self) -> None:
-        threading.Thread(target=self.own_actions_tick, name="own_actions_tick").start()
+        self.deck_controller.action_workers.submit_tick(self.controller_input.identifier, self.own_actions_tick)
 
     def own_actions_event_callback_threaded(self, event: InputEvent, data: dict = None, show_notifications: bool = False) -> None:
-        threading.Thread(target=self.own_actions_event_callback, args=(event, data, show_notifications), name="own_actions_event_callback").start()
+        self.deck_controller.action_workers.submit(
+            self.controller_input.identifier, self.own_actions_event_callback, event, data, show_notifications,
+            lane=LANE_EVENT,
+        )
 
     def remove_media(self) -> None:
         page = self.controller_input.deck_controller.get_page_for_input(self.controller_input.identifier)
@@ -2861,6 +3164,33 @@ class ControllerInput:
     def update(self) -> None:
         pass
 
+    def on_media_player_tick(self) -> None:
+        pass
+
+    def get_media_tick_delay(self) -> float | None:
+        """
+        Seconds until this input has to be rendered again for its animated content,
+        None if nothing on it is animated.
+        """
+        return None
+
+    def _get_media_tick_delay(self, video) -> float | None:
+        delays = []
+        if video is not None:
+            frame_delay = video.get_frame_delay()
+            if frame_delay is not None:
+                delays.append(frame_delay)
+        if self.get_active_state().label_manager.get_has_scroll_labels():
+            # Scrolling labels advance one step every other frame
+            delays.append(1 / self.deck_controller.media_player.FPS)
+        return min(delays, default=None)
+
+    def schedule_media_tick(self) -> None:
+        # Inputs are created and rendered before the media player exists
+        media_player = getattr(self.deck_controller, "media_player", None)
+        if media_player is not None:
+            media_player.schedule_input(self)
+
     def _flush_suppressed_render(self) -> None:
         """Replay an update that got dropped while renders were suppressed."""
         if not self._render_pending:
@@ -3021,7 +3351,7 @@ class ControllerInput:
             return False
         if gl.settings_manager is None:
             return False
-        return gl.settings_manager.get_app_settings().get("general", {}).get("persistent-states", False)
+        return get_render_settings().persistent_states
 
     def get_state_to_load(self, input_dict: dict) -> int | None:
         """
@@ -3134,9 +3464,9 @@ class ControllerKey(ControllerInput):
         self.press_state: bool = self.deck_controller.deck.key_states()[self.index]
 
         self.down_start_time: float = None
-         
-        # GIF timing tracking
-        self.last_gif_update_time: float = 0
+
+        # Key of the render this key shows right now, see get_render_key()
+        self._last_render_key: tuple = None
 
     def on_hold_timer_end(self):
         state = self.get_active_state()
@@ -3175,10 +3505,52 @@ class ControllerKey(ControllerInput):
         with self._render_lock:
             self._render_pending = False
 
+            plain_video = self.get_plain_video_signature()
+            if plain_video is not None and self.get_ui_is_hidden():
+                # Nothing is drawn over the video and no UI image is needed, so the
+                # payload of this frame can go to the deck as it was encoded last time
+                key_video, signature = plain_video
+                # Not decoded here, on a miss get_current_image() picks up this frame
+                frame_index = key_video.advance_frame()
+                native_image = key_video.video_cache.get_native_frame(signature, frame_index)
+                if native_image is not None:
+                    self._last_img_hash = None
+                    self._last_render_key = None
+                    self.deck_controller.media_player.add_image_task(
+                        self.index,
+                        native_image,
+                        priority=priority,
+                        identifier=self.identifier,
+                    )
+                    self.schedule_media_tick()
+                    return
+
+            self.schedule_media_tick()
+
+            render_key = self.get_render_key()
+            if render_key is not None:
+                if not force and render_key == self._last_render_key:
+                    key_render_cache.count_skipped()
+                    return
+
+                cached = key_render_cache.get(render_key)
+                if cached is not None:
+                    self._last_img_hash = None
+                    self._last_render_key = render_key
+                    self.deck_controller.media_player.add_image_task(
+                        self.index,
+                        cached.native_image,
+                        priority=priority,
+                        identifier=self.identifier,
+                    )
+                    self.set_ui_key_image(cached.image)
+                    return
+
             image = self.get_current_image()
 
             # Quick hash check - skip expensive conversion if image unchanged
             img_hash = hash(image.tobytes())
+            self._last_render_key = render_key
             if not force and img_hash == getattr(self, '_last_img_hash', None):
                 image.close()
                 return
@@ -3195,6 +3567,11 @@ class ControllerKey(ControllerInput):
             if self.deck_controller.is_visual():
                 native_image = PILHelper.to_native_key_format(self.deck_controller.deck, rgb_image)
                 rgb_image.close()
+                if plain_video is not None:
+                    key_video, signature = plain_video
+                    key_video.video_cache.set_native_frame(signature, key_video.active_frame, native_image)
+                if render_key is not None:
+                    key_render_cache.put(render_key, image, native_image)
                 self.deck_controller.media_player.add_image_task(
                     self.index,
                     native_image,
@@ -3206,37 +3583,105 @@ class ControllerKey(ControllerInput):
 
         self.set_ui_key_image(image)
 
+    def get_plain_video_signature(self) -> tuple["InputVideo", tuple] | None:
+        """
+        If the video is the only content of this key - no labels, not pressed, no overlay
+        and no background behind it - returns the video and everything else the encoded
+        frame depends on. None otherwise.
+        """
+        if not self.deck_controller.is_visual():
+            return None
+        state = self.get_active_state()
+        key_video = state.key_video
+        if not isinstance(key_video, InputVideo):
+            return None
+        if self.is_pressed() or state._overlay:
+            return None
+
+        background_color = state.background_manager.get_composed_color()
+        background = self.deck_controller.background
+        if background_color[-1] < 255 and (background.image is not None or background.video is not None):
+            return None
+
+        for label in state.label_manager.get_composed_labels().values():
+            if label.text not in [None, ""]:
+                return None
+        if self.has_unavailable_action():
+            return None
+
+        layout = state.layout_manager.get_composed_layout()
+        signature = (
+            self.deck_controller.deck.deck_type(),
+            self.deck_controller.deck.get_rotation(),
+            (layout.valign, layout.halign, layout.fill_mode, layout.size),
+            tuple(background_color),
+        )
+        return key_video, signature
+
+    def get_render_key(self) -> tuple | None:
+        """
+        Everything get_current_image() and the encoding depend on, None if the render
+        can't be cached because it changes on its own (videos, scrolling labels, overlays).
+        """
+        if not self.deck_controller.is_visual():
+            return None
+        state = self.get_active_state()
+        if state.key_video is not None or state._overlay is not None:
+            return None
+        if state.label_manager.get_has_scroll_labels():
+            return None
+
+        background_color = tuple(state.background_manager.get_composed_color())
+        background_key = None
+        if background_color[-1] < 255:
+            background = self.deck_controller.background
+            if background.video is not None:
+                return None
+            if background.image is not None:
+                background_key = (background.tiles_version, self.index)
+
+        media_key = None
+        if state.key_image is not None:
+            if state.key_image.get_raw_image() is None:
+                return None
+            layout = state.layout_manager.get_composed_layout()
+            media_key = (state.key_image.get_content_hash(), layout.valign, layout.halign, layout.fill_mode, layout.size)
+
+        labels = tuple(
+            (position, label.text, label.font_size, label.font_name, tuple(label.color), label.font_weight,
+             label.style, label.outline_width, tuple(label.outline_color), label.alignment)
+            for position, label in state.label_manager.get_composed_labels().items()
+            if label.text not in [None, ""]
+        )
+
+        pressed = self.is_pressed()
+        shrink_background = pressed and get_render_settings().shrink_background_on_press
+        warning = self.has_unavailable_action() and not self.deck_controller.screen_saver.showing
+
+        deck = self.deck_controller.deck
+        return (
+            deck.deck_type(), deck.get_rotation(), tuple(self.deck_controller.get_key_image_size()),
+            background_color, background_key, media_key, labels,
+            pressed, shrink_background, warning,
+        )
+
+    def get_ui_is_hidden(self) -> bool:
+        key_grid = self.deck_controller.get_own_key_grid()
+        if key_grid is None or not recursive_hasattr(gl, "app.main_win.get_mapped") or not gl.app.main_win.get_mapped():
+            return True
+        # Another deck is shown in the stack
+        return not key_grid.get_mapped()
+
     def get_active_state(self) -> "ControllerKeyState":
         return super().get_active_state()
 
     def on_media_player_tick(self) -> None:
+        # Only called once the next frame is due, see get_media_tick_delay()
         self.media_ticks += 1
-        current_time = time.time()
-
-        state = self.get_active_state()
-        needs_update = False
-        
-        # Check if we need to update based on content type
-        if state.key_video is not None:
-            if isinstance(state.key_video, KeyGIF):
-                # Use GIF frame delay timing
-                if self.last_gif_update_time == 0:
-                    self.last_gif_update_time = current_time
-                    needs_update = True
-                else:
-                    frame_delay = state.key_video.get_frame_delay()
-                    if current_time - self.last_gif_update_time >= frame_delay:
-                        self.last_gif_update_time = current_time
-                        needs_update = True
-            else:
-                # For non-GIF videos, use the original FPS-based logic
-                needs_update = True
-        elif self.deck_controller.background.video is not None or state.label_manager.get_has_scroll_labels():
-            # Other content types
-            needs_update = True
+        self.update(priority=TASK_PRIORITY_LOW)
 
-        if needs_update:
-            self.update(priority=TASK_PRIORITY_LOW)
+    def get_media_tick_delay(self) -> float | None:
+        return self._get_media_tick_delay(self.get_active_state().key_video)
 
     def event_callback(self, press_state):
         screensaver_was_showing = self.deck_controller.screen_saver.showing
@@ -3316,7 +3761,7 @@ class ControllerKey(ControllerInput):
         # are composed onto a transparent canvas instead, so that only that layer gets
         # shrunk and can be pasted back onto the untouched background
         compose_base = background
-        if self.is_pressed() and not gl.settings_manager.get_app_settings().get("general", {}).get("shrink-background-on-press", True):
+        if self.is_pressed() and not get_render_settings().shrink_background_on_press:
             compose_base = Image.new("RGBA", background.size, (0, 0, 0, 0))
 
         key_image: Image.Image = None
@@ -3540,12 +3985,12 @@ class ControllerKey(ControllerInput):
         
         x, y = ControllerKey.Index_To_Coords(self.deck_controller.deck, self.index)
 
-        if self.deck_controller.get_own_key_grid() is None or not recursive_hasattr(gl, "app.main_win.get_mapped") or not gl.app.main_win.get_mapped():
+        if self.get_ui_is_hidden():
             # Save to use later
             self.deck_controller.ui_image_changes_while_hidden[self.identifier] = image # The ui key coords are in reverse order
         else:
             try:
-                GLib.idle_add(self.deck_controller.get_own_key_grid().buttons[x][y].set_image, image)
+                self.deck_controller.get_own_key_grid().queue_key_image(x, y, image)
             except:
                 print(f"Failed to set ui key image for {self.identifier}")
         
@@ -3931,19 +4376,18 @@ class ControllerDial(ControllerInput):
     def update(self, priority: int = TASK_PRIORITY_NORMAL):
         if self.deck_controller.deck.is_touch():
             self.get_touch_screen().update_dial_region(self.identifier, priority=priority)
+        self.schedule_media_tick()
 
     def get_active_state(self) -> "ControllerDialState":
         return super().get_active_state()
 
     def on_media_player_tick(self) -> None:
         self.media_ticks += 1
-
-        state = self.get_active_state()
-        if not any([state.video, state.label_manager.get_has_scroll_labels()]):
-            return
-
         self.update(priority=TASK_PRIORITY_LOW)
 
+    def get_media_tick_delay(self) -> float | None:
+        return self._get_media_tick_delay(self.get_active_state().video)
+
     def get_image_size(self) -> tuple[int, int]:
         if self.deck_controller.deck.is_touch():
             return self.get_touch_screen().get_dial_image_area_size()
@@ -3951,6 +4395,10 @@ class ControllerDial(ControllerInput):
     
 
 class ControllerTouchScreenState(ControllerInputState):
+    # Background layers by get_background_key(), shared by all strips
+    background_cache: ClassVar[OrderedDict] = OrderedDict()
+    background_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, controller_touch: "ControllerTouchScreen", state: int):
         super().__init__(controller_touch, state)
 
@@ -3958,23 +4406,63 @@ class ControllerTouchScreenState(ControllerInputState):
         self.base_image: Image.Image = None
         self.current_image: Image.Image = None
 
+        # What base_image and the dial slots of current_image were composed from
+        self.background_key: tuple = None
+        self.dial_render_keys: dict[int, tuple] = {}
+
     def set_current_image(self, image: Image.Image):
         if self.current_image is not None:
             self.current_image.close()
         self.current_image = image
+        # Nothing composed on top of it yet
+        self.background_key = None
 
         self.update()
 
-    def _build_background_image(self) -> Image.Image:
-        screen_width, screen_height = self.controller_touch.get_screen_dimensions()
-        
-        # Start with background image if set
-        background: Image.Image = None
+    def get_background_key(self) -> tuple:
+        """Everything _build_background_image() depends on"""
         active_page = self.controller_touch.deck_controller.active_page
         background_image_path = active_page.get_background_image(
-            identifier=self.controller_touch.identifier, 
+            identifier=self.controller_touch.identifier,
             state=self.state
         )
+
+        mtime = None
+        if background_image_path:
+            try:
+                mtime = os.stat(background_image_path).st_mtime_ns
+            except OSError:
+                background_image_path = None
+
+        return (
+            background_image_path, mtime,
+            tuple(self.background_manager.get_composed_color()),
+            self.controller_touch.deck_controller.deck.get_rotation(),
+            tuple(self.controller_touch.get_screen_dimensions()),
+        )
+
+    def get_background_layer(self, background_key: tuple) -> Image.Image:
+        """The background for the key, only built from disk the first time. Callers get a copy."""
+        cache = ControllerTouchScreenState.background_cache
+        with ControllerTouchScreenState.background_cache_lock:
+            background = cache.get(background_key)
+            if background is not None:
+                cache.move_to_end(background_key)
+                return background.copy()
+
+        background = self._build_background_image(background_image_path=background_key[0])
+
+        with ControllerTouchScreenState.background_cache_lock:
+            cache[background_key] = background
+            while len(cache) > TOUCHSCREEN_BACKGROUND_CACHE_SIZE:
+                cache.popitem(last=False)[1].close()
+            return background.copy()
+
+    def _build_background_image(self, background_image_path: str = None) -> Image.Image:
+        screen_width, screen_height = self.controller_touch.get_screen_dimensions()
+        
+        # Start with background image if set
+        background: Image.Image = None
         
         if background_image_path and os.path.isfile(background_image_path):
             try:
@@ -4018,23 +4506,44 @@ class ControllerTouchScreenState(ControllerInputState):
         return background
 
     def rebuild_cached_image(self) -> None:
-        background = self._build_background_image()
+        """
+        Brings current_image up to date. The whole strip is only rebuilt if the background
+        changed, otherwise just the dial slots whose content changed get composed again.
+        """
+        background_key = self.get_background_key()
 
-        if self.base_image is not None:
-            self.base_image.close()
-        self.base_image = background
+        if self.base_image is None or self.current_image is None or background_key != self.background_key:
+            if self.base_image is not None:
+                self.base_image.close()
+            self.base_image = self.get_background_layer(background_key)
+            self.background_key = background_key
 
-        if self.current_image is not None:
-            self.current_image.close()
-        self.current_image = background.copy()
+            if self.current_image is not None:
+                self.current_image.close()
+            self.current_image = self.base_image.copy()
+            self.dial_render_keys.clear()
 
-        # Paste dial images on top of the background
         for dial in self.controller_touch.deck_controller.inputs[Input.Dial]:
-            state = dial.get_active_state()
-            image_area = self.controller_touch.get_dial_image_area(dial.identifier)
-            dial_image = state.get_rendered_touch_image()
+            self.compose_dial(dial)
+
+    def compose_dial(self, dial: "ControllerDial", force: bool = False) -> tuple[tuple[int, int, int, int], Image.Image] | None:
+        """Renders the dial into its slot, skipped if it would draw the same as last time"""
+        dial_state = dial.get_active_state()
+        render_key = dial_state.get_touch_render_key()
+        if not force and render_key is not None and self.dial_render_keys.get(dial.identifier.index) == render_key:
+            return None
 
-            self.current_image.paste(dial_image, image_area, dial_image)
+        area = self.controller_touch.get_dial_image_area(dial.identifier)
+        x1, y1, x2, y2 = area
+
+        region = self.base_image.crop(area)
+        dial_image = dial_state.get_rendered_touch_image()
+        region.paste(dial_image, (0, 0), dial_image)
+        # Replace the whole dial slot so transparent pixels clear stale content.
+        self.current_image.paste(region, (x1, y1))
+
+        self.dial_render_keys[dial.identifier.index] = render_key
+        return area, region
 
     def ensure_cached_image(self) -> None:
         if self.base_image is None or self.current_image is None:
@@ -4051,17 +4560,7 @@ class ControllerTouchScreenState(ControllerInputState):
         if dial is None:
             return None
 
-        area = self.controller_touch.get_dial_image_area(identifier)
-        x1, y1, x2, y2 = area
-
-        region = self.base_image.crop(area)
-        dial_state = dial.get_active_state()
-        dial_image = dial_state.get_rendered_touch_image()
-        region.paste(dial_image, (0, 0), dial_image)
-        # Replace the whole dial slot so transparent pixels clear stale content.
-        self.current_image.paste(region, (x1, y1))
-
-        return area, region
+        return self.compose_dial(dial, force=True)
 
 
     def update(self):
@@ -4105,6 +4604,7 @@ class ControllerTouchScreenState(ControllerInputState):
         if self.base_image is not None:
             self.base_image.close()
         self.base_image = self.controller_touch.generate_empty_image()
+        self.background_key = None
 
     def close_resources(self) -> None:
         if self.current_image is not None:
@@ -4113,6 +4613,8 @@ class ControllerTouchScreenState(ControllerInputState):
         if self.base_image is not None:
             self.base_image.close()
             self.base_image = None
+        self.background_key = None
+        self.dial_render_keys.clear()
 
 class ControllerDialState(ControllerInputState):
     def __init__(self, dial: "ControllerDial", state: int):
@@ -4141,6 +4643,36 @@ class ControllerDialState(ControllerInputState):
         self.video = video
 
 
+    def get_touch_render_key(self) -> tuple | None:
+        """
+        Everything get_rendered_touch_image() depends on, None if the dial has to be
+        rendered every time because it changes on its own (videos, scrolling labels).
+        """
+        if self.video is not None:
+            return None
+        if self.label_manager.get_has_scroll_labels():
+            return None
+
+        media_key = None
+        if self.image is not None:
+            if self.image.get_raw_image() is None:
+                return None
+            layout = self.layout_manager.get_composed_layout()
+            media_key = (self.image.get_content_hash(), layout.valign, layout.halign, layout.fill_mode, layout.size)
+
+        labels = tuple(
+            (position, label.text, label.font_size, label.font_name, tuple(label.color), label.font_weight,
+             label.style, label.outline_width, tuple(label.outline_color), label.alignment)
+            for position, label in self.label_manager.get_composed_labels().items()
+            if label.text not in [None, ""]
+        )
+
+        return (
+            tuple(self.dial.get_image_size()),
+            tuple(self.background_manager.get_composed_color()),
+            media_key, labels,
+        )
+
     def get_rendered_touch_image(self) -> Image.Image:
         touch_screen = self.dial.get_touch_screen()
 
@@ -4187,10 +4719,7 @@ class ControllerKeyState(ControllerInputState):
         if self.key_video is not None:
             self.key_video.close()
             self.key_video = None
-            
-        # Reset GIF timing
-        if isinstance(self.controller_input, ControllerKey):
-            self.controller_input.last_gif_update_time = 0
+
     
     def set_image(self, key_image: "InputImage", update: bool = True) -> None:
         if self.key_image is not None:
@@ -4211,10 +4740,6 @@ class ControllerKeyState(ControllerInputState):
         if self.key_image is not None:
             self.key_image.close()
         self.key_image = None
-        
-        # Reset GIF timing for new video
-        if isinstance(self.controller_input, ControllerKey):
-            self.controller_input.last_gif_update_time = 0
 
     def clear(self):
         if self.key_image is not None:
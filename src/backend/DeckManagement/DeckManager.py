@@ -33,6 +33,7 @@ from StreamDeck.Devices.RotatedDeck import RotatedDeck
 from src.backend.DeckManagement.DeckController import DeckController
 from src.backend.PageManagement.PageManagerBackend import PageManagerBackend
 from src.backend.SettingsManager import SettingsManager
+from src.backend.Utils.PluginSettingsStore import PluginSettingsStore
 from src.backend.DeckManagement.HelperMethods import get_sys_param_value, recursive_hasattr
 from src.backend.DeckManagement.Subclasses.FakeDeck import DEFAULT_FAKE_DECK_TYPE, FakeDeck
 
@@ -266,6 +267,9 @@ class DeckManager:
         self.check_for_errors_if_window_ready()
 
     def close_all(self):
+        # The quit paths end in os._exit(), which skips the atexit flush of the stores
+        self.flush_pending_saves()
+
         log.info("Closing all decks")
         for controller in self.deck_controller:
             # continue, not return - one deck that is already gone must not keep
@@ -295,6 +299,21 @@ class DeckManager:
             except Exception as e:
                 log.error(f"Failed to close deck. Error: {e}")
 
+    def flush_pending_saves(self):
+        """Writes the pages, plugin settings and store cache index that are still waiting for their save timer"""
+        try:
+            gl.page_manager.page_store.flush_all()
+        except Exception as e:
+            log.error(f"Failed to save pages. Error: {e}")
+
+        try:
+            PluginSettingsStore.flush_shared_file_store()
+        except Exception as e:
+            log.error(f"Failed to save plugin settings. Error: {e}")
+
+        if gl.store_backend is not None:
+            gl.store_backend.store_cache.flush()
+
     def stop_usb_monitoring(self):
         self.usb_monitor.stop_monitoring(timeout=2)
 
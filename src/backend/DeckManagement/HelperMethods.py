@@ -37,6 +37,7 @@ from autostart import is_flatpak
 from loguru import logger as log
 import globals as gl
 from src.backend.Utils.AtomicSaveUtils import atomic_write, atomic_save_json
+from src.backend.Utils.SvgRasterCache import SvgRasterCache
 
 
 def sha256(text: str) -> str:
@@ -417,6 +418,9 @@ def svg_string_to_pil(svg_string, width: int = 96, height: int = 96):
     return img
 
 
+svg_raster_cache = SvgRasterCache(disk_dir=os.path.join(gl.DATA_PATH, "cache", "svg"))
+
+
 def svg_to_pil(svg_path: str, width: int = 96, height: int = 96):
     """
     Convert an SVG file to a PIL Image object.
@@ -429,24 +433,25 @@ def svg_to_pil(svg_path: str, width: int = 96, height: int = 96):
     Returns:
         PIL.Image: The converted image
     """
-    # Read SVG file
-
     if os.path.exists(svg_path):
-        with open(svg_path, 'rb') as f:
-            svg_data = f.read()
-        
-        # Convert SVG to PNG using cairosvg
-        png_data = cairosvg.svg2png(
-            bytestring=svg_data,
-            output_width=width,
-            output_height=height
-        )
-        
-        # Create PIL Image from PNG data
-        img = Image.open(BytesIO(png_data))
-        
-        return img
+        return svg_raster_cache.get(svg_path, width, height, lambda: _rasterize_svg_file(svg_path, width, height))
     elif svg_path.startswith("<svg "):
         return svg_string_to_pil(svg_path, width, height)
     else:
         raise ValueError(f"Could not create SVG from string or path: {svg_path}")
+
+
+def _rasterize_svg_file(svg_path: str, width: int, height: int) -> Image.Image:
+    # Read SVG file
+    with open(svg_path, 'rb') as f:
+        svg_data = f.read()
+
+    # Convert SVG to PNG using cairosvg
+    png_data = cairosvg.svg2png(
+        bytestring=svg_data,
+        output_width=width,
+        output_height=height
+    )
+
+    # Create PIL Image from PNG data
+    return Image.open(BytesIO(png_data))
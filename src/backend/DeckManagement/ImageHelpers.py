@@ -20,7 +20,7 @@ Shoutout to Dean Camera alias abcminiuser for his amazing work!
 from PIL import Image, ImageOps
 from StreamDeck.ImageHelpers import PILHelper
 
-from gi.repository import GLib, GdkPixbuf
+from gi.repository import GLib, GdkPixbuf, Gdk
 
 def create_full_deck_sized_image(deck, image_filename = None, image = None):
         key_rows, key_cols = deck.key_layout()
@@ -123,6 +123,30 @@ def is_transparent(img: Image.Image):
 
     return False
 
+def image2texture(img) -> Gdk.MemoryTexture:
+    """
+    Converts an image to a Gdk.MemoryTexture, which widgets can show without the
+    extra copy and upload a Pixbuf goes through.
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    w, h = img.size
+    return Gdk.MemoryTexture.new(w, h, Gdk.MemoryFormat.R8G8B8A8, GLib.Bytes.new(img.tobytes()), w * 4)
+
+def pixbuf2image(pixbuf: GdkPixbuf.Pixbuf) -> Image.Image:
+    """
+    Converts a GdkPixbuf.Pixbuf object to an image, for formats only GdkPixbuf can load.
+
+    Args:
+        pixbuf (GdkPixbuf.Pixbuf): The pixbuf to convert.
+
+    Returns:
+        PIL.Image.Image: The converted image.
+    """
+    mode = "RGBA" if pixbuf.get_has_alpha() else "RGB"
+    size = (pixbuf.get_width(), pixbuf.get_height())
+    return Image.frombytes(mode, size, pixbuf.read_pixel_bytes().get_data(), "raw", mode, pixbuf.get_rowstride())
+
 def image2pixbuf(img, force_transparency=False):
     """
     Converts an image to a GdkPixbuf.Pixbuf object.
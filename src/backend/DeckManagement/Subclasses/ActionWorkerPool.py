@@ -0,0 +1,275 @@
+"""
+Author: Core447
+Year: 2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from loguru import logger as log
+
+LANE_EVENT = "event"
+LANE_TICK = "tick"
+
+# Ticks slower than this are logged, the tick interval itself is 1 s
+SLOW_TICK_THRESHOLD = 0.5
+# An event callback running longer than this no longer holds back the calls queued behind it for the
+# same input, and calls that waited this long for a free worker get a thread of their own
+BLOCKED_EVENT_TIMEOUT = 0.5
+
+
+@dataclass
+class ActionTickTiming:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": (self.total / self.count) * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "last_ms": self.last * 1000,
+        }
+
+
+class _Slot:
+    """The calls of one input on one lane"""
+    def __init__(self):
+        self.queue: deque = deque()
+        # Token of the drainer that runs the queue, a drainer that lost it stops after its current call
+        self.owner: object = None
+        # When the running call started, None between calls
+        self.running_since: float = None
+        # When the drainer was handed to the executor, None once it started
+        self.waiting_since: float = None
+
+
+class ActionWorkerPool:
+    """
+    Runs the action callbacks of one deck on a fixed number of worker threads
+    instead of starting a new thread for every tick and every event.
+
+    Work is submitted per input (the key is usually the InputIdentifier) and
+    calls for the same input on the same lane start one after another in
+    submission order, so a press is never handled after its release.
+
+    There are two lanes with their own workers:
+    - event: key presses, dial turns, touches, updates. Never dropped and can't
+      be starved by ticks. Handlers may block, e.g. a key down waiting for its
+      key up: once a call ran for BLOCKED_EVENT_TIMEOUT, the calls queued behind
+      it move to an overflow thread, and so do calls that waited that long
+      because all workers are busy.
+    - tick: on_tick calls. If the previous tick of an input is still queued or
+      running, the new one is skipped instead of piling up behind a slow plugin.
+    """
+    def __init__(self, name: str = "actions", event_workers: int = 8, tick_workers: int = None):
+        if tick_workers is None:
+            tick_workers = max(2, min(8, os.cpu_count() or 4))
+
+        self.name = name
+        self._lock = threading.Lock()
+        self._executors = {
+            LANE_EVENT: ThreadPoolExecutor(max_workers=event_workers, thread_name_prefix=f"{name}-event"),
+            LANE_TICK: ThreadPoolExecutor(max_workers=tick_workers, thread_name_prefix=f"{name}-tick"),
+        }
+        # (lane, key) -> calls waiting to run, only present while a drainer is scheduled for it
+        self._pending: dict[tuple, _Slot] = {}
+        # Moves blocked event calls to overflow threads, only runs while there are events
+        self._watcher: threading.Thread = None
+        self.overflow_threads: int = 0
+        self._queue_depth = {LANE_EVENT: 0, LANE_TICK: 0}
+        self._max_queue_depth = {LANE_EVENT: 0, LANE_TICK: 0}
+
+        self.skipped_ticks: int = 0
+        self._skipped_ticks_per_key: dict = {}
+        self._tick_timings: dict[str, ActionTickTiming] = {}
+
+        self._shut_down = False
+
+    def submit(self, key, fn: callable, *args, lane: str = LANE_EVENT, **kwargs) -> bool:
+        """
+        Queue fn(*args, **kwargs) to run after all earlier calls for `key` on `lane`.
+        Returns False if the pool has already been shut down.
+        """
+        return self._submit(lane, key, fn, args, kwargs, coalesce=False)
+
+    def submit_tick(self, key, fn: callable, *args, **kwargs) -> bool:
+        """
+        Queue a tick for `key`. Returns False and counts a skipped tick if the
+        last tick for this key has not finished yet.
+        """
+        return self._submit(LANE_TICK, key, fn, args, kwargs, coalesce=True)
+
+    def _submit(self, lane: str, key, fn: callable, args: tuple, kwargs: dict, coalesce: bool) -> bool:
+        slot_key = (lane, key)
+        with self._lock:
+            if self._shut_down:
+                return False
+
+            slot = self._pending.get(slot_key)
+            if slot is not None and coalesce:
+                self.skipped_ticks += 1
+                self._skipped_ticks_per_key[key] = self._skipped_ticks_per_key.get(key, 0) + 1
+                return False
+
+            token = None
+            if slot is None:
+                slot = _Slot()
+                token = slot.owner = object()
+                slot.waiting_since = time.monotonic()
+                self._pending[slot_key] = slot
+            slot.queue.append((fn, args, kwargs))
+
+            self._queue_depth[lane] += 1
+            if self._queue_depth[lane] > self._max_queue_depth[lane]:
+                self._max_queue_depth[lane] = self._queue_depth[lane]
+
+            if lane == LANE_EVENT and self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch_events, name=f"{self.name}-event-watcher", daemon=True)
+                self._watcher.start()
+
+        if token is not None:
+            try:
+                self._executors[lane].submit(self._drain, slot_key, slot, token)
+            except RuntimeError:
+                # Executor was shut down between the check above and now
+                with self._lock:
+                    if self._pending.get(slot_key) is slot:
+                        del self._pending[slot_key]
+                        self._queue_depth[lane] -= len(slot.queue)
+                return False
+        return True
+
+    def _drain(self, slot_key: tuple, slot: _Slot, token: object) -> None:
+        lane = slot_key[0]
+        while True:
+            with self._lock:
+                if slot.owner is not token or self._shut_down:
+                    return
+                slot.waiting_since = None
+                if not slot.queue:
+                    # Only forget the slot once nothing is running for it, this is what keeps
+                    # a coalesced tick from starting while the previous one is still busy
+                    if self._pending.get(slot_key) is slot:
+                        del self._pending[slot_key]
+                    return
+                fn, args, kwargs = slot.queue.popleft()
+                slot.running_since = time.monotonic()
+
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                log.exception(f"Error in {lane} callback of {self.name}")
+            finally:
+                with self._lock:
+                    if slot.owner is token:
+                        slot.running_since = None
+                    if not self._shut_down:
+                        self._queue_depth[lane] -= 1
+
+    def _watch_events(self) -> None:
+        while True:
+            time.sleep(BLOCKED_EVENT_TIMEOUT / 4)
+            now = time.monotonic()
+            overflow = []
+            with self._lock:
+                if self._shut_down:
+                    self._watcher = None
+                    return
+
+                has_events = False
+                for slot_key, slot in self._pending.items():
+                    if slot_key[0] != LANE_EVENT:
+                        continue
+                    has_events = True
+                    if not slot.queue:
+                        continue
+                    since = slot.running_since if slot.running_since is not None else slot.waiting_since
+                    if since is None or now - since < BLOCKED_EVENT_TIMEOUT:
+                        continue
+                    # The blocked call keeps its thread, the rest of the queue gets a new one
+                    token = slot.owner = object()
+                    slot.running_since = None
+                    slot.waiting_since = None
+                    overflow.append((slot_key, slot, token))
+
+                if not has_events:
+                    self._watcher = None
+                    return
+                self.overflow_threads += len(overflow)
+
+            for slot_key, slot, token in overflow:
+                log.debug(f"[action-pool] pool={self.name} input={slot_key[1]} is blocked, running its queued events on an overflow thread")
+                threading.Thread(target=self._drain, args=(slot_key, slot, token), name=f"{self.name}-event-overflow", daemon=True).start()
+
+    def record_tick_time(self, action_id: str, duration: float) -> None:
+        with self._lock:
+            timing = self._tick_timings.get(action_id)
+            if timing is None:
+                timing = ActionTickTiming()
+                self._tick_timings[action_id] = timing
+            timing.add(duration)
+
+        if duration > SLOW_TICK_THRESHOLD:
+            log.debug(f"[action-tick] pool={self.name} action={action_id} run_ms={duration * 1000:.1f}")
+
+    def get_queue_depth(self, lane: str = None) -> int:
+        with self._lock:
+            if lane is None:
+                return sum(self._queue_depth.values())
+            return self._queue_depth[lane]
+
+    def get_stats(self) -> dict:
+        """
+        Snapshot of the pool for finding the plugins that stall it.
+        Tick timings are sorted by their average, slowest first.
+        """
+        with self._lock:
+            timings = sorted(self._tick_timings.items(), key=lambda item: item[1].total / max(item[1].count, 1), reverse=True)
+            return {
+                "queue_depth": dict(self._queue_depth),
+                "max_queue_depth": dict(self._max_queue_depth),
+                "skipped_ticks": self.skipped_ticks,
+                "overflow_threads": self.overflow_threads,
+                "skipped_ticks_per_input": {str(key): count for key, count in self._skipped_ticks_per_key.items()},
+                "tick_times": {action_id: timing.as_dict() for action_id, timing in timings},
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.skipped_ticks = 0
+            self._skipped_ticks_per_key.clear()
+            self._tick_timings.clear()
+            self._max_queue_depth = dict(self._queue_depth)
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._shut_down = True
+            self._pending.clear()
+            for lane in self._queue_depth:
+                self._queue_depth[lane] = 0
+
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
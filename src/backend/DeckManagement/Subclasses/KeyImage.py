@@ -12,6 +12,8 @@ This programm comes with ABSOLUTELY NO WARRANTY!
 You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
+import hashlib
+
 from src.backend.DeckManagement.Subclasses.SingleKeyAsset import SingleKeyAsset
 from PIL import Image
 
@@ -34,6 +36,7 @@ class InputImage(SingleKeyAsset):
         """
         super().__init__(controller_input)
         self.image = image.convert("RGBA")
+        self._content_hash: str = None
 
         if self.image is None:
             self.image = self.controller_input.get_empty_background()
@@ -42,6 +45,15 @@ class InputImage(SingleKeyAsset):
         if not hasattr(self, "image"):
             return
         return self.image
+
+    def get_content_hash(self) -> str:
+        """Identifies the pixels of the image, so equal icons on different keys share renders."""
+        if self._content_hash is None:
+            image = self.image
+            digest = hashlib.md5(image.tobytes())
+            digest.update(f"{image.mode}{image.size}".encode())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
     
     def close(self) -> None:
         if not hasattr(self, "image"):
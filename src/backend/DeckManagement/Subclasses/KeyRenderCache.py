@@ -0,0 +1,102 @@
+"""
+Author: Core447
+Year: 2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from PIL import Image
+
+# Composed key images plus their device payloads, a 96x96 key takes ~45 KB
+CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class KeyRender:
+    image: Image.Image
+    native_image: bytes
+
+    @property
+    def n_bytes(self) -> int:
+        return self.image.width * self.image.height * 4 + len(self.native_image or b"")
+
+
+class KeyRenderCache:
+    """
+    Results of ControllerKey.get_current_image() and the encoding that follows it,
+    keyed on everything the render depends on (see ControllerKey.get_render_key()).
+
+    Shared by all decks, so the same icon with the same labels on another page or
+    another deck of the same model is only ever composed once.
+    The cached images are shared - they must not be modified or closed.
+    """
+    def __init__(self, budget_bytes: int = CACHE_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.cache_bytes = 0
+        self.cache: OrderedDict[tuple, KeyRender] = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        # Renders skipped because the key already shows this exact render
+        self.skipped: int = 0
+
+    def get(self, key: tuple) -> KeyRender | None:
+        with self.lock:
+            render = self.cache.get(key)
+            if render is None:
+                self.misses += 1
+                return None
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return render
+
+    def put(self, key: tuple, image: Image.Image, native_image: bytes) -> None:
+        render = KeyRender(image=image, native_image=native_image)
+        with self.lock:
+            old = self.cache.pop(key, None)
+            if old is not None:
+                self.cache_bytes -= old.n_bytes
+
+            self.cache[key] = render
+            self.cache_bytes += render.n_bytes
+
+            # Dropped images aren't closed, a key or the UI may still be showing them
+            while self.cache_bytes > self.budget_bytes and len(self.cache) > 1:
+                dropped = self.cache.popitem(last=False)[1]
+                self.cache_bytes -= dropped.n_bytes
+
+    def count_skipped(self) -> None:
+        with self.lock:
+            self.skipped += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+            self.cache_bytes = 0
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "skipped": self.skipped,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.cache),
+                "bytes": self.cache_bytes,
+            }
+
+
+key_render_cache = KeyRenderCache()
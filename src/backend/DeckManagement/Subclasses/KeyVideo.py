@@ -39,21 +39,63 @@ class InputVideo(SingleKeyAsset):
         self._gif_elapsed_ms: float = 0.0
         self._gif_last_ts: float = -1.0  # perf_counter timestamp in ms, -1 = not started
 
+        # Video timing state: the frame shown follows the time since playback started,
+        # so renders in between scheduled frames don't speed up playback
+        self._video_start_ts: float = -1.0  # perf_counter timestamp in s, -1 = not started
+
+        # Set by advance_frame(), the next get_next_frame() returns that frame instead of advancing again
+        self._frame_advanced = False
+
+    def advance_frame(self) -> int:
+        """
+        Moves on to the frame that is due now without decoding it and returns its index.
+        The next get_next_frame() returns this frame, so a tick advances playback only once.
+        """
+        self._advance()
+        self._frame_advanced = True
+        return self.active_frame
+
     def get_next_frame(self) -> Image:
+        if self._frame_advanced:
+            self._frame_advanced = False
+        else:
+            self._advance()
+        return self.video_cache.get_frame(self.active_frame)
+
+    def _advance(self) -> None:
         if self.video_cache._is_gif():
-            return self._get_next_gif_frame()
+            self._advance_gif()
+            return
 
-        every_n_frames = self.controller_input.deck_controller.media_player.FPS // self.fps
-        if self.controller_input.media_ticks % every_n_frames == 0:
-            self.active_frame += 1
+        now = time.perf_counter()
+        if self._video_start_ts < 0:
+            self._video_start_ts = now
 
-        if self.active_frame >= self.video_cache.n_frames:
-            if self.loop:
-                self.active_frame = 0
+        frame = int((now - self._video_start_ts) * self.fps)
+        n_frames = max(self.video_cache.n_frames, 1)
+        if frame >= n_frames:
+            frame = frame % n_frames if self.loop else n_frames - 1
+        self.active_frame = frame
 
-        return self.video_cache.get_frame(self.active_frame)
-
-    def _get_next_gif_frame(self) -> Image:
+    def get_frame_delay(self) -> float | None:
+        """Seconds until the next frame is due, None once a video that doesn't loop has ended."""
+        if self.video_cache._is_gif():
+            if self._gif_last_ts < 0:
+                return 0
+            if not self.loop and self.active_frame >= self.video_cache.n_frames - 1:
+                return None
+            delay_ms = self.video_cache.get_frame_delay(max(self.active_frame, 0))
+            elapsed_ms = self._gif_elapsed_ms + time.perf_counter() * 1000.0 - self._gif_last_ts
+            return max(0, delay_ms - elapsed_ms) / 1000.0
+
+        if self._video_start_ts < 0:
+            return 0
+        elapsed = time.perf_counter() - self._video_start_ts
+        if not self.loop and elapsed * self.fps >= self.video_cache.n_frames - 1:
+            return None
+        return (int(elapsed * self.fps) + 1) / self.fps - elapsed
+
+    def _advance_gif(self) -> None:
         """Advance GIF playback using real-time elapsed ms and per-frame delays."""
         try:
             now_ms = time.perf_counter() * 1000.0
@@ -61,7 +103,7 @@ class InputVideo(SingleKeyAsset):
             if self._gif_last_ts < 0:
                 self.active_frame = 0
                 self._gif_last_ts = now_ms
-                return self.video_cache.get_frame(0)
+                return
 
             self._gif_elapsed_ms += now_ms - self._gif_last_ts
             self._gif_last_ts = now_ms
@@ -84,10 +126,8 @@ class InputVideo(SingleKeyAsset):
                         self.active_frame = next_frame
                         break
                 self.active_frame = next_frame
-
-            return self.video_cache.get_frame(self.active_frame)
         except Exception:
-            return self.video_cache.get_frame(0)
+            self.active_frame = 0
 
     def get_raw_image(self) -> Image.Image:
         return self.get_next_frame()
@@ -0,0 +1,137 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import mmap
+import os
+import struct
+import threading
+
+from PIL import Image
+
+from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
+
+
+class TileCacheFile:
+    """
+    Fixed-stride on-disk store for the key tiles of every frame of a background video.
+
+    Layout: header | one "written" byte per frame | padding | frames. Each frame is
+    key_count raw tiles of width * height * channels bytes, so frame n is found by
+    offset alone. The file is memory-mapped and only the frames that are shown get
+    paged in - nothing is unpacked into RAM on load.
+
+    With a disk budget, a new file makes room for its full size by deleting the least
+    recently used tile files that are not open, and a file larger than the budget
+    isn't created at all.
+    """
+    MAGIC = b"SCVTILES"
+    VERSION = 1
+    # magic, version, n_frames, key_count, width, height, channels
+    HEADER = struct.Struct("<8sIIIIII")
+    ALIGNMENT = mmap.PAGESIZE
+
+    # Instances of the same video on multiple decks of the same model share the file
+    _init_lock = threading.Lock()
+    # path -> number of instances that have it open, these are never deleted to stay in the budget
+    _open_paths: dict[str, int] = {}
+
+    def __init__(self, path: str, n_frames: int, key_count: int, size: tuple[int, int], channels: int,
+                 disk_budget: DiskCacheBudget = None):
+        self.path = path
+        self.n_frames = n_frames
+        self.key_count = key_count
+        self.size = size
+        self.mode = "RGBA" if channels == 4 else "RGB"
+
+        self.tile_bytes = size[0] * size[1] * channels
+        self.frame_bytes = self.tile_bytes * key_count
+        header_size = self.HEADER.size + n_frames
+        self.data_offset = -(-header_size // self.ALIGNMENT) * self.ALIGNMENT
+        file_size = self.data_offset + n_frames * self.frame_bytes
+
+        if disk_budget is not None and file_size > disk_budget.budget_bytes:
+            raise ValueError(f"{file_size} bytes of tiles don't fit into the video cache budget of {disk_budget.budget_bytes} bytes")
+
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, n_frames, key_count, size[0], size[1], channels)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._init_lock:
+            self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                created = os.fstat(self.fd).st_size != file_size or os.pread(self.fd, self.HEADER.size, 0) != header
+                if created:
+                    # New or stale file - truncating first also clears the written flags.
+                    # The frame area stays sparse until frames get written.
+                    os.ftruncate(self.fd, 0)
+                    os.ftruncate(self.fd, file_size)
+                    os.pwrite(self.fd, header, 0)
+                self.mm = mmap.mmap(self.fd, file_size, access=mmap.ACCESS_READ)
+            except Exception:
+                os.close(self.fd)
+                raise
+            self._open_paths[path] = self._open_paths.get(path, 0) + 1
+            open_paths = tuple(self._open_paths)
+
+        if disk_budget is not None:
+            # Counted with its full size, frames get written until the video was played once
+            if created:
+                disk_budget.add(path, keep=open_paths)
+            else:
+                disk_budget.touch(path)
+
+        self._complete = False
+
+    def _frame_offset(self, n: int) -> int:
+        return self.data_offset + n * self.frame_bytes
+
+    def has_frame(self, n: int) -> bool:
+        return 0 <= n < self.n_frames and self.mm[self.HEADER.size + n] == 1
+
+    def is_complete(self) -> bool:
+        if not self._complete:
+            flags_start = self.HEADER.size
+            self._complete = self.mm.find(b"\x00", flags_start, flags_start + self.n_frames) == -1
+        return self._complete
+
+    def read_frame(self, n: int) -> list[Image.Image] | None:
+        if not self.has_frame(n):
+            return None
+        offset = self._frame_offset(n)
+        tiles = []
+        for _ in range(self.key_count):
+            tiles.append(Image.frombytes(self.mode, self.size, self.mm[offset:offset + self.tile_bytes]))
+            offset += self.tile_bytes
+        return tiles
+
+    def write_frame(self, n: int, tiles: list[Image.Image]) -> None:
+        if not 0 <= n < self.n_frames or len(tiles) != self.key_count:
+            return
+        data = bytearray()
+        for tile in tiles:
+            if tile.mode != self.mode or tile.size != self.size:
+                tile = tile.convert(self.mode).resize(self.size)
+            data += tile.tobytes()
+        os.pwrite(self.fd, data, self._frame_offset(n))
+        # Only flag the frame once its data is in place
+        os.pwrite(self.fd, b"\x01", self.HEADER.size + n)
+
+    def close(self) -> None:
+        self.mm.close()
+        os.close(self.fd)
+        with self._init_lock:
+            n_open = self._open_paths.get(self.path, 0) - 1
+            if n_open > 0:
+                self._open_paths[self.path] = n_open
+            else:
+                self._open_paths.pop(self.path, None)
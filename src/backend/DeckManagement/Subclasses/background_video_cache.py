@@ -1,22 +1,20 @@
-import bz2
 import hashlib
 import os
-import pickle
-import sys
 import threading
-import time
-from collections import OrderedDict
 from PIL import Image, ImageOps
 import cv2
-from StreamDeck.ImageHelpers import PILHelper
-import indexed_bzip2 as ibz2
 from loguru import logger as log
 
+from src.backend.DeckManagement.Subclasses.TileCacheFile import TileCacheFile
+from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
+
 import globals as gl
-from src.backend.Utils.AtomicSaveUtils import atomic_write
 
 VID_CACHE = os.path.join(gl.DATA_PATH, "cache", "videos")
 os.makedirs(VID_CACHE, exist_ok=True)
+# The tile files of all background videos together, a 60 s video at 30 fps on an XL takes ~1.6 GB
+TILE_CACHE_BUDGET_BYTES = 4 * 1024 * 1024 * 1024
+tile_disk_budget = DiskCacheBudget(VID_CACHE, TILE_CACHE_BUDGET_BYTES, suffix=".tiles", recursive=True)
 _VIDEO_HASH_CACHE: dict[tuple[str, int, int], str] = {}
 _VIDEO_HASH_CACHE_LOCK = threading.Lock()
 
@@ -25,14 +23,14 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.backend.DeckManagement.DeckController import DeckController
 
+
 class BackgroundVideoCache:
     def __init__(self, video_path, deck_controller: "DeckController") -> None:
         self.deck_controller = deck_controller
         self.lock = threading.Lock()
 
         self.video_path = video_path
-        self.cache = OrderedDict()
-        self.last_decoded_frame = None
+        self.tile_file: TileCacheFile = None
         self.last_frame_index = -1
 
         if self._is_gif():
@@ -50,11 +48,12 @@ class BackgroundVideoCache:
         self.key_size = self.deck_controller.deck.key_image_format()['size']
         self.spacing = self.deck_controller.key_spacing
 
-        self.cache_stored = False
         self._closed = False
-        thread = threading.Thread(target=self.load_cache, name="load_video_cache")
-        thread.daemon = True
-        thread.start()
+        self.last_tiles: list[Image.Image] = []
+
+        self.do_caching = gl.settings_manager.get_app_settings().get("performance", {}).get("cache-videos", True)
+        if self.do_caching:
+            self.load_cache()
 
         if self.is_cache_complete():
             log.info("Cache is complete. Closing the video capture.")
@@ -62,33 +61,29 @@ class BackgroundVideoCache:
         else:
             log.info("Cache is not complete. Continuing with video capture.")
 
-        self.last_tiles: list[Image.Image] = []
-
-        self.do_caching = gl.settings_manager.get_app_settings().get("performance", {}).get("cache-videos", True)
-
     def _is_gif(self) -> bool:
         return os.path.splitext(self.video_path)[1].lower() == ".gif"
 
+    def get_cache_path(self) -> str:
+        width, height = self.key_size
+        return os.path.join(VID_CACHE, self.key_layout_str, f"{self.video_md5}_{width}x{height}.tiles")
+
     def get_tiles(self, n):
         if self._closed:
             return [self.deck_controller.generate_alpha_key() for _ in range(self.deck_controller.deck.key_count())]
-        # Check if cache is available (video may have been closed)
-        if not hasattr(self, 'cache') or self.cache is None:
-            return [self.deck_controller.generate_alpha_key() for _ in range(self.deck_controller.deck.key_count())]
 
         n = min(n, self.n_frames - 1)
         tiles = None
         with self.lock:
-            if self.is_cache_complete():
-                if not self._is_gif():
-                    self.cap.release()
-                return self.cache.get(n, None)
+            if self._closed:
+                return [self.deck_controller.generate_alpha_key() for _ in range(self.deck_controller.deck.key_count())]
 
-            # Otherwise, continue with video capture
-            # Check if the frame is already decoded
-            if n in self.cache:
-                return self.cache[n]
+            if self.tile_file is not None:
+                cached = self.tile_file.read_frame(n)
+                if cached is not None:
+                    return cached
 
+            # Otherwise, continue with video capture
             # If the requested frame is before the last decoded one, reset the capture
             if n < self.last_frame_index:
                 if not self._is_gif():
@@ -119,23 +114,27 @@ class BackgroundVideoCache:
                     current_tiles = self.crop_key_image_from_deck_sized_image(full_sized, key)
                     tiles.append(current_tiles)
 
-                if self.do_caching and self.cache is not None:
-                    self.cache[self.last_frame_index] = tiles
+                if self.tile_file is not None:
+                    try:
+                        self.tile_file.write_frame(self.last_frame_index, tiles)
+                    except OSError as e:
+                        log.error(f"Failed to write video cache, disabling it: {e}")
+                        self.tile_file.close()
+                        self.tile_file = None
+
                 self.last_tiles = tiles
-                
 
                 full_sized.close()
                 pil_image.close()
 
+            if self.is_cache_complete():
+                self.release()
 
         # Return the last decoded frame if the nth frame is not available
         if len(self.last_tiles) > 0:
             tiles = self.last_tiles
         if tiles is None:
             tiles = [self.deck_controller.generate_alpha_key() for _ in range(self.deck_controller.deck.key_count())]
-        
-        if self.cache is not None:
-            return self.cache.get(n, tiles)
         return tiles
     
     def create_full_deck_sized_image(self, frame: Image.Image) -> Image.Image:
@@ -211,75 +210,38 @@ class BackgroundVideoCache:
                 _VIDEO_HASH_CACHE[cache_key] = digest
         return digest
         
-    def save_cache_threaded(self):
-        t = threading.Thread(target=self.save_cache, name="save_video_cache")
-        t.start()
-        
-    @log.catch
-    def save_cache(self):
+    def load_cache(self) -> None:
         """
-        Store cache using pickle
+        Open the tile cache of this video, the frames themselves are only read once they are shown.
         """
-        if self.cache_stored:
-            return
-        self.cache_stored = True
-        
-        start = time.time()
-        cache_path = os.path.join(VID_CACHE, self.key_layout_str, f"{self.video_md5}.cache")
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-
-        data = self.cache.copy()
-
-        with atomic_write(cache_path, "wb") as raw_f:
-            with bz2.open(raw_f, "wb") as f:
-                pickle.dump(data, f)
-
-        log.success(f"Saved cache in {time.time() - start:.2f} seconds")
-        self.last_save = time.time()
-        del data
-
-
-    @log.catch
-    def load_cache(self, key_index: int = None):
-        if self._closed:
-            return
-        cache_path = os.path.join(VID_CACHE, self.key_layout_str, f"{self.video_md5}.cache")
-        if not os.path.exists(cache_path):
-            return
-        
-        # with open(os.path.join(VID_CACHE, "3x5", f"{self.video_md5}.pkl"), "rb") as f:
-            # self.cache = pickle.load(f)
-        
-        # return
-        _time = time.time()
+        # Caches of older versions were a bz2 compressed pickle of all tiles
+        legacy_path = os.path.join(VID_CACHE, self.key_layout_str, f"{self.video_md5}.cache")
+        if os.path.isfile(legacy_path):
+            try:
+                os.remove(legacy_path)
+            except OSError as e:
+                log.warning(f"Failed to remove old video cache {legacy_path}: {e}")
+
+        channels = 4 if self._is_gif() else 3
         try:
-            with ibz2.open(cache_path, parallelization=os.cpu_count()) as f:
-                loaded_cache = pickle.load(f)
-            with self.lock:
-                if self._closed:
-                    return
-                self.cache = OrderedDict(sorted(loaded_cache.items(), key=lambda x: x[0]))
-            del loaded_cache
-            log.success(f"Loaded cache in {time.time() - _time:.2f} seconds")
-        except Exception as e:
-            os.remove(cache_path)
-            log.error(f"Failed to load cache: {e}")
-            return
+            self.tile_file = TileCacheFile(self.get_cache_path(), max(self.n_frames, 0), self.key_count, tuple(self.key_size), channels,
+                                           disk_budget=tile_disk_budget)
+        except (OSError, ValueError) as e:
+            log.error(f"Failed to open video cache: {e}")
+            self.tile_file = None
 
     def is_cache_complete(self) -> bool:
-        if not hasattr(self, 'cache') or self.cache is None:
-            return False
-        if self.n_frames != len(self.cache):
+        if self.tile_file is None:
             return False
-        
-        for key in self.cache:
-            if len(self.cache[key]) != self.key_count:
-                return False
+        return self.tile_file.is_complete()
 
-        return True
+    def release(self) -> None:
+        if self._is_gif():
+            return
+        if hasattr(self, "cap") and self.cap is not None:
+            self.cap.release()
 
     def close(self) -> None:
-        import gc
         self._closed = True
         with self.lock:
             if self._is_gif():
@@ -288,17 +250,12 @@ class BackgroundVideoCache:
             else:
                 self.cap.release()
 
-        if hasattr(self, 'cache') and self.cache is not None:
-            for n in list(self.cache.keys()):
-                for f in self.cache[n]:
-                    if f is not None:
-                        f.close()
-
-            self.cache.clear()
-        if hasattr(self, "last_tiles") and self.last_tiles is not None:
-            for tile in self.last_tiles:
-                if tile is not None:
-                    tile.close()
-            self.last_tiles = []
-        self.cache = None
-        gc.collect()
+            if self.tile_file is not None:
+                self.tile_file.close()
+                self.tile_file = None
+
+            if self.last_tiles is not None:
+                for tile in self.last_tiles:
+                    if tile is not None:
+                        tile.close()
+                self.last_tiles = []
@@ -20,6 +20,7 @@ import sys
 import threading
 import time
 import weakref
+from collections import OrderedDict
 from PIL import Image, ImageOps
 import cv2
 from loguru import logger as log
@@ -27,6 +28,8 @@ import globals as gl
 from src.backend.Utils.AtomicSaveUtils import atomic_save_json
 
 VID_CACHE = os.path.join(gl.DATA_PATH, "cache", "videos")
+# Device-ready frame payloads kept per video, over all deck models/layouts it is shown with
+NATIVE_FRAMES_MAX_BYTES = 16 * 1024 * 1024
 
 
 class VideoFrameCache:
@@ -88,6 +91,13 @@ class VideoFrameCache:
         self.last_frame_index = -1
         self.lock = threading.Lock()  # guards cv2 capture only
 
+        # Device-ready payloads of frames shown without anything drawn over them, keyed on
+        # (signature, frame index) - the signature holds the deck model/rotation/layout. The
+        # least recently used ones are dropped once they take more than NATIVE_FRAMES_MAX_BYTES.
+        self.native_frames: OrderedDict[tuple[tuple, int], bytes] = OrderedDict()
+        self.native_frames_bytes = 0
+        self._native_lock = threading.Lock()
+
         self.do_caching = gl.settings_manager.get_app_settings().get("performance", {}).get("cache-videos", True)
 
         # O(1) cache key — just a stat() call, no file read.
@@ -280,6 +290,29 @@ class VideoFrameCache:
         # Still loading: return frame 0 as static preview
         return self.cache.get(0)
 
+    def get_native_frame(self, signature: tuple, frame_index: int) -> bytes | None:
+        key = (signature, frame_index)
+        with self._native_lock:
+            native_image = self.native_frames.get(key)
+            if native_image is not None:
+                self.native_frames.move_to_end(key)
+            return native_image
+
+    def set_native_frame(self, signature: tuple, frame_index: int, native_image: bytes) -> None:
+        if not self.do_caching:
+            return
+        key = (signature, frame_index)
+        with self._native_lock:
+            previous = self.native_frames.pop(key, None)
+            if previous is not None:
+                self.native_frames_bytes -= len(previous)
+            self.native_frames[key] = native_image
+            self.native_frames_bytes += len(native_image)
+
+            while self.native_frames_bytes > NATIVE_FRAMES_MAX_BYTES and len(self.native_frames) > 1:
+                _, dropped = self.native_frames.popitem(last=False)
+                self.native_frames_bytes -= len(dropped)
+
     # ------------------------------------------------------------------
     # Disk cache I/O
     # ------------------------------------------------------------------
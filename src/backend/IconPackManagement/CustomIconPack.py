@@ -87,7 +87,7 @@ def get_custom_icon_packs() -> dict[str, IconPack]:
         if not os.path.isdir(pack_path):
             continue
 
-        pack = IconPack(pack_path)
+        pack = get_pack(pack_path)
         if pack.is_valid:
             packs[entry] = pack
         else:
@@ -96,6 +96,18 @@ def get_custom_icon_packs() -> dict[str, IconPack]:
     return packs
 
 
+def get_pack(pack_path: str) -> IconPack:
+    if gl.icon_pack_manager is None:
+        return IconPack(pack_path)
+    return gl.icon_pack_manager.get_pack(pack_path)
+
+
+def _invalidate_pack(pack_path: str) -> None:
+    # The file monitors would notice as well, but only once the main loop gets to them
+    if gl.icon_pack_manager is not None:
+        gl.icon_pack_manager.invalidate_pack(pack_path)
+
+
 ## Creation
 
 def create_custom_icon_pack(name: str, description: str = "", banner_path: str = None,
@@ -120,7 +132,7 @@ def create_custom_icon_pack(name: str, description: str = "", banner_path: str =
 
     log.success(f"Created custom icon pack {os.path.basename(pack_path)} with {n_icons} icon(s)")
 
-    return IconPack(pack_path)
+    return get_pack(pack_path)
 
 
 def update_custom_icon_pack(pack_path: str, name: str = None, description: str = None,
@@ -136,6 +148,7 @@ def update_custom_icon_pack(pack_path: str, name: str = None, description: str =
         _write_attribution(pack_path, description)
 
     atomic_save_json(os.path.join(pack_path, MANIFEST_NAME), manifest)
+    _invalidate_pack(pack_path)
 
     if banner_path is not None:
         set_banner(pack_path, banner_path)
@@ -147,6 +160,7 @@ def delete_custom_icon_pack(pack_path: str) -> None:
         return
 
     shutil.rmtree(pack_path, ignore_errors=True)
+    _invalidate_pack(pack_path)
     log.info(f"Removed custom icon pack {os.path.basename(pack_path)}")
 
 
@@ -228,6 +242,7 @@ def add_sources(pack_path: str, sources: list[str]) -> int:
         elif is_supported_image(source):
             added += _add_file(icons_dir, source, "")
 
+    _invalidate_pack(pack_path)
     return added
 
 
@@ -354,6 +369,7 @@ def set_banner(pack_path: str, banner_path: str = None) -> None:
         manifest["thumbnail"] = THUMBNAIL_NAME
         manifest["has-custom-banner"] = is_custom_banner
         atomic_save_json(os.path.join(pack_path, MANIFEST_NAME), manifest)
+    _invalidate_pack(pack_path)
 
 
 def _generate_banner(pack_path: str) -> Image.Image:
@@ -15,20 +15,31 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
 import json
+import hashlib
+import threading
 from functools import lru_cache
 from pathlib import Path
+from loguru import logger as log
 
 # Import own modules
 from src.backend.IconPackManagement.Icon import Icon
+from src.backend.Utils.AtomicSaveUtils import atomic_save_json
+
+# Import globals
+import globals as gl
 
 class IconPack:
     def __init__(self, path: str):
         self.path = path
         self.is_valid = True
         self.name = self.get_manifest().get("name") or os.path.basename(path)
+
+        # Filled on first access: category -> folder and its file names, category -> icons
+        self.categories: dict[str, tuple[str, list[str]]] = None
         self.pack_structure: dict[str, list[Icon]] = {}
+        self.structure_lock = threading.RLock()
 
-        self.generate_folder_structure("icons")
+        self.icons_path = self.get_icons_path()
 
     @lru_cache(maxsize=None)
     def get_manifest(self):
@@ -68,52 +79,112 @@ class IconPack:
         self.is_valid = False
         return None
     
+    def get_icons_path(self) -> str:
+        manifest = self.get_manifest()
+
+        if self.is_valid is False:
+            return None
+
+        icons_path = os.path.join(self.path, manifest.get("icons") or "")
+        if not os.path.isdir(icons_path):
+            self.is_valid = False
+            return None
+        return icons_path
+
+    def get_search_signature(self) -> tuple:
+        """Changes whenever icons are added to or removed from the pack"""
+        return self.get_signature(self.get_categories())
+
+    def get_signature(self, categories: dict[str, tuple[str, list[str]]]) -> tuple:
+        # Adding or removing a file changes the mtime of its folder, a new category the one of the icons folder
+        try:
+            signature = [os.stat(self.icons_path).st_mtime_ns]
+            signature.extend(os.stat(folder).st_mtime_ns for folder, _ in categories.values())
+        except (OSError, TypeError):
+            return ()
+        return tuple(signature)
+
     def get_icons(self) -> list[Icon]:
         return self.get_content_from_structure()
 
     def get_content_from_structure(self) -> list[Icon]:
         content: list[Icon] = []
 
-        for folder_name, folder_entry in self.pack_structure.items():
-            for entry in folder_entry:
-                content.append(entry)
+        for category in self.get_categories():
+            content.extend(self.get_category_icons(category))
 
         return content
 
-    def generate_folder_structure(self, asset_path: str):
-        manifest = self.get_manifest()
-
-        if self.is_valid is False:
-            return
-
-        asset_path = manifest.get(asset_path)
-
-        pack_path = Path(os.path.join(self.path, asset_path))
-
-        if not pack_path.exists(follow_symlinks=True):
-            self.is_valid = False
-            return
+    def get_categories(self) -> dict[str, tuple[str, list[str]]]:
+        """The categories with their folder and file names, from the cache file if the pack didn't change"""
+        with self.structure_lock:
+            if self.categories is not None:
+                return self.categories
+            if not self.is_valid:
+                self.categories = {}
+                return self.categories
+
+            categories = self.load_structure_cache()
+            if categories is None:
+                categories = self.scan_categories()
+                self.save_structure_cache(categories)
+            self.categories = categories
+            return self.categories
+
+    def get_category_icons(self, category: str) -> list[Icon]:
+        with self.structure_lock:
+            icons = self.pack_structure.get(category)
+            if icons is not None:
+                return icons
+
+            folder, file_names = self.get_categories().get(category, (None, []))
+            icons = [Icon(icon_pack=self, path=os.path.join(folder, file_name), category=category) for file_name in file_names]
+            self.pack_structure[category] = icons
+            return icons
+
+    def scan_categories(self) -> dict[str, tuple[str, list[str]]]:
+        categories: dict[str, tuple[str, list[str]]] = {}
+        subfolders = []
 
         # Load Content From Base Directory
-        base_dir_content = self.load_content(pack_path, "Base")
-        if base_dir_content:
-            self.pack_structure["Base"] = base_dir_content
+        base_files = []
+        for entry in os.scandir(self.icons_path):
+            if entry.is_dir():
+                subfolders.append(entry)
+            else:
+                base_files.append(entry.name)
+        if base_files:
+            categories["Base"] = (self.icons_path, base_files)
 
         # Load content from Subfolders
-        subfolders = [entry for entry in os.scandir(pack_path) if entry.is_dir()]
-
         for folder in subfolders:
-            if not self.pack_structure.__contains__(folder.name):
-                self.pack_structure[folder.name] = []
-            icons = self.load_content(folder.path, folder.name)
-            self.pack_structure[folder.name] = icons
-
-    def load_content(self, folder_path: str, category: str = ""):
-        content: list = []
-
-        for entry in os.scandir(folder_path):
-            if os.path.isdir(entry.path):
-                continue
-            content.append(Icon(icon_pack=self, path=entry.path, category=category))
-
-        return content
\ No newline at end of file
+            categories[folder.name] = (folder.path, [entry.name for entry in os.scandir(folder.path) if not entry.is_dir()])
+
+        return categories
+
+    def get_structure_cache_path(self) -> str:
+        name = hashlib.sha256(os.path.abspath(self.path).encode()).hexdigest()
+        return os.path.join(gl.DATA_PATH, "cache", "icon_packs", f"{name}.json")
+
+    def load_structure_cache(self) -> dict[str, tuple[str, list[str]]]:
+        try:
+            with open(self.get_structure_cache_path()) as f:
+                cache = json.load(f)
+            categories = {name: (folder, files) for name, (folder, files) in cache["categories"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if list(cache.get("signature", [])) != list(self.get_signature(categories)):
+            return None
+        return categories
+
+    def save_structure_cache(self, categories: dict[str, tuple[str, list[str]]]) -> None:
+        path = self.get_structure_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_save_json(path, {
+                "signature": list(self.get_signature(categories)),
+                "categories": {name: [folder, files] for name, (folder, files) in categories.items()}
+            }, indent=None)
+        except OSError as e:
+            log.warning(f"Failed to save the structure cache of icon pack {self.path}: {e}")
\ No newline at end of file
@@ -13,11 +13,15 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+# Import gtk modules
+from gi.repository import Gio
+
 # Import Python modules
 from functools import lru_cache
 import json
 import os
 import shutil
+import threading
 from sys import maxsize
 from loguru import logger as log
 
@@ -29,19 +33,61 @@ import globals as gl
 
 class IconPackManager:
     def __init__(self):
-        self.packs = {}
+        # Pack path -> pack, kept until something in the pack folder changes
+        self.packs: dict[str, IconPack] = {}
+        self.monitors: dict[str, list[Gio.FileMonitor]] = {}
+        self.packs_lock = threading.RLock()
 
     def get_icon_packs(self) -> dir:
         packs = {}
         os.makedirs(os.path.join(gl.DATA_PATH, "icons"), exist_ok=True)
         for pack in os.listdir(os.path.join(gl.DATA_PATH, "icons")):
-            icon_pack = IconPack(os.path.join(gl.DATA_PATH, "icons", pack))
+            icon_pack = self.get_pack(os.path.join(gl.DATA_PATH, "icons", pack))
             if icon_pack.is_valid:
                 packs[pack] = icon_pack
             else:
                 log.warning(f"Icon pack {pack} is not valid.")
         return packs
 
+    def get_pack(self, path: str) -> IconPack:
+        """The pack at the given path, only read again once it changed on disk"""
+        with self.packs_lock:
+            pack = self.packs.get(path)
+            if pack is None:
+                pack = IconPack(path)
+                self.packs[path] = pack
+                self.watch_pack(pack)
+            return pack
+
+    def invalidate_pack(self, path: str) -> None:
+        with self.packs_lock:
+            self.packs.pop(path, None)
+            for monitor in self.monitors.pop(path, []):
+                monitor.cancel()
+
+    def watch_pack(self, pack: IconPack) -> None:
+        # Monitors are not recursive, so the category folders need their own
+        folders = [pack.path]
+        if pack.icons_path is not None:
+            folders.append(pack.icons_path)
+            folders.extend(entry.path for entry in os.scandir(pack.icons_path) if entry.is_dir())
+
+        monitors = []
+        for folder in folders:
+            try:
+                monitor = Gio.File.new_for_path(folder).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+            except Exception as e:
+                log.warning(f"Failed to watch {folder}, icon pack changes will not be noticed: {e}")
+                continue
+            monitor.connect("changed", self.on_pack_changed, pack.path)
+            monitors.append(monitor)
+        self.monitors[pack.path] = monitors
+
+    def on_pack_changed(self, monitor, file, other_file, event_type, pack_path: str) -> None:
+        if event_type in (Gio.FileMonitorEvent.ATTRIBUTE_CHANGED, Gio.FileMonitorEvent.CHANGES_DONE_HINT):
+            return
+        self.invalidate_pack(pack_path)
+
     def get_all_icon_packs(self) -> list[IconPack]:
         """
         All packs the user has available: the ones from the store and the locally created ones.
@@ -23,10 +23,13 @@ used as a fallback for typos.
 
 Every icon has to be matched on every key press, so the hot path stays free of
 regexes and of anything that builds new strings per icon (Icon pre computes its
-lowercase name and category).
+lowercase name and category). For big libraries a SearchIndex narrows the icons
+down to the ones that can match at all before they are scored.
 """
 
 # Import python modules
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from operator import attrgetter
 
@@ -129,6 +132,118 @@ def score_icon(icon: "Icon", tokens: list[Token], match_pack_name: bool = False)
     return total / len(tokens)
 
 
+def _ngrams(text: str) -> set[str]:
+    """The characters and trigrams of the text"""
+    grams = set(text)
+    grams.update(text[i:i + 3] for i in range(len(text) - 2))
+    return grams
+
+
+def _intersect(postings: dict[str, set[str]], grams, within: set[str] = None) -> set[str]:
+    sets = [] if within is None else [within]
+    for gram in grams:
+        paths = postings.get(gram)
+        if not paths:
+            return set()
+        sets.append(paths)
+    if not sets:
+        return set()
+    sets.sort(key=len)
+    return sets[0].intersection(*sets[1:])
+
+
+class SearchIndex:
+    """
+    Postings of the characters and trigrams of the icon names and categories,
+    mapping to icon paths (icons are recreated whenever a pack is read again).
+
+    Only narrows down, the ranking is still done by score_icon. A name can only
+    match, typos included, if it contains every character of the token, so the
+    name side is looked up by characters. Categories are only matched as
+    substrings, so their trigrams are used.
+    """
+    # Candidates of recent tokens, a longer token only has to filter these
+    CANDIDATE_CACHE_SIZE = 64
+
+    def __init__(self, icons: list["Icon"]):
+        self.name_postings: dict[str, set[str]] = {}
+        self.category_postings: dict[str, set[str]] = {}
+        self.pack_paths: dict[str, set[str]] = {}
+
+        for icon in icons:
+            for gram in _ngrams(icon.search_name):
+                self.name_postings.setdefault(gram, set()).add(icon.path)
+            for gram in _ngrams(icon.search_category):
+                self.category_postings.setdefault(gram, set()).add(icon.path)
+            self.pack_paths.setdefault(icon.icon_pack.name.lower(), set()).add(icon.path)
+
+        self.candidates: OrderedDict[tuple[str, bool], set[str]] = OrderedDict()
+        self.candidates_lock = threading.Lock()
+
+    def get_candidates(self, token: Token, match_pack_name: bool = False) -> set[str]:
+        """Paths of the icons that may match the token"""
+        key = (token.text, match_pack_name)
+        with self.candidates_lock:
+            cached = self.candidates.get(key)
+            if cached is not None:
+                self.candidates.move_to_end(key)
+                return cached
+
+            # Whatever matches "batt" is among the matches of "bat"
+            base = None
+            for end in range(len(token.text) - 1, 0, -1):
+                base = self.candidates.get((token.text[:end], match_pack_name))
+                if base is not None:
+                    break
+
+        candidates = _intersect(self.name_postings, token.chars, base)
+        if len(token.text) >= 3:
+            candidates |= _intersect(self.category_postings, [token.text[i:i + 3] for i in range(len(token.text) - 2)], base)
+        else:
+            candidates |= _intersect(self.category_postings, token.chars, base)
+        if match_pack_name:
+            for pack_name, paths in self.pack_paths.items():
+                if token.text in pack_name:
+                    candidates |= paths if base is None else paths & base
+
+        with self.candidates_lock:
+            self.candidates[key] = candidates
+            while len(self.candidates) > self.CANDIDATE_CACHE_SIZE:
+                self.candidates.popitem(last=False)
+        return candidates
+
+
+# pack path -> (signature, index)
+_pack_indexes: dict[str, tuple[tuple, SearchIndex]] = {}
+_pack_indexes_lock = threading.Lock()
+
+
+def get_pack_index(pack, icons: list["Icon"]) -> SearchIndex:
+    """The index of the pack, only rebuilt when the pack changed on disk"""
+    signature = pack.get_search_signature()
+    with _pack_indexes_lock:
+        cached = _pack_indexes.get(pack.path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    index = SearchIndex(icons)
+    with _pack_indexes_lock:
+        _pack_indexes[pack.path] = (signature, index)
+    return index
+
+
+def get_indexes(icons: list["Icon"]) -> list[SearchIndex]:
+    """The indexes covering the given icons, one per pack"""
+    by_pack: dict[str, tuple] = {}
+    for icon in icons:
+        entry = by_pack.get(icon.icon_pack.path)
+        if entry is None:
+            by_pack[icon.icon_pack.path] = (icon.icon_pack, [icon])
+        else:
+            entry[1].append(icon)
+    return [get_pack_index(pack, pack_icons) for pack, pack_icons in by_pack.values()]
+
+
 def sort_icons(icons: list["Icon"], group_by_pack: bool = False) -> list["Icon"]:
     """
     The order used when nothing is searched: icons of the same category stay
@@ -139,15 +254,28 @@ def sort_icons(icons: list["Icon"], group_by_pack: bool = False) -> list["Icon"]
     return sorted(icons, key=attrgetter("sort_key"))
 
 
-def search_icons(icons: list["Icon"], query: str, match_pack_name: bool = False) -> list["Icon"]:
+def search_icons(icons: list["Icon"], query: str, match_pack_name: bool = False,
+                 indexes: list[SearchIndex] = None) -> list["Icon"]:
     """
     The icons matching the query, best match first. Returns all icons in their
-    browse order if the query is empty.
+    browse order if the query is empty. With indexes (see get_indexes) only the
+    icons that can match are scored.
     """
     tokens = prepare_query(query)
     if not tokens:
         return sort_icons(icons, group_by_pack=match_pack_name)
 
+    if indexes is not None:
+        candidates = None
+        for token in tokens:
+            token_candidates = set()
+            for index in indexes:
+                token_candidates |= index.get_candidates(token, match_pack_name=match_pack_name)
+            candidates = token_candidates if candidates is None else candidates & token_candidates
+            if not candidates:
+                return []
+        icons = [icon for icon in icons if icon.path in candidates]
+
     matches = []
     for icon in icons:
         score = score_icon(icon, tokens, match_pack_name=match_pack_name)
@@ -30,6 +30,7 @@ import ipaddress
 import os
 import re
 import socket
+from functools import lru_cache
 
 # Hosts of our own infrastructure, plus loopback. Redacting these would only
 # make store and update problems harder to debug without hiding anything
@@ -56,6 +57,11 @@ GENERIC_NAMES = {
 # names ("pi", "sc") show up inside unrelated words all the time.
 MIN_NAME_LENGTH = 4
 
+# Chatty plugins log the same few lines over and over, those are only run
+# through the patterns once. Long messages are rarely repeated and not kept.
+CACHE_SIZE = 1024
+MAX_CACHED_LENGTH = 512
+
 # Both patterns match loosely and leave the decision to _replace_ip(), which
 # runs the candidate through the ipaddress module. That is both more accurate
 # and a lot cheaper than a precise IPv6 regex, which backtracks heavily on
@@ -162,6 +168,7 @@ class Redactor:
             re.IGNORECASE,
         )
         self.replacements = {name: replacement for name, _, replacement in rules}
+        self._redact_cached = lru_cache(maxsize=CACHE_SIZE)(self._redact)
 
     def _substitute(self, match: re.Match) -> str:
         for name, replacement in self.replacements.items():
@@ -178,6 +185,11 @@ class Redactor:
         """
         if not text:
             return text
+        if len(text) > MAX_CACHED_LENGTH:
+            return self._redact(text)
+        return self._redact_cached(text)
+
+    def _redact(self, text: str) -> str:
         return self.pattern.sub(self._substitute, text)
 
 
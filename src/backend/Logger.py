@@ -65,32 +65,46 @@ class Logger:
         self.config = config
         self.log_level: dict[str, Loglevel] = {}
 
+        # Dotted path relative to the data dir, per source file
+        self.relative_paths: dict[str, str] = {}
+        # loguru finds the caller itself (depth=1 skips log_method), and only after checking that
+        # any sink wants the level - filtered out calls cost next to nothing
+        self.logger = logger.patch(self.patch_record).opt(depth=1)
+
         for level in log_level:
             self.add_log_level(level)
             self.log_level[level.name] = level
         self.add_sink()
 
     def add_log_level(self, log_level: Loglevel):
+        level_name = f"{self.name}_{log_level.name}"
         logger.level(
-            name=f"{self.name}_{log_level.name}",
+            name=level_name,
             no=log_level.priority,
             color=f"{log_level.color}")
 
+        plugin_logger = self.logger
+
         def log_method(self, message, *args, **kwargs):
-            caller = inspect.stack()[1]
-            function_name = caller.function
-            line_number = caller.lineno
+            plugin_logger.log(level_name, message, *args, **kwargs)
 
-            file_path = caller.filename
-            base_path = gl.DATA_PATH
+        setattr(self, log_level.method_name, log_method.__get__(self))
 
-            relative_path = os.path.relpath(file_path, base_path)  # Get relative path
+    def patch_record(self, record: dict) -> None:
+        """Adds where the message comes from in the form the plugin sink prints"""
+        extra = record["extra"]
+        extra["file_name"] = self.get_relative_path(record["file"].path)
+        extra["function"] = record["function"]
+        extra["line"] = record["line"]
+
+    def get_relative_path(self, file_path: str) -> str:
+        relative_path = self.relative_paths.get(file_path)
+        if relative_path is None:
+            relative_path = os.path.relpath(file_path, gl.DATA_PATH)  # Get relative path
             relative_path = os.path.splitext(relative_path)[0]  # Remove .py extension
             relative_path = relative_path.replace(os.sep, ".")  # Convert to dot notation
-
-            logger.log(f"{self.name}_{log_level.name}", message, file_name=relative_path, function=function_name, line=line_number)
-
-        setattr(self, log_level.method_name, log_method.__get__(self))
+            self.relative_paths[file_path] = relative_path
+        return relative_path
 
     def add_sink(self):
         def log_filter(record):
@@ -13,60 +13,147 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 # Import Python modules
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
+import hashlib
 import os
+import threading
 import cv2
 import cairosvg
+from loguru import logger as log
 from PIL import Image, ImageSequence
 
+from gi.repository import GLib, GdkPixbuf
+
 import os, psutil
 process = psutil.Process()
 
 # Import own modules
-from src.backend.DeckManagement.HelperMethods import is_svg, sha256, file_in_dir, svg_to_pil
+from src.backend.DeckManagement.HelperMethods import is_svg, is_video, sha256, file_in_dir, svg_to_pil
+from src.backend.DeckManagement.ImageHelpers import pixbuf2image
+from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
 
 
 # Import globals
 import globals as gl
 
 class MediaManager:
+    THUMBNAIL_SIZE = (250, 250)
+    # Decoded thumbnails kept in memory
+    MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+    # Thumbnail PNGs on disk, thumbnails of changed or removed files are never asked for again
+    DISK_CACHE_BYTES = 64 * 1024 * 1024
+
     def __init__(self):
-        pass
+        self.thumbnail_dir = os.path.join(gl.DATA_PATH, "cache", "thumbnails")
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+        self.thumbnail_disk_budget = DiskCacheBudget(self.thumbnail_dir, self.DISK_CACHE_BYTES, suffix=".png")
+
+        self.thumbnails: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.thumbnails_bytes = 0
+        self.thumbnails_lock = threading.Lock()
+
+        # Background generation, requests for the same file share one job
+        self.thumbnail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnail")
+        self.pending_thumbnails: dict[tuple, list[callable]] = {}
+
+    def get_thumbnail_key(self, file_path: str) -> tuple:
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def get_thumbnail_path(self, key: tuple) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.thumbnail_dir, f"{name}.png")
 
     def get_thumbnail(self, file_path):
-        hash = sha256(file_path)
-
-        thumbnail_dir = os.path.join(gl.DATA_PATH, "cache", "thumbnails")
-        thumbnail_path = os.path.join(thumbnail_dir, f"{hash}.png")
-        
-        os.makedirs(thumbnail_dir, exist_ok=True)
-
-        
-        # Check if thumbnail has already been cached:
-        cached = file_in_dir(f"{hash}.png", thumbnail_dir)
-        if cached is None:
-            cached = False
-
-        if cached:
-            img = Image.open(thumbnail_path)
-            img.thumbnail((250, 250), resample=Image.Resampling.LANCZOS)
-            return img
+        """Returns a copy of the thumbnail, generating it if needed. Blocks, see get_thumbnail_async."""
+        key = self.get_thumbnail_key(file_path)
+
+        with self.thumbnails_lock:
+            cached = self.thumbnails.get(key)
+            if cached is not None:
+                self.thumbnails.move_to_end(key)
+                return cached.copy()
+
+        thumbnail_path = self.get_thumbnail_path(key)
+        if os.path.exists(thumbnail_path):
+            with Image.open(thumbnail_path) as img:
+                thumbnail = img.copy()
+            self.thumbnail_disk_budget.touch(thumbnail_path)
         else:
             thumbnail = self.generate_thumbnail(file_path)
-            thumbnail.thumbnail((250, 250), resample=Image.Resampling.LANCZOS)
+            thumbnail.thumbnail(self.THUMBNAIL_SIZE, resample=Image.Resampling.LANCZOS)
             thumbnail.save(thumbnail_path)
-            return thumbnail
+            self.thumbnail_disk_budget.add(thumbnail_path)
+
+        self._remember_thumbnail(key, thumbnail)
+        return thumbnail.copy()
+
+    def get_thumbnail_async(self, file_path: str, callback: callable) -> None:
+        """
+        Generates the thumbnail in the background and calls callback(image) on the GTK main loop,
+        with None if it failed. Thumbnails already in memory are handed over right away.
+        """
+        try:
+            key = self.get_thumbnail_key(file_path)
+        except OSError as e:
+            log.warning(f"Failed to get thumbnail for {file_path}: {e}")
+            GLib.idle_add(callback, None)
+            return
+
+        with self.thumbnails_lock:
+            cached = self.thumbnails.get(key)
+            if cached is not None:
+                self.thumbnails.move_to_end(key)
+                GLib.idle_add(callback, cached.copy())
+                return
+
+            callbacks = self.pending_thumbnails.get(key)
+            if callbacks is not None:
+                callbacks.append(callback)
+                return
+            self.pending_thumbnails[key] = [callback]
+
+        self.thumbnail_executor.submit(self._generate_pending_thumbnail, key, file_path)
+
+    def _generate_pending_thumbnail(self, key: tuple, file_path: str) -> None:
+        try:
+            thumbnail = self.get_thumbnail(file_path)
+        except Exception as e:
+            log.warning(f"Failed to generate thumbnail for {file_path}: {e}")
+            thumbnail = None
+
+        with self.thumbnails_lock:
+            callbacks = self.pending_thumbnails.pop(key, [])
+        for callback in callbacks:
+            GLib.idle_add(callback, None if thumbnail is None else thumbnail.copy())
+
+    def _remember_thumbnail(self, key: tuple, thumbnail: Image.Image) -> None:
+        size = thumbnail.width * thumbnail.height * len(thumbnail.getbands())
+        if size > self.MEMORY_CACHE_BYTES:
+            return
+        with self.thumbnails_lock:
+            old = self.thumbnails.pop(key, None)
+            if old is not None:
+                self.thumbnails_bytes -= old.width * old.height * len(old.getbands())
+            self.thumbnails[key] = thumbnail.copy()
+            self.thumbnails_bytes += size
+            while self.thumbnails_bytes > self.MEMORY_CACHE_BYTES:
+                _, evicted = self.thumbnails.popitem(last=False)
+                self.thumbnails_bytes -= evicted.width * evicted.height * len(evicted.getbands())
 
     def generate_thumbnail(self, file_path):
-        if os.path.splitext(file_path)[1] in [".jpg", ".jpeg", ".png"]:
-            return self.generate_image_thumbnail(file_path)
-        elif os.path.splitext(file_path)[1] in [".gif", ".GIF"]:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == ".gif":
             return self.generate_gif_thumbnail(file_path)
         elif is_svg(file_path):
             return self.generate_svg_thumbnail(file_path)
+        elif is_video(file_path):
+            return self.generate_video_thumbnail(file_path)
         else:
-            thumbnail = self.generate_video_thumbnail(file_path)
-            return thumbnail
+            # Everything else is an image - jpg, png, webp, bmp, ... in any case
+            return self.generate_image_thumbnail(file_path)
 
     def generate_video_thumbnail(self, video_path: str) -> Image.Image:
         cap = cv2.VideoCapture(video_path)
@@ -82,19 +169,16 @@ class MediaManager:
         return svg_to_pil(file_path, 1024)
 
     def generate_image_thumbnail(self, file_path):
-        return Image.open(file_path)
+        try:
+            return Image.open(file_path)
+        except OSError:
+            # Formats PIL can't open, GdkPixbuf may have a loader for them
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(file_path, *self.THUMBNAIL_SIZE, True)
+            return pixbuf2image(pixbuf)
     
     def generate_gif_thumbnail(self, file_path):
         # This is the same as load_video but with transparency support
-        gif = Image.open(file_path)
-        iterator = ImageSequence.Iterator(gif)
-        n_frames = 0
-        for frame in iterator: n_frames += 1 #TODO: Find a better way to do this
-        frame = iterator[n_frames // 2] # Gifs tend to have a empty frame at the beginning
-        frame = frame.convert("RGBA")
-
-        gif = None
-        iterator = None
-        n_frames = None
-
-        return frame
\ No newline at end of file
+        with Image.open(file_path) as gif:
+            # Gifs tend to have a empty frame at the beginning
+            gif.seek(getattr(gif, "n_frames", 1) // 2)
+            return gif.convert("RGBA")
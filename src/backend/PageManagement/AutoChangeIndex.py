@@ -0,0 +1,151 @@
+"""
+Author: Core447
+Year: 2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+from loguru import logger as log
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.backend.PageManagement.PageManagerBackend import PageManagerBackend
+    from src.backend.WindowGrabber.Window import Window
+
+REGEX_SPECIAL_CHARS = set(".^$*+?{}[]\\|()")
+
+
+def literal_prefix(pattern: str) -> str:
+    """
+    The literal text every match of `pattern` has to contain, lowercased - "" if there
+    is none that can be told without actually running the regex.
+    """
+    if "|" in pattern:
+        # Alternations can match without any of the text
+        return ""
+
+    if pattern.startswith("^"):
+        pattern = pattern[1:]
+
+    prefix = ""
+    for char in pattern:
+        if char in REGEX_SPECIAL_CHARS:
+            # A quantifier makes the char in front of it optional
+            if char in "*?{" and prefix:
+                prefix = prefix[:-1]
+            break
+        prefix += char
+    return prefix.lower()
+
+
+@dataclass
+class AutoChangeRule:
+    page_path: str
+    wm_class: re.Pattern
+    title: re.Pattern
+    # Cheap substring check done before the regexes
+    wm_class_literal: str
+    stay_on_page: bool
+
+    def matches(self, window: "Window") -> bool:
+        if window.wm_class is None or window.title is None:
+            return False
+        if self.wm_class_literal and self.wm_class_literal not in window.wm_class.lower():
+            return False
+        return self.wm_class.search(window.wm_class) is not None and self.title.search(window.title) is not None
+
+
+class AutoChangeIndex:
+    """
+    The auto change settings of all pages, read once and grouped by the deck they
+    apply to, so a focus change doesn't have to load every page file.
+
+    It is rebuilt once a page file in the page folder was written, added or removed
+    (all of which change the folder's mtime) or invalidate() was called.
+    """
+    def __init__(self, page_manager: "PageManagerBackend"):
+        self.page_manager = page_manager
+        self.lock = threading.Lock()
+
+        self.rules: dict[str, list[AutoChangeRule]] = {}
+        self.settings: dict[str, dict] = {}
+        self._signature: tuple = None
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self._signature = None
+
+    def _get_signature(self) -> tuple:
+        try:
+            folder_mtime = os.stat(self.page_manager.PAGE_PATH).st_mtime_ns
+        except OSError:
+            folder_mtime = None
+        return (folder_mtime, tuple(self.page_manager.custom_pages))
+
+    def _ensure_built(self) -> None:
+        signature = self._get_signature()
+        with self.lock:
+            if signature == self._signature:
+                return
+
+            rules: dict[str, list[AutoChangeRule]] = {}
+            settings: dict[str, dict] = {}
+            for page_path in self.page_manager.get_pages():
+                info = self.page_manager.get_auto_change_settings(page_path)
+                settings[page_path] = info
+                if not info.get("enable", False):
+                    continue
+
+                wm_class = info.get("wm-class", ".*")
+                title = info.get("title", ".*")
+                if wm_class is None or title is None:
+                    continue
+                try:
+                    rule = AutoChangeRule(
+                        page_path=page_path,
+                        wm_class=re.compile(wm_class, re.IGNORECASE),
+                        title=re.compile(title, re.IGNORECASE),
+                        wm_class_literal=literal_prefix(wm_class),
+                        stay_on_page=info.get("stay-on-page", True),
+                    )
+                except re.error as e:
+                    log.warning(f"Invalid auto change regex in {page_path}: {e}")
+                    continue
+
+                for serial_number in info.get("decks", []):
+                    rules.setdefault(serial_number, []).append(rule)
+
+            self.rules = rules
+            self.settings = settings
+            self._signature = signature
+
+    def get_rules(self, serial_number: str) -> list[AutoChangeRule]:
+        """The enabled rules for the deck, in page order."""
+        self._ensure_built()
+        return self.rules.get(serial_number, [])
+
+    def get_settings(self, page_path: str) -> dict:
+        self._ensure_built()
+        settings = self.settings.get(page_path)
+        if settings is None:
+            # Not one of the known pages
+            return self.page_manager.get_auto_change_settings(page_path)
+        return settings
+
+    def find_page(self, serial_number: str, window: "Window") -> str | None:
+        for rule in self.get_rules(serial_number):
+            if rule.matches(window):
+                return rule.page_path
+        return None
@@ -28,14 +28,12 @@ if not gl.IS_MAC:
 
 from loguru import logger as log
 from copy import copy
-import shutil
 
 from numpy import isin
 
 # Import globals
 from src.backend.PluginManager.EventAssigner import EventAssigner
 from src.backend.DeckManagement.ImageHelpers import crop_key_image_from_deck_sized_image
-from src.backend.Utils.AtomicSaveUtils import atomic_save_json
 import globals as gl
 
 from src.backend.PluginManager.ActionCore import ActionCore
@@ -74,7 +72,7 @@ class Page:
         Updates the dict without any updates on the action objects.
         Do NOT use if you made changes to the action objects
         """
-        self.dict = gl.page_manager.get_page_data(self.json_path)
+        self.dict = gl.page_manager.page_store.get(self.json_path)
     
     def load(self, load_from_file: bool = False):
         start = time.time()
@@ -88,40 +86,22 @@ class Page:
 
     def save(self):
         self.file_access_semaphore.acquire()
-        # Make backup in case something goes wrong
-        self.make_backup()
-
-        without_objects = self.get_without_action_objects()
+        self.remove_action_objects_from_dict()
         # Make keys last element
         for type in Input.KeyTypes:
-            self.move_key_to_end(without_objects, type)
-        atomic_save_json(self.json_path, without_objects, indent=4)
+            self.move_key_to_end(self.dict, type)
+        # Written behind by the store, which also takes the backup
+        gl.page_manager.page_store.put(self.json_path, self.dict)
         self.file_access_semaphore.release()
 
         if self.deck_controller is not None and self.deck_controller.sticky_page is self:
             # Which inputs the sticky page takes over may have changed
             self.deck_controller.on_sticky_page_saved()
 
-    def make_backup(self):
-        os.makedirs(os.path.join(gl.DATA_PATH, "pages","backups"), exist_ok=True)
-
-        src_path = self.json_path
-        dst_path = os.path.join(gl.DATA_PATH, "pages","backups", os.path.basename(src_path))
-
-        # Check if json in src is valid
-        with open(src_path) as f:
-            try:
-                json.load(f)
-            except json.decoder.JSONDecodeError as e:
-                log.error(f"Invalid json in {src_path}: {e}")
-                return
-
-        shutil.copy2(src_path, dst_path)
-
     def move_key_to_end(self, dictionary, key):
-        if key in self.dict:
-            value = self.dict.pop(key)
-            self.dict[key] = value
+        if key in dictionary:
+            value = dictionary.pop(key)
+            dictionary[key] = value
 
     def set_background(self, file_path):
         self.dict.setdefault("background", {})
@@ -391,19 +371,16 @@ class Page:
 
         self.save()
 
-    def get_without_action_objects(self):
-        dictionary = copy(self.dict)
+    def remove_action_objects_from_dict(self) -> None:
         for type in Input.KeyTypes:
-            for key in dictionary.get(type, {}):
-                for state in dictionary[type][key].get("states", {}):
-                    if "actions" not in dictionary[type][key]["states"][state]:
+            for key in self.dict.get(type, {}):
+                for state in self.dict[type][key].get("states", {}):
+                    if "actions" not in self.dict[type][key]["states"][state]:
                         continue
-                    for action in dictionary[type][key]["states"][state]["actions"]:
+                    for action in self.dict[type][key]["states"][state]["actions"]:
                         if "object" in action:
                             del action["object"]
 
-        return dictionary
-
     def get_all_actions(self, action_dict: dict = None):
         if action_dict is None:
             action_dict = self.action_objects
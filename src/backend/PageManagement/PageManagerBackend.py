@@ -19,7 +19,10 @@ import gc
 import os
 import shutil
 import json
+import threading
 import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from signal import Signals
 import time
@@ -28,12 +31,15 @@ from typing import Union
 from loguru import logger as log
 
 from src.Signals import Signals
-from src.backend.DeckManagement.DeckController import DeckController
+from src.backend.DeckManagement.DeckController import DeckController, discard_page_media, get_page_media_image, is_page_media_cached
 
 # Import own modules
+from src.backend.PageManagement.AutoChangeIndex import AutoChangeIndex
+from src.backend.PageManagement.PageStore import PageStore
 from src.backend.PageManagement.Page import Page
 from src.backend.PageManagement.DummyPage import DummyPage
-from src.backend.DeckManagement.HelperMethods import get_sub_folders, natural_sort, natural_sort_by_filenames, recursive_hasattr, sort_times
+from src.backend.DeckManagement.HelperMethods import get_sub_folders, is_image, is_svg, natural_sort, natural_sort_by_filenames, recursive_hasattr, sort_times
+from src.backend.DeckManagement.InputIdentifier import Input
 from src.backend.Utils.AtomicSaveUtils import atomic_save_json
 
 # Import globals
@@ -52,10 +58,25 @@ class PageManagerBackend:
         self.max_pages = 3
         self.page_number = 0
 
+        # Pages reachable from the active one are loaded ahead of time, see prefetch_reachable_pages()
+        self.prefetch_budget_bytes = 64 * 1024 * 1024
+        self.prefetch_history_length = 5
+        self.page_history: dict["DeckController", deque[str]] = {}
+        # Prefetched page paths with the (media path, is svg) their prefetch decoded and the size of it and the json, oldest first
+        self.prefetched_pages: OrderedDict[str, tuple[list[tuple[str, bool]], int]] = OrderedDict()
+        # A single worker, so prefetching never competes with the page that is actually shown
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+        self.pages_lock = threading.RLock()
+
         self.MAX_BACKUPS = 5
         self.PAGE_PATH = os.path.join(gl.DATA_PATH, "pages")
         self.PAGE_SETTINGS_PATH = os.path.join(gl.DATA_PATH, "settings", "pages.json")
 
+        # Parsed page jsons, shared by all Page objects of a file
+        self.page_store = PageStore(backup_dir=os.path.join(self.PAGE_PATH, "backups"))
+
+        self.auto_change_index = AutoChangeIndex(self)
+
     def load_page(self, path: str, deck_controller: "DeckController") -> Page:
         """
         This loads the page into the page dict and increases the current page number.
@@ -67,22 +88,26 @@ class PageManagerBackend:
             return None
 
         page = Page(json_path=path, deck_controller=deck_controller)
-        self.pages.setdefault(deck_controller, {})
-        self.pages[deck_controller][path] = {"page": page, "page_number": self.page_number}
-        self.page_number += 1
+        with self.pages_lock:
+            # Its json and media belong to a shown page now, they must not be evicted with the prefetched ones
+            self.prefetched_pages.pop(path, None)
+            self.pages.setdefault(deck_controller, {})
+            self.pages[deck_controller][path] = {"page": page, "page_number": self.page_number}
+            self.page_number += 1
 
         return page
 
     def get_page(self, path: str, deck_controller: "DeckController") -> Page:
-        page = self.pages.get(deck_controller, {}).get(path, {})
-
-        if not page:
-            page_object = self.load_page(path, deck_controller)
-            #self.clear_old_cached_pages()
-        else:
-            page["page_number"] = self.page_number
-            page_object = page["page"]
-            self.page_number += 1
+        with self.pages_lock:
+            page = self.pages.get(deck_controller, {}).get(path, {})
+
+            if not page:
+                page_object = self.load_page(path, deck_controller)
+                #self.clear_old_cached_pages()
+            else:
+                page["page_number"] = self.page_number
+                page_object = page["page"]
+                self.page_number += 1
 
         if gl.argparser.parse_args().daemon_only:
             self.clear_old_cached_pages()
@@ -148,6 +173,156 @@ class PageManagerBackend:
                     del controller_pages[path]
                     break
 
+    def prefetch_reachable_pages(self, deck_controller: "DeckController") -> None:
+        """
+        Parses the pages that are likely to be shown next on the deck into the page store and
+        decodes their media in the background: targets of page switch actions on the active page,
+        pages that can be switched to automatically and the recently shown pages.
+        No Page is created here - action objects register listeners, start threads and
+        launch backends, which only pages that actually get shown should do.
+        """
+        if not self.settings_manager.get_app_settings_snapshot().get("performance", {}).get("prefetch-pages", True):
+            return
+        active_page = deck_controller.active_page
+        if active_page is None:
+            return
+
+        history = self.page_history.setdefault(deck_controller, deque(maxlen=self.prefetch_history_length))
+        if active_page.json_path in history:
+            history.remove(active_page.json_path)
+        history.appendleft(active_page.json_path)
+
+        try:
+            self.prefetch_executor.submit(self._prefetch_pages, deck_controller, active_page)
+        except RuntimeError:
+            # Shut down
+            pass
+
+    def get_reachable_page_paths(self, deck_controller: "DeckController", page: Page) -> list[str]:
+        paths: list[str] = []
+
+        def add(path: str) -> None:
+            if path and path != page.json_path and path not in paths:
+                paths.append(path)
+
+        # Page switch actions - the most likely next page comes first
+        for input_type in Input.All:
+            for input_dict in page.dict.get(input_type.input_type, {}).values():
+                for state_dict in input_dict.get("states", {}).values():
+                    for action in state_dict.get("actions", []):
+                        selected_page = (action.get("settings") or {}).get("selected_page")
+                        if isinstance(selected_page, str):
+                            add(self.find_matching_page_path(selected_page))
+
+        # Pages the window grabber may switch this deck to
+        for rule in self.auto_change_index.get_rules(deck_controller.safe_serial_number()):
+            add(rule.page_path)
+
+        for path in self.page_history.get(deck_controller, []):
+            add(path)
+
+        return paths
+
+    def _is_page_loaded(self, path: str) -> bool:
+        with self.pages_lock:
+            return any(path in controller_pages for controller_pages in self.pages.values())
+
+    def _prefetch_pages(self, deck_controller: "DeckController", page: Page) -> None:
+        start = time.time()
+        n_loaded = 0
+        for path in self.get_reachable_page_paths(deck_controller, page):
+            if deck_controller.active_page is not page:
+                # The deck moved on, prefetch for its new page instead
+                return
+            if not os.path.isfile(path):
+                continue
+
+            with self.pages_lock:
+                if path in self.prefetched_pages:
+                    self.prefetched_pages.move_to_end(path)
+                    continue
+            if self._is_page_loaded(path):
+                continue
+
+            try:
+                media, n_bytes = self._prefetch_page_media(self.page_store.get(path))
+                n_bytes += os.path.getsize(path)
+            except Exception as e:
+                log.error(f"Failed to prefetch page {path}: {e}")
+                continue
+
+            with self.pages_lock:
+                if not self._is_page_loaded(path):
+                    self.prefetched_pages[path] = (media, n_bytes)
+            n_loaded += 1
+
+        self.clear_prefetched_pages()
+        if n_loaded > 0:
+            log.debug(f"[page-prefetch] deck={deck_controller.safe_serial_number()} page={page.get_name()} loaded={n_loaded} ms={(time.time() - start) * 1000:.1f}")
+
+    @staticmethod
+    def _get_page_media_paths(page_dict: dict) -> list[str]:
+        paths = []
+        for input_type in Input.All:
+            for input_dict in page_dict.get(input_type.input_type, {}).values():
+                for state_dict in input_dict.get("states", {}).values():
+                    path = state_dict.get("media", {}).get("path")
+                    if path not in ["", None] and path not in paths:
+                        paths.append(path)
+        return paths
+
+    def _prefetch_page_media(self, page_dict: dict) -> tuple[list[tuple[str, bool]], int]:
+        """
+        Decodes the key images of the page into the media caches.
+        Returns the (path, is svg) this decoded - not the ones that were cached already - and their size in bytes.
+        """
+        decoded = []
+        n_bytes = 0
+        for path in self._get_page_media_paths(page_dict):
+            if not os.path.isfile(path):
+                continue
+            if is_image(path):
+                svg = False
+            elif is_svg(path):
+                svg = True
+            else:
+                continue
+            if is_page_media_cached(path, svg):
+                continue
+            try:
+                image = get_page_media_image(path, is_svg_media=svg)
+            except Exception as e:
+                log.warning(f"Failed to prefetch media {path}: {e}")
+                continue
+            decoded.append((path, svg))
+            n_bytes += image.width * image.height * len(image.getbands())
+            image.close()
+        return decoded, n_bytes
+
+    def clear_prefetched_pages(self) -> None:
+        """
+        Drops the json and media of the least recently prefetched pages until they fit into
+        prefetch_budget_bytes. Media that a loaded page or another prefetched page shows is kept.
+        """
+        with self.pages_lock:
+            total = sum(n_bytes for _, n_bytes in self.prefetched_pages.values())
+            while total > self.prefetch_budget_bytes and self.prefetched_pages:
+                path, (media, n_bytes) = self.prefetched_pages.popitem(last=False)
+                total -= n_bytes
+                if not self._is_page_loaded(path):
+                    self.page_store.evict(path)
+
+                in_use = set()
+                for controller_pages in self.pages.values():
+                    for page_data in controller_pages.values():
+                        in_use.update(self._get_page_media_paths(page_data["page"].dict))
+                for other_media, _ in self.prefetched_pages.values():
+                    in_use.update(media_path for media_path, _ in other_media)
+
+                for media_path, svg in media:
+                    if media_path not in in_use:
+                        discard_page_media(media_path, svg)
+
     def get_default_page(self, deck_serial_number: str):
         page_settings = self.settings_manager.load_settings_from_file(self.PAGE_SETTINGS_PATH)
         page_path = page_settings.get("default-pages", {}).get(deck_serial_number, None)
@@ -194,6 +369,7 @@ class PageManagerBackend:
             self.clear_old_cached_pages()
 
     def move_page(self, old_path: str, new_path: str):
+        self.page_store.flush(old_path)
         shutil.copy2(old_path, new_path)
 
         page_settings = gl.settings_manager.load_settings_from_file(self.PAGE_SETTINGS_PATH)
@@ -222,7 +398,8 @@ class PageManagerBackend:
         gl.settings_manager.save_settings_to_file(self.PAGE_SETTINGS_PATH, page_settings)
 
         os.remove(old_path)
-        #self.update_auto_change_info()
+        self.page_store.forget(old_path)
+        self.auto_change_index.invalidate()
 
     def remove_page(self, page_path: str):
         settings_path = os.path.join(gl.DATA_PATH, "settings", "pages.json")
@@ -266,6 +443,7 @@ class PageManagerBackend:
                     del self.pages[controller]
 
         # Delete the JSON file representing the page
+        self.page_store.forget(page_path)
         if os.path.exists(page_path):
             os.remove(page_path)
 
@@ -289,7 +467,7 @@ class PageManagerBackend:
         
         atomic_save_json(path, page_dict)
 
-        #self.update_auto_change_info()
+        self.auto_change_index.invalidate()
         return path
 
     def register_page(self, path: str):
@@ -302,7 +480,7 @@ class PageManagerBackend:
 
         gl.signal_manager.trigger_signal(Signals.PageAdd, path)
 
-        # self.update_auto_change_info()
+        self.auto_change_index.invalidate()
 
     def unregister_page(self, path: str):
         if not self.custom_pages.__contains__(path):
@@ -311,6 +489,8 @@ class PageManagerBackend:
         self.custom_pages.remove(path)
         gl.signal_manager.trigger_signal(Signals.PageDelete, path)
 
+        self.auto_change_index.invalidate()
+
     def get_pages_with_path(self, path: str):
         pages_set = set()
 
@@ -369,12 +549,14 @@ class PageManagerBackend:
         backup_path = os.path.join(self.PAGE_PATH, "backups", os.path.basename(path))
 
         if not os.path.exists(path) and os.path.exists(backup_path) and use_backup:
-            path = backup_path
+            return self.settings_manager.load_settings_from_file(backup_path)
 
-        return self.settings_manager.load_settings_from_file(path)
+        # A copy, callers are free to modify it - Page objects share the store's dict instead
+        return self.page_store.get_copy(path)
 
     def set_page_data(self, path: str, data: dict, reload_brightness: bool = True, reload_screensaver: bool = True, reload_background: bool = True, reload_inputs: bool = True):
-        self.settings_manager.save_settings_to_file(path, data)
+        self.page_store.put(path, data)
+        self.auto_change_index.invalidate()
         self.update_dict_of_pages_with_path(path)
         if any([reload_brightness, reload_screensaver, reload_background, reload_inputs]):
             self.reload_pages_with_path(path,
@@ -395,9 +577,8 @@ class PageManagerBackend:
         for page_path in self.get_pages():
             page_had_asset = False  # Flag to track if this page had the asset
 
-            # Open and load JSON page data
-            with open(page_path, "r") as f:
-                page_dict = json.load(f)
+            # Load JSON page data
+            page_dict = self.page_store.get_copy(page_path)
 
             # Safely get keys dictionary from page data
             keys = page_dict.get("keys", {})
@@ -425,7 +606,7 @@ class PageManagerBackend:
             # If any asset was removed, update page file and reload pages
             if page_had_asset:
                 # Write updated page data back to file with pretty JSON
-                atomic_save_json(page_path, page_dict, indent=4)
+                self.page_store.put(page_path, page_dict)
 
                 # Update internal cache or tracking dict with this page path
                 self.update_dict_of_pages_with_path(page_path)
@@ -468,6 +649,9 @@ class PageManagerBackend:
         # Ensure backup directory exists
         os.makedirs(os.path.dirname(backup_zip_path), exist_ok=True)
 
+        # Pending edits belong into the backup
+        self.page_store.flush_all()
+
         # Create a zip archive and add all page files
         with zipfile.ZipFile(backup_zip_path, mode="w", compression=zipfile.ZIP_DEFLATED) as backup_zip:
             for page_path in self.get_pages():
@@ -522,12 +706,11 @@ class PageManagerBackend:
 
         data = self.get_page_data(path, False)
         data["settings"] = settings
-        self.settings_manager.save_settings_to_file(path, data)
+        self.page_store.put(path, data)
+        # Custom pages can live outside of the page folder
+        self.auto_change_index.invalidate()
 
-        for controller in gl.deck_manager.deck_controller:
-            if controller.active_page.json_path != path:
-                continue
-            controller.active_page.dict = data
+        self.update_dict_of_pages_with_path(path)
 
     def get_auto_change_settings(self, path: str) -> dict:
         """
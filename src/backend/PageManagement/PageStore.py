@@ -0,0 +1,51 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import os
+import shutil
+
+from loguru import logger as log
+
+from src.backend.Utils.JsonFileStore import JsonFileEntry, JsonFileStore
+
+# Changes to a page within this many seconds end up in a single write
+PAGE_SAVE_DELAY = 0.5
+
+
+class PageStore(JsonFileStore):
+    """
+    Parsed page jsons, shared by every Page bound to the same file.
+    A file is only read again if its mtime or size changed. Saves are written behind,
+    a burst of edits results in one write and one backup instead of one per change.
+    """
+    def __init__(self, backup_dir: str = None, save_delay: float = PAGE_SAVE_DELAY):
+        super().__init__(save_delay=save_delay)
+        self.backup_dir = backup_dir
+
+    def _make_backup(self, path: str, entry: JsonFileEntry) -> None:
+        if self.backup_dir is None or not os.path.isfile(path):
+            return
+
+        # A file this store parsed or wrote itself is valid json, anything else gets checked first
+        if not entry.valid or entry.stat_key != self._get_stat_key(path):
+            try:
+                with open(path) as f:
+                    json.load(f)
+            except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
+                log.error(f"Invalid json in {path}: {e}")
+                return
+
+        os.makedirs(self.backup_dir, exist_ok=True)
+        shutil.copy2(path, os.path.join(self.backup_dir, os.path.basename(path)))
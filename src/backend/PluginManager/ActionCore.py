@@ -22,6 +22,8 @@ import os
 from PIL import Image
 import gi
 
+from src.backend.PluginManager.BackendHost import BackendHost
+from src.backend.PluginManager.BackendReadiness import BackendReadiness
 from src.backend.PluginManager.EventManager import EventManager
 from src.backend.PluginManager.EventAssigner import EventAssigner
 
@@ -64,6 +66,9 @@ class ActionCore(rpyc.Service):
     BACKEND_CONNECT_TIMEOUT: float = 30.0
     # How long a physical/UI event may sit queued waiting for the backend before it is dropped
     PENDING_EVENT_TIMEOUT: float = 30.0
+    # Run the backend in the plugin's shared BackendHost process instead of an own interpreter.
+    # Opt-in: the backends of a host share sys.modules, sys.path and the thread serving their calls.
+    SHARED_BACKEND_HOST: bool = False
 
     # Change to match your action
     def __init__(self, action_id: str, action_name: str,
@@ -73,6 +78,9 @@ class ActionCore(rpyc.Service):
         self.backend: netref = None
         self.server: ThreadedServer = None
         self.backend_process: subprocess.Popen | None = None
+        self.backend_host: BackendHost | None = None
+        # Resolved by register_backend, or when the launch times out
+        self.backend_readiness = BackendReadiness(f"action backend {action_id}")
 
         # True while this action's own backend has been launched but hasn't connected back yet
         self.backend_launch_pending: bool = False
@@ -549,6 +557,11 @@ class ActionCore(rpyc.Service):
     def on_disconnect(self):
         if self.server is not None:
             self.server.close()
+        if self.backend_host is not None:
+            # The connection is shared with the other backends of the host
+            self.backend_host.release_instance(self.get_backend_instance_id())
+            self.backend_host = None
+            self.backend_connection = None
         if self.backend_connection is not None:
             self.backend_connection.close()
         if self.backend_process is not None and self.backend_process.poll() is None:
@@ -557,11 +570,20 @@ class ActionCore(rpyc.Service):
         self.backend = None
         self.backend_process = None
         self.backend_launch_pending = False
+        self.backend_readiness.set_failed()
 
-    def launch_backend(self, backend_path: str, venv_path: str = None, open_in_terminal: bool = False):
+    def launch_backend(self, backend_path: str, venv_path: str = None, open_in_terminal: bool = False,
+                       shared: bool = None):
+        """
+        shared: run the backend in the plugin's BackendHost, defaults to SHARED_BACKEND_HOST.
+                Backends opened in a terminal always get their own process.
+        """
         if self.backend_process is not None and self.backend_process.poll() is None:
             log.info("Backend process already running, skipping launch.")
             return
+        if self.backend_host is not None:
+            log.info("Backend already hosted, skipping launch.")
+            return
 
         if venv_path is not None:
             if not os.path.exists(venv_path):
@@ -570,11 +592,21 @@ class ActionCore(rpyc.Service):
                 log.info(f"Recreating venv for action {self.action_id} - This may take a while...")
                 self.plugin_base.recreate_venv(plugin_path=self.plugin_base.PATH)
 
-        self.start_server()
-        port = self.server.port
         if not os.path.exists(backend_path):
             raise ValueError(f"Backend path does not exist: {backend_path}")
 
+        if shared is None:
+            shared = self.SHARED_BACKEND_HOST
+        if shared and not open_in_terminal:
+            self.backend_host = BackendHost.get(self.plugin_base.get_plugin_id(), venv_path)
+            self._begin_backend_launch()
+            threading.Thread(target=self._create_hosted_backend, args=(backend_path, venv_path),
+                             name="create_hosted_backend", daemon=True).start()
+            return
+
+        self.start_server()
+        port = self.server.port
+
         ## Launch
         if open_in_terminal:
             command = "gnome-terminal -- bash -c '"
@@ -588,7 +620,7 @@ class ActionCore(rpyc.Service):
             command += f"python3 {backend_path} --port={port}"
 
         log.info(f"Launching backend: {command}")
-        self.backend_launch_pending = True
+        self._begin_backend_launch()
         self.backend_process = subprocess.Popen(command, shell=True, start_new_session=open_in_terminal)
         ActionCore.backend_spawn_count += 1
         log.info(
@@ -596,37 +628,79 @@ class ActionCore(rpyc.Service):
             f"action={self.action_id} spawns={ActionCore.backend_spawn_count}"
         )
 
-        threading.Thread(target=self.wait_for_backend, name="wait_for_backend", daemon=True).start()
+    def _begin_backend_launch(self) -> None:
+        self.backend_launch_pending = True
+        self.backend_readiness.start(self.plugin_base.get_plugin_id())
+        # No thread waits for the backend, register_backend resolves the launch
+        self.backend_readiness.expire_after(self.BACKEND_CONNECT_TIMEOUT,
+                                            lambda: self._on_backend_timeout(self.BACKEND_CONNECT_TIMEOUT))
+
+    def _on_backend_timeout(self, timeout: float) -> None:
+        log.error(f"{self.action_id} - Could not connect to action backend within {timeout}s")
+        self.backend_launch_pending = False
+        self.backend_readiness.set_failed()
+        self._flush_pending_action_events()
 
-    def wait_for_backend(self, timeout: float = None, tries = 3):
+    def wait_for_backend(self, timeout: float = None, tries = 3) -> bool:
         """
-        Polls for the backend connection to be established, for up to `timeout` seconds. Run in a
-        background thread by `launch_backend` so it never blocks action loading - events that arrive
-        while the connection is still pending are queued instead of silently dropped (see
-        `queue_action_event`/`_flush_pending_action_events`).
+        Blocks until the backend launched by `launch_backend` has connected, for up to `timeout` seconds.
+        Not needed after launching - events that arrive while the connection is still pending are queued
+        instead of silently dropped (see `queue_action_event`/`_flush_pending_action_events`).
 
         tries: not used, only there for compatibility with old plugins
+
+        Returns:
+            bool: Whether the backend is connected.
         """
         if timeout is None:
             timeout = self.BACKEND_CONNECT_TIMEOUT
 
-        deadline = time.monotonic() + timeout
-        while self.backend_connection is None and time.monotonic() < deadline:
-            time.sleep(0.1)
-
+        if self.backend_readiness.wait(timeout):
+            return True
         if self.backend_connection is None:
-            log.error(f"{self.action_id} - Could not connect to action backend within {timeout}s")
+            self._on_backend_timeout(timeout)
+        return self.backend_connection is not None
+
+    async def wait_for_backend_async(self, timeout: float = None) -> bool:
+        """Like `wait_for_backend`, but awaitable and without blocking the event loop"""
+        if timeout is None:
+            timeout = self.BACKEND_CONNECT_TIMEOUT
+        return await self.backend_readiness.wait_async(timeout)
+
+    def get_backend_instance_id(self) -> str:
+        return f"{self.action_id}-{id(self)}"
+
+    def _create_hosted_backend(self, backend_path: str, venv_path: str = None) -> None:
+        host = self.backend_host
+        try:
+            connection, backend = host.create_instance(self.get_backend_instance_id(), backend_path, self)
+        except (TimeoutError, RuntimeError, EOFError, ConnectionError) as e:
+            log.warning(f"{self.action_id} - Could not host backend, launching it on its own: {e}")
+            self.backend_host = None
             self.backend_launch_pending = False
-            self._flush_pending_action_events()
+            self.launch_backend(backend_path, venv_path, shared=False)
+            return
+
+        if self.backend_host is not host:
+            # Disconnected while the backend was being created
+            host.release_instance(self.get_backend_instance_id())
+            return
+        self._set_backend(connection, backend)
 
     def register_backend(self, port: int):
         """
         Internal method, do not call manually
         """
-        self.backend_connection = rpyc.connect("localhost", port, config={"allow_public_attrs": True})
-        self.backend = self.backend_connection.root
-        gl.plugin_manager.backends.append(self.backend_connection)
+        connection = rpyc.connect("localhost", port, config={"allow_public_attrs": True})
+        self._set_backend(connection, connection.root)
+
+    def _set_backend(self, connection: Connection, backend: netref) -> None:
+        self.backend_connection = connection
+        self.backend = backend
+        if connection not in gl.plugin_manager.backends:
+            gl.plugin_manager.backends.append(connection)
         self.backend_launch_pending = False
+        self.backend_readiness.set_ready()
         self.on_backend_ready()
         self._flush_pending_action_events()
 
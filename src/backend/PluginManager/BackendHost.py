@@ -0,0 +1,195 @@
+import os
+import subprocess
+import threading
+
+from loguru import logger as log
+
+import rpyc
+from rpyc.utils.server import ThreadedServer
+from rpyc.core.protocol import Connection
+from rpyc.core import netref
+
+
+class BackendHost(rpyc.Service):
+    """
+    One backend process per plugin and venv that runs the backends of all its actions (and of the plugin
+    itself), instead of one interpreter and one server socket per action instance.
+    The host process connects back once and everything - creating backends, calls into them and their
+    calls into the frontend - goes over that one connection.
+
+    Backends of a host share the interpreter: modules they import are only loaded once, which is the point,
+    but so is their module level state. Calls into them are served one at a time.
+    """
+    hosts: dict[tuple[str, str], "BackendHost"] = {}
+    hosts_lock = threading.Lock()
+    spawn_count = 0
+
+    HOST_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BackendHostProcess.py")
+    # How long to wait for the host process to connect back, it imports nothing but rpyc
+    CONNECT_TIMEOUT: float = 30.0
+    # How long a backend may take to import and initialize
+    CREATE_TIMEOUT: float = 60.0
+    # How long the process is kept once its last backend was released, a page switch recreates them right away
+    IDLE_TIMEOUT: float = 30.0
+
+    @classmethod
+    def get(cls, plugin_id: str, venv_path: str = None) -> "BackendHost":
+        key = (plugin_id, venv_path)
+        with cls.hosts_lock:
+            host = cls.hosts.get(key)
+            if host is None:
+                host = cls(plugin_id, venv_path)
+                cls.hosts[key] = host
+            return host
+
+    @classmethod
+    def stop_all(cls) -> None:
+        """Stops the processes of all hosts, on app quit"""
+        with cls.hosts_lock:
+            hosts = list(cls.hosts.values())
+        for host in hosts:
+            try:
+                host.stop()
+            except Exception as e:
+                log.error(f"Failed to stop backend host of {host.plugin_id}: {e}")
+
+    def __init__(self, plugin_id: str, venv_path: str = None):
+        self.plugin_id = plugin_id
+        self.venv_path = venv_path
+
+        self.server: ThreadedServer = None
+        self.process: subprocess.Popen = None
+        self.connection: Connection = None
+        self.connected = threading.Event()
+
+        self.instances: set[str] = set()
+        self.lock = threading.Lock()
+        self.idle_timer: threading.Timer = None
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """Starts the host process, only if it isn't running yet"""
+        with self.lock:
+            if self.is_running():
+                return
+
+            self.connected.clear()
+            if self.server is None:
+                self.server = ThreadedServer(self, hostname="localhost", port=0,
+                                             protocol_config={"allow_public_attrs": True,
+                                                              "sync_request_timeout": self.CREATE_TIMEOUT})
+                threading.Thread(target=self.server.start, name="backend_host_server", daemon=True).start()
+
+            command = ""
+            if self.venv_path is not None:
+                command = f". {self.venv_path}/bin/activate && "
+            command += f"python3 {self.HOST_SCRIPT} --port={self.server.port}"
+
+            log.info(f"Launching backend host: {command}")
+            self.process = subprocess.Popen(command, shell=True)
+            BackendHost.spawn_count += 1
+            log.info(
+                f"[backend] started backend host pid={self.process.pid} "
+                f"plugin={self.plugin_id} spawns={BackendHost.spawn_count}"
+            )
+
+    def create_instance(self, instance_id: str, backend_path: str, frontend: rpyc.Service) -> tuple[Connection, netref]:
+        """
+        Runs backend_path in the host with frontend as its frontend, blocks until the backend is up.
+        Returns the host connection and the backend.
+        """
+        self._cancel_idle_timer()
+        self.start()
+        if not self.connected.wait(self.CONNECT_TIMEOUT):
+            raise TimeoutError(f"Backend host of {self.plugin_id} did not connect within {self.CONNECT_TIMEOUT}s")
+
+        created = threading.Event()
+        result = {}
+
+        def on_created(backend, error):
+            result["backend"] = backend
+            result["error"] = error
+            created.set()
+
+        connection = self.connection
+        connection.root.create_instance(instance_id, backend_path, frontend, on_created)
+
+        if not created.wait(self.CREATE_TIMEOUT):
+            raise TimeoutError(f"Backend {backend_path} was not created within {self.CREATE_TIMEOUT}s")
+        if result["error"] is not None:
+            raise RuntimeError(f"Backend {backend_path} could not be created:\n{result['error']}")
+
+        with self.lock:
+            self.instances.add(instance_id)
+        return connection, result["backend"]
+
+    def release_instance(self, instance_id: str) -> None:
+        with self.lock:
+            if instance_id not in self.instances:
+                return
+            self.instances.discard(instance_id)
+            connection = self.connection
+            if not self.instances:
+                self._start_idle_timer()
+
+        if connection is None or connection.closed:
+            return
+        try:
+            connection.root.release_instance(instance_id)
+        except (EOFError, TimeoutError, ConnectionError) as e:
+            log.warning(f"Could not release backend {instance_id} of {self.plugin_id}: {e}")
+
+    def _start_idle_timer(self) -> None:
+        if self.idle_timer is not None:
+            self.idle_timer.cancel()
+        self.idle_timer = threading.Timer(self.IDLE_TIMEOUT, self._stop_if_idle)
+        self.idle_timer.name = "backend_host_idle_timer"
+        self.idle_timer.daemon = True
+        self.idle_timer.start()
+
+    def _cancel_idle_timer(self) -> None:
+        with self.lock:
+            if self.idle_timer is not None:
+                self.idle_timer.cancel()
+                self.idle_timer = None
+
+    def _stop_if_idle(self) -> None:
+        with self.lock:
+            self.idle_timer = None
+            if self.instances:
+                return
+        log.info(f"[backend] backend host of {self.plugin_id} has no backends left")
+        self.stop()
+
+    def stop(self) -> None:
+        with self.lock:
+            connection, process, server = self.connection, self.process, self.server
+            self.server = None
+            self.process = None
+            self.instances.clear()
+            if self.idle_timer is not None:
+                self.idle_timer.cancel()
+                self.idle_timer = None
+
+        # Outside the lock, closing the connection calls on_disconnect
+        if connection is not None:
+            connection.close()
+        if process is not None and process.poll() is None:
+            log.info(f"[backend] stopping backend host pid={process.pid} plugin={self.plugin_id}")
+            process.terminate()
+        if server is not None:
+            server.close()
+
+    def on_connect(self, conn: Connection) -> None:
+        self.connection = conn
+        self.connected.set()
+
+    def on_disconnect(self, conn: Connection) -> None:
+        if conn is not self.connection:
+            return
+        self.connection = None
+        self.connected.clear()
+        with self.lock:
+            self.instances.clear()
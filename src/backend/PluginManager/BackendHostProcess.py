@@ -0,0 +1,128 @@
+"""
+Runs all backends of one plugin in a single process, started by BackendHost - do not run manually.
+
+Runs inside the venv of the plugin, so only the standard library, rpyc and the plugin tools can be used here.
+The backends are the unmodified backend.py scripts of the plugin. BackendBase normally connects to the
+frontend, opens its own server and registers itself there; in here it instead gets the frontend object
+handed in by create_instance and is passed back over the one connection this process has to the app.
+"""
+import argparse
+import os
+import runpy
+import sys
+import threading
+import traceback
+
+import rpyc
+
+# The frontend and callback of the backend that is being created on this thread
+hosted = threading.local()
+
+
+def install_hooks() -> bool:
+    try:
+        from streamcontroller_plugin_tools import BackendBase
+    except ImportError:
+        return False
+
+    if not all(hasattr(BackendBase, name) for name in ("connect_to_frontend", "start_server", "register_to_frontend")):
+        # Old plugin tools that set everything up in __init__
+        return False
+
+    def connect_to_frontend(self):
+        # The connection belongs to the host, the backend must not close it
+        self.frontend_connection = None
+        self.frontend = hosted.frontend
+
+    def start_server(self):
+        self.server = None
+
+    def register_to_frontend(self):
+        hosted.on_created(self)
+
+    BackendBase.connect_to_frontend = connect_to_frontend
+    BackendBase.start_server = start_server
+    BackendBase.register_to_frontend = register_to_frontend
+    return True
+
+
+class BackendHostService(rpyc.Service):
+    def __init__(self, hooks_installed: bool):
+        self.hooks_installed = hooks_installed
+        self.instances: dict[str, object] = {}
+        self.lock = threading.Lock()
+        # Backends expect their own folder at the front of sys.path and their path in argv
+        self.import_lock = threading.Lock()
+
+    def create_instance(self, instance_id: str, backend_path: str, frontend, on_created: callable) -> None:
+        """
+        Runs backend_path on its own thread, on_created(backend, error) is called once the backend
+        registered itself. Returns right away so this connection keeps being served meanwhile.
+        """
+        if not self.hooks_installed:
+            on_created(None, "streamcontroller_plugin_tools in this venv does not support hosting")
+            return
+
+        def on_backend_created(backend):
+            with self.lock:
+                self.instances[instance_id] = backend
+            on_created(backend, None)
+
+        def run():
+            hosted.frontend = frontend
+            hosted.on_created = on_backend_created
+            with self.import_lock:
+                backend_dir = os.path.dirname(os.path.abspath(backend_path))
+                if backend_dir not in sys.path:
+                    sys.path.insert(0, backend_dir)
+                sys.argv = [backend_path]
+
+            try:
+                # Scripts usually end with a module level Backend(), some keep running after it
+                runpy.run_path(backend_path, run_name="__main__")
+            except BaseException:
+                with self.lock:
+                    created = instance_id in self.instances
+                if not created:
+                    on_created(None, traceback.format_exc())
+                    return
+                traceback.print_exc()
+
+            with self.lock:
+                created = instance_id in self.instances
+            if not created:
+                on_created(None, f"{backend_path} did not create a backend")
+
+        threading.Thread(target=run, name=f"backend-{instance_id}", daemon=True).start()
+
+    def release_instance(self, instance_id: str) -> None:
+        with self.lock:
+            backend = self.instances.pop(instance_id, None)
+        if backend is None:
+            return
+        try:
+            backend.on_disconnect(None)
+        except Exception:
+            traceback.print_exc()
+
+    def get_instance_count(self) -> int:
+        with self.lock:
+            return len(self.instances)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="BackendHostProcess")
+    parser.add_argument("--port", type=int, required=True)
+    args = parser.parse_args()
+
+    service = BackendHostService(install_hooks())
+    connection = rpyc.connect("localhost", args.port, service=service,
+                              config={"allow_public_attrs": True, "sync_request_timeout": None})
+    # Until the app closes the connection
+    connection.serve_all()
+    # Backend threads may not be daemons, don't wait for them
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import itertools
+import statistics
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from loguru import logger as log
+
+
+class BackendDeadlines:
+    """
+    One thread that fires the timeouts of all backends that are still connecting,
+    instead of a sleeping thread per backend.
+    """
+    def __init__(self):
+        self.deadlines: list[tuple[float, int, callable]] = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.thread: threading.Thread = None
+
+    def call_at(self, deadline: float, callback: callable) -> None:
+        with self.condition:
+            heapq.heappush(self.deadlines, (deadline, next(self.counter), callback))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="backend_deadlines", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.deadlines or self.deadlines[0][0] > time.monotonic():
+                    timeout = self.deadlines[0][0] - time.monotonic() if self.deadlines else None
+                    self.condition.wait(timeout)
+                _, _, callback = heapq.heappop(self.deadlines)
+            try:
+                callback()
+            except Exception as e:
+                log.error(f"Error in backend timeout callback: {e}")
+
+
+class BackendReadiness:
+    """
+    Resolves once a launched backend registered (True) or gave up (False).
+    Waiters are woken right away instead of polling, async code can await it and the time from
+    launch to ready is recorded per plugin.
+    """
+    deadlines = BackendDeadlines()
+
+    # Plugin id -> seconds from launch to ready of each backend start
+    cold_starts: dict[str, list[float]] = {}
+    cold_starts_lock = threading.Lock()
+
+    def __init__(self, name: str):
+        # What is starting, for the log
+        self.name = name
+        # Whose cold starts these are, set on launch
+        self.plugin_id: str = None
+
+        self.future: Future = Future()
+        self.launched_at: float = None
+        self.latency: float = None
+        # register_backend and the timeout may race to resolve the launch
+        self.lock = threading.Lock()
+
+    def start(self, plugin_id: str) -> None:
+        """Called on launch, waiters from now on wait for this launch"""
+        with self.lock:
+            self.plugin_id = plugin_id
+            if self.future.done():
+                self.future = Future()
+                self.launched_at = None
+            # A fallback launch while the first one is pending still counts from the first
+            if self.launched_at is None:
+                self.launched_at = time.monotonic()
+            self.latency = None
+
+    def set_ready(self) -> None:
+        with self.lock:
+            launched_at, self.launched_at = self.launched_at, None
+            if not self.future.done():
+                self.future.set_result(True)
+
+        if launched_at is not None:
+            self.latency = time.monotonic() - launched_at
+            with BackendReadiness.cold_starts_lock:
+                BackendReadiness.cold_starts.setdefault(self.plugin_id, []).append(self.latency)
+            log.info(f"[backend] {self.name} ready after {self.latency * 1000:.0f} ms")
+
+    def set_failed(self) -> None:
+        with self.lock:
+            self.launched_at = None
+            if not self.future.done():
+                self.future.set_result(False)
+
+    def is_ready(self) -> bool:
+        return self.future.done() and self.future.result()
+
+    def expire_after(self, timeout: float, on_timeout: callable) -> None:
+        """Calls on_timeout if the current launch isn't resolved within timeout seconds"""
+        future = self.future
+
+        def check():
+            if future is self.future and not future.done():
+                on_timeout()
+
+        BackendReadiness.deadlines.call_at(time.monotonic() + timeout, check)
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until resolved or timeout, True if the backend is ready"""
+        try:
+            return self.future.result(timeout)
+        except FutureTimeoutError:
+            return False
+
+    async def wait_async(self, timeout: float = None) -> bool:
+        # Shielded, a cancelled waiter must not resolve the launch for everyone else
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.future)), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    @classmethod
+    def get_cold_start_stats(cls) -> dict[str, dict]:
+        """Per plugin: how many backends started and how long they took, slowest first"""
+        with cls.cold_starts_lock:
+            stats = {
+                plugin_id: {
+                    "count": len(latencies),
+                    "mean": statistics.fmean(latencies),
+                    "max": max(latencies),
+                    "total": sum(latencies),
+                }
+                for plugin_id, latencies in cls.cold_starts.items()
+            }
+        return dict(sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True))
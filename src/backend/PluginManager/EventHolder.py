@@ -1,6 +1,14 @@
 import asyncio
+import threading
+import time
+from concurrent.futures import Future
 from loguru import logger as log
 
+from src.backend.PluginManager.PluginEventLoop import get_plugin_event_loop
+
+# Listeners taking longer than this (in seconds) get logged
+SLOW_LISTENER_THRESHOLD = 0.5
+
 class EventHolder:
     """
         Holder for Event Callbacks for the specified Event ID
@@ -15,6 +23,14 @@ class EventHolder:
         self.event_id = event_id or f"{self.plugin_base.get_plugin_id()}::{event_id_suffix}"
         self.observers: list = []
 
+        # Coalescing of trigger_event_nowait bursts
+        self._pending_lock = threading.Lock()
+        self._pending_future: Future = None
+        self._pending_args: tuple = None
+
+        # callback name -> [calls, total time, max time]
+        self.listener_stats: dict[str, list] = {}
+
     def add_listener(self, callback: callable):
         if callback not in self.observers:
             self.observers.append(callback)
@@ -25,26 +41,78 @@ class EventHolder:
         if callback in self.observers:
             self.observers.remove(callback)
 
-    def trigger_event(self, *args, **kwargs):
-        # FIX: This can throw an error, if this happens apply the fix from Observer.py
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self._run_event(self.event_id, *args, **kwargs))
-        finally:
-            loop.close()
+    def trigger_event(self, *args, **kwargs) -> None:
+        """
+        Calls all listeners and waits until they are done.
+        When called from a listener itself the event is only scheduled and this returns before its
+        listeners ran: waiting there would block the loop or a listener thread on events that may need
+        it to make progress. Listeners that need the result have to await trigger_event_async instead.
+        """
+        event_loop = get_plugin_event_loop()
+        future = event_loop.submit(self._run_event(self.event_id, *args, **kwargs))
+        if event_loop.is_event_thread():
+            log.debug(f"Nested trigger of {self.event_id} from a listener, not waiting for its listeners")
+            return
+        future.result()
+
+    def trigger_event_nowait(self, *args, **kwargs) -> Future:
+        """
+        Schedules the event without waiting for the listeners.
+        If the previous call hasn't started yet, it gets the new arguments instead of queuing a second run,
+        so only the latest value of a burst is delivered. Both calls get the same future.
+        """
+        with self._pending_lock:
+            self._pending_args = (args, kwargs)
+            if self._pending_future is not None:
+                return self._pending_future
+            self._pending_future = get_plugin_event_loop().submit(self._run_pending())
+            return self._pending_future
 
+    async def trigger_event_async(self, *args, **kwargs):
+        """Awaitable version of trigger_event, usable from any asyncio loop"""
+        future = get_plugin_event_loop().submit(self._run_event(self.event_id, *args, **kwargs))
+        return await asyncio.wrap_future(future)
+
+    async def _run_pending(self):
+        with self._pending_lock:
+            args, kwargs = self._pending_args
+            self._pending_future = None
+            self._pending_args = None
+        return await self._run_event(self.event_id, *args, **kwargs)
 
     async def _run_event(self, *args, **kwargs):
-        coroutines = [self._ensure_coroutine(observer, *args, **kwargs) for observer in self.observers]
-        await asyncio.gather(*coroutines)
+        coroutines = [self._ensure_coroutine(observer, *args, **kwargs) for observer in list(self.observers)]
+        return await asyncio.gather(*coroutines)
 
     async def _ensure_coroutine(self, callback: callable, *args, **kwargs):
-        if asyncio.iscoroutinefunction(callback):
-            return await callback(*args, **kwargs)
-        else:
-            try:
-                return await asyncio.to_thread(callback, *args, **kwargs)
-            except Exception as e:
-                log.error(f"Callback {callback.__name__} in {self.event_id} could not be called")
-                return await asyncio.sleep(0)
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                return await callback(*args, **kwargs)
+            else:
+                return await asyncio.get_running_loop().run_in_executor(None, lambda: callback(*args, **kwargs))
+        except Exception as e:
+            log.error(f"Callback {callback.__name__} in {self.event_id} could not be called: {e}")
+        finally:
+            self._record_listener_time(callback, time.perf_counter() - start)
+
+    def _record_listener_time(self, callback: callable, duration: float) -> None:
+        name = getattr(callback, "__qualname__", repr(callback))
+        stats = self.listener_stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+
+        if duration > SLOW_LISTENER_THRESHOLD:
+            log.warning(f"Slow listener {name} on {self.event_id}: took {duration:.3f}s")
+
+    def get_listener_stats(self) -> dict[str, dict]:
+        """Call count, average and max duration (in seconds) of every listener"""
+        return {
+            name: {
+                "calls": calls,
+                "avg": total / calls if calls else 0,
+                "max": max_time,
+            }
+            for name, (calls, total, max_time) in self.listener_stats.items()
+        }
@@ -22,6 +22,8 @@ import gi
 
 from locales.LocaleManager import LocaleManager
 from src.backend.PluginManager.ActionHolderGroup import ActionHolderGroup
+from src.backend.PluginManager.BackendHost import BackendHost
+from src.backend.PluginManager.BackendReadiness import BackendReadiness
 from src.backend.PluginManager.PluginSettings.Asset import Icon, Color
 from src.backend.PluginManager.PluginSettings.PluginAssetManager import AssetManager
 
@@ -36,7 +38,7 @@ import globals as gl
 from locales.LegacyLocaleManager import LegacyLocaleManager
 from src.backend.PluginManager.ActionHolder import ActionHolder
 from src.backend.PluginManager.EventHolder import EventHolder
-from src.backend.Utils.AtomicSaveUtils import atomic_save_json
+from src.backend.Utils.PluginSettingsStore import PluginSettingsStore
 
 class PluginBase(rpyc.Service):
     """
@@ -51,12 +53,18 @@ class PluginBase(rpyc.Service):
     BACKEND_CONNECT_TIMEOUT: float = 30.0
     # How long a physical/UI event may sit queued waiting for the backend before it is dropped
     PENDING_EVENT_TIMEOUT: float = 30.0
+    # Run the backend in the plugin's shared BackendHost process, next to the backends of its actions.
+    # Opt-in: the backends of a host share sys.modules, sys.path and the thread serving their calls.
+    SHARED_BACKEND_HOST: bool = False
 
     def __init__(self, use_legacy_locale: bool = True, legacy_dir: str = "locales"):
         self.backend_connection: Connection = None
         self.backend: netref = None
         self.server: ThreadedServer = None
         self.backend_process: subprocess.Popen | None = None
+        self.backend_host: BackendHost | None = None
+        # Resolved by register_backend, or when the launch times out
+        self.backend_readiness = BackendReadiness("plugin backend")
 
         # True while a backend has been launched but hasn't connected back yet
         self.backend_launch_pending: bool = False
@@ -67,6 +75,8 @@ class PluginBase(rpyc.Service):
 
         self.PATH = os.path.dirname(inspect.getfile(self.__class__))
         self.settings_path: str = os.path.join(gl.DATA_PATH, "settings", "plugins", self.get_plugin_id_from_folder_name(), "settings.json") #TODO: Retrive from the manifest as well
+        # Re-read only if changed on disk and written behind
+        self.settings_store = PluginSettingsStore(self.settings_path)
 
         if use_legacy_locale:
             self.locale_manager = LegacyLocaleManager(os.path.join(self.PATH, legacy_dir))
@@ -394,27 +404,25 @@ class PluginBase(rpyc.Service):
         """
         Retrieves the settings from the settings file.
 
+        The file is only read again if it changed on disk, so this is cheap enough to call on every tick.
+
         Returns:
-            dict: The settings stored in the settings file. If the settings file does not exist, an empty dictionary is returned.
+            dict: A copy of the settings stored in the settings file. If the settings file does not exist, an empty dictionary is returned.
         """
-        if not os.path.exists(self.settings_path):
-            return {}
-        with open(self.settings_path, "r") as f:
-            settings = json.load(f)
+        return self.settings_store.get_settings()
 
-            if settings.get("file-version") == "2.0":
-                # Is newest version, return settings
-                return settings.get("settings", {})
-            
-            else:
-                # Is the old format, convert it
-                new_settings = {
-                    "file-version": "2.0",
-                    "settings": settings
-                }
-                atomic_save_json(self.settings_path, new_settings, indent=4)
-
-                return settings
+    def connect_to_settings_changed(self, callback: callable) -> None:
+        """
+        Calls callback(settings) whenever the settings change - through set_settings, or on disk,
+        which is noticed on the next get_settings/set_settings.
+
+        Args:
+            callback (callable): Gets a copy of the new settings.
+        """
+        self.settings_store.connect_changed(callback)
+
+    def disconnect_from_settings_changed(self, callback: callable) -> None:
+        self.settings_store.disconnect_changed(callback)
                 
     def get_manifest(self):
         """
@@ -443,7 +451,8 @@ class PluginBase(rpyc.Service):
     
     def set_settings(self, settings):
         """
-        Saves the provided settings to the settings file.
+        Saves the provided settings to the settings file. The file is written shortly after, a burst of
+        changes results in one write.
 
         Args:
             settings (dict): The settings to be saved.
@@ -451,21 +460,7 @@ class PluginBase(rpyc.Service):
         Returns:
             None
         """
-        content = {}
-        if os.path.isfile(self.settings_path):
-            with open(self.settings_path, "r") as f:
-                content = json.load(f)
-
-        if content.get("file-version") == "2.0":
-            new_content = content.copy()
-            new_content["settings"] = settings
-        else:
-            new_content = {
-                "file-version": "2.0",
-                "settings": settings
-            }
-
-        atomic_save_json(self.settings_path, new_content, indent=4)
+        self.settings_store.set_settings(settings)
 
 
     def add_css_stylesheet(self, path):
@@ -606,6 +601,11 @@ class PluginBase(rpyc.Service):
         """
         if self.server is not None:
             self.server.close()
+        if self.backend_host is not None:
+            # The connection is shared with the backends of the actions
+            self.backend_host.release_instance(self.get_backend_instance_id())
+            self.backend_host = None
+            self.backend_connection = None
         if self.backend_connection is not None:
             self.backend_connection.close()
         if self.backend_process is not None and self.backend_process.poll() is None:
@@ -616,6 +616,7 @@ class PluginBase(rpyc.Service):
         self.backend_process = None
         self.backend = None
         self.backend_launch_pending = False
+        self.backend_readiness.set_failed()
 
     def is_backend_venv_healthy(self, venv_path: str) -> bool:
         # Get python version of venv
@@ -637,17 +638,22 @@ class PluginBase(rpyc.Service):
         if os.path.isfile(os.path.join(plugin_path, "__install__.py")):
             subprocess.run(f"{sys.executable} {os.path.join(plugin_path, '__install__.py')}", shell=True, start_new_session=True)
 
-    def launch_backend(self, backend_path: str, venv_path: str = None, open_in_terminal: bool = False) -> None:
+    def launch_backend(self, backend_path: str, venv_path: str = None, open_in_terminal: bool = False,
+                       shared: bool = None) -> None:
         """
         Launches the backend process for the plugin.
 
         This method starts the RPyC server, constructs the command to launch the backend script,
         and runs it in a new subprocess. Optionally, the backend can be launched in a new terminal window.
+        Plugins that opt in with `SHARED_BACKEND_HOST` (or `shared=True`) run it in the plugin's BackendHost
+        instead, a single process that also runs the backends of the plugin's actions that opted in.
 
         Args:
             backend_path (str): The path to the backend script to be executed.
             venv_path (str, optional): The path to the virtual environment to activate. Defaults to None.
             open_in_terminal (bool, optional): Whether to open the backend in a new terminal window. Defaults to False.
+            shared (bool, optional): Whether to run the backend in the BackendHost. Defaults to `SHARED_BACKEND_HOST`,
+                backends opened in a terminal always get their own process.
 
         Returns:
             None
@@ -655,11 +661,23 @@ class PluginBase(rpyc.Service):
         if self.backend_process is not None and self.backend_process.poll() is None:
             log.info("Backend process already running, skipping launch.")
             return
+        if self.backend_host is not None:
+            log.info("Backend already hosted, skipping launch.")
+            return
 
         if venv_path is not None and not self.is_backend_venv_healthy(venv_path):
             log.info(f"Recreating venv for plugin {self.PATH} - This may take a while...")
             self.recreate_venv(plugin_path=self.PATH)
 
+        if shared is None:
+            shared = self.SHARED_BACKEND_HOST
+        if shared and not open_in_terminal:
+            self.backend_host = BackendHost.get(self.get_plugin_id(), venv_path)
+            self._begin_backend_launch()
+            threading.Thread(target=self._create_hosted_backend, args=(backend_path, venv_path),
+                             name="create_hosted_backend", daemon=True).start()
+            return
+
         self.start_server()
         port = self.server.port
 
@@ -676,7 +694,7 @@ class PluginBase(rpyc.Service):
             command += f"python3 {backend_path} --port={port}"
 
         log.info(f"Launching backend: {command}")
-        self.backend_launch_pending = True
+        self._begin_backend_launch()
         self.backend_process = subprocess.Popen(command, shell=True, start_new_session=open_in_terminal)
         PluginBase.backend_spawn_count += 1
         plugin_id = self.get_plugin_id_from_folder_name()
@@ -685,35 +703,76 @@ class PluginBase(rpyc.Service):
             f"plugin={plugin_id} spawns={PluginBase.backend_spawn_count}"
         )
 
-        threading.Thread(target=self.wait_for_backend, name="wait_for_backend", daemon=True).start()
-        # self.wait_for_backend()
+    def _begin_backend_launch(self) -> None:
+        self.backend_launch_pending = True
+        self.backend_readiness.name = f"plugin backend {self.get_plugin_id()}"
+        self.backend_readiness.start(self.get_plugin_id())
+        # No thread waits for the backend, register_backend resolves the launch
+        self.backend_readiness.expire_after(self.BACKEND_CONNECT_TIMEOUT,
+                                            lambda: self._on_backend_timeout(self.BACKEND_CONNECT_TIMEOUT))
+
+    def _on_backend_timeout(self, timeout: float) -> None:
+        log.error(f"{self.get_plugin_id()} - Could not connect to plugin backend within {timeout}s")
+        self.backend_launch_pending = False
+        self.backend_readiness.set_failed()
+        self._flush_pending_action_events()
 
-    def wait_for_backend(self, timeout: float = None, tries = 3) -> None:
+    def wait_for_backend(self, timeout: float = None, tries = 3) -> bool:
         """
         Waits for the backend to establish a connection.
 
-        This method repeatedly polls for the backend connection to be established, for up to `timeout`
-        seconds. It is run in a background thread by `launch_backend` so it never blocks plugin loading -
-        events that arrive for this plugin while the connection is still pending are queued instead of
-        silently dropped (see `queue_action_event`/`_flush_pending_action_events`).
+        Blocks until the backend launched by `launch_backend` has connected, for up to `timeout` seconds,
+        and wakes up as soon as it registers. Not needed after launching - events that arrive for this
+        plugin while the connection is still pending are queued instead of silently dropped
+        (see `queue_action_event`/`_flush_pending_action_events`).
 
         Args:
-            timeout (float, optional): How long to keep retrying. Defaults to `BACKEND_CONNECT_TIMEOUT`.
+            timeout (float, optional): How long to wait. Defaults to `BACKEND_CONNECT_TIMEOUT`.
             tries: not used. only there for compatability with old plugins
         Returns:
-            None
+            bool: Whether the backend is connected.
         """
         if timeout is None:
             timeout = self.BACKEND_CONNECT_TIMEOUT
 
-        deadline = time.monotonic() + timeout
-        while self.backend_connection is None and time.monotonic() < deadline:
-            time.sleep(0.1)
-
+        if self.backend_readiness.wait(timeout):
+            return True
         if self.backend_connection is None:
-            log.error(f"{self.get_plugin_id()} - Could not connect to plugin backend within {timeout}s")
+            self._on_backend_timeout(timeout)
+        return self.backend_connection is not None
+
+    async def wait_for_backend_async(self, timeout: float = None) -> bool:
+        """
+        Like `wait_for_backend`, but awaitable from plugin coroutines without blocking their event loop.
+
+        Args:
+            timeout (float, optional): How long to wait. Defaults to `BACKEND_CONNECT_TIMEOUT`.
+        Returns:
+            bool: Whether the backend is connected.
+        """
+        if timeout is None:
+            timeout = self.BACKEND_CONNECT_TIMEOUT
+        return await self.backend_readiness.wait_async(timeout)
+
+    def get_backend_instance_id(self) -> str:
+        return f"{self.get_plugin_id()}-plugin"
+
+    def _create_hosted_backend(self, backend_path: str, venv_path: str = None) -> None:
+        host = self.backend_host
+        try:
+            connection, backend = host.create_instance(self.get_backend_instance_id(), backend_path, self)
+        except (TimeoutError, RuntimeError, EOFError, ConnectionError) as e:
+            log.warning(f"{self.get_plugin_id()} - Could not host backend, launching it on its own: {e}")
+            self.backend_host = None
             self.backend_launch_pending = False
-            self._flush_pending_action_events()
+            self.launch_backend(backend_path, venv_path, shared=False)
+            return
+
+        if self.backend_host is not host:
+            # Disconnected while the backend was being created
+            host.release_instance(self.get_backend_instance_id())
+            return
+        self._set_backend(connection, backend)
 
     def register_backend(self, port: int) -> None:
         """
@@ -728,12 +787,18 @@ class PluginBase(rpyc.Service):
         Returns:
             None
         """
-        self.backend_connection = rpyc.connect("localhost", port, config={"allow_public_attrs": True})
-        self.backend = self.backend_connection.root
+        connection = rpyc.connect("localhost", port, config={"allow_public_attrs": True})
+        self._set_backend(connection, connection.root)
+
+    def _set_backend(self, connection: Connection, backend: netref) -> None:
+        self.backend_connection = connection
+        self.backend = backend
 
-        gl.plugin_manager.backends.append(self.backend_connection)
+        if connection not in gl.plugin_manager.backends:
+            gl.plugin_manager.backends.append(connection)
 
         self.backend_launch_pending = False
+        self.backend_readiness.set_ready()
         self._flush_pending_action_events()
 
     def queue_action_event(self, retry: callable) -> bool:
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Sync listeners running at the same time, further calls wait for a free thread
+MAX_SYNC_WORKERS = 64
+
+class PluginEventLoop:
+    """
+        One long-lived asyncio loop shared by all plugin events, so triggering
+        an event doesn't have to build and tear down a loop every time
+    """
+    def __init__(self, max_sync_workers: int = MAX_SYNC_WORKERS):
+        self.loop = asyncio.new_event_loop()
+        # Sync listeners run here instead of on the loop thread. The pool is large so a few slow listeners
+        # don't hold back the events of everyone else, beyond it calls queue instead of adding threads.
+        self.worker_state = threading.local()
+        self.sync_executor = ThreadPoolExecutor(max_workers=max_sync_workers, thread_name_prefix="plugin-event",
+                                                initializer=self._init_worker)
+        self.loop.set_default_executor(self.sync_executor)
+
+        self.thread = threading.Thread(target=self._run, name="PluginEventLoop", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _init_worker(self):
+        self.worker_state.is_worker = True
+
+    def is_loop_thread(self) -> bool:
+        return threading.current_thread() is self.thread
+
+    def is_event_thread(self) -> bool:
+        """Whether this is the loop or a thread running a sync listener - neither may wait for an event"""
+        return self.is_loop_thread() or getattr(self.worker_state, "is_worker", False)
+
+    def submit(self, coroutine):
+        """Schedules the coroutine on the loop, returns a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+
+_plugin_event_loop: PluginEventLoop = None
+_plugin_event_loop_lock = threading.Lock()
+
+def get_plugin_event_loop() -> PluginEventLoop:
+    global _plugin_event_loop
+    with _plugin_event_loop_lock:
+        if _plugin_event_loop is None:
+            _plugin_event_loop = PluginEventLoop()
+        return _plugin_event_loop
@@ -14,23 +14,75 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 # Import Python modules
 import os, json, copy
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 from loguru import logger as log
-from functools import lru_cache
 
 # Import own modules
 import globals as gl
 from src.backend.Utils.AtomicSaveUtils import atomic_save_json
 
+
+def freeze(value):
+    """Read-only version of parsed json: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """Mutable copy of a frozen value"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class SettingsSnapshot(Mapping):
+    """
+    A settings file as it was when it got loaded or saved. It never changes, so it can be
+    read from any thread without copying. Saving the file publishes a new snapshot with
+    a higher version instead.
+    """
+    __slots__ = ("data", "version")
+
+    def __init__(self, data: dict, version: int):
+        self.data = freeze(data if isinstance(data, dict) else {})
+        self.version = version
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def thaw(self) -> dict:
+        return thaw(self.data)
+
+
 class SettingsManager:
     def __init__(self):
+        self.lock = threading.RLock()
+        # Per file, keyed by absolute path
+        self.snapshots: dict[str, SettingsSnapshot] = {}
+        self.versions: dict[str, int] = {}
+        self.subscribers: dict[str, list[callable]] = {}
+        # The mutable dicts handed out by get_app_settings, dropped when the file is saved
+        self.working_copies: dict[str, dict] = {}
+
         self.font_defaults: dict = {} # Used by the LabelManager to get the default font settings
         self.load_font_defaults()
 
     def invalidate_all_caches(self):
-        for name in dir(self):
-            attr = getattr(self, name)
-            if hasattr(attr, "cache_clear"):
-                attr.cache_clear()
+        with self.lock:
+            self.snapshots.clear()
+            self.working_copies.clear()
 
     @staticmethod
     def load_settings_from_file(file_path: str) -> dict:
@@ -47,18 +99,65 @@ class SettingsManager:
     def save_settings_to_file(file_path: str, settings: dict) -> None:
         atomic_save_json(file_path, settings)
 
-        gl.settings_manager.invalidate_all_caches()
-
-    @lru_cache
-    def _load_deck_settings_cached(self, deck_serial_number: str) -> dict:
-        path = os.path.join(gl.DATA_PATH, "settings", "decks", f"{deck_serial_number}.json")
-        return self.load_settings_from_file(path)
+        # Only the caches of this file are outdated
+        gl.settings_manager.publish(file_path, settings)
+
+    def get_snapshot(self, file_path: str) -> SettingsSnapshot:
+        """The current snapshot of the file, only read from disk the first time"""
+        path = os.path.abspath(file_path)
+        snapshot = self.snapshots.get(path)
+        if snapshot is not None:
+            return snapshot
+
+        with self.lock:
+            snapshot = self.snapshots.get(path)
+            if snapshot is None:
+                snapshot = SettingsSnapshot(self.load_settings_from_file(path), self.versions.get(path, 0))
+                self.snapshots[path] = snapshot
+            return snapshot
+
+    def publish(self, file_path: str, settings: dict) -> SettingsSnapshot:
+        """Replaces the snapshot of the file with settings and notifies its subscribers"""
+        path = os.path.abspath(file_path)
+        with self.lock:
+            version = self.versions.get(path, 0) + 1
+            self.versions[path] = version
+            snapshot = SettingsSnapshot(settings, version)
+            self.snapshots[path] = snapshot
+            self.working_copies.pop(path, None)
+            subscribers = list(self.subscribers.get(path, []))
+
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                log.error(f"Settings subscriber {callback} failed for {path}: {e}")
+
+        return snapshot
+
+    def subscribe(self, file_path: str, callback: callable) -> None:
+        """callback(snapshot) is called every time the file gets saved"""
+        with self.lock:
+            self.subscribers.setdefault(os.path.abspath(file_path), []).append(callback)
+
+    def unsubscribe(self, file_path: str, callback: callable) -> None:
+        with self.lock:
+            callbacks = self.subscribers.get(os.path.abspath(file_path), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def get_deck_settings_path(self, deck_serial_number: str) -> str:
+        return os.path.join(gl.DATA_PATH, "settings", "decks", f"{deck_serial_number}.json")
+
+    def get_deck_settings_snapshot(self, deck_serial_number: str) -> SettingsSnapshot:
+        """Read-only deck settings, for code that doesn't modify them"""
+        return self.get_snapshot(self.get_deck_settings_path(deck_serial_number))
 
     def get_deck_settings(self, deck_serial_number: str) -> dict:
         """
         Retrieves the deck settings for a given deck serial number.
-        Cached (invalidated on save) and deep-copied per call, so callers can
-        still freely mutate the result without touching the cache.
+        A fresh copy per call, so callers can freely mutate the result and pass it to
+        save_deck_settings(). Use get_deck_settings_snapshot() to only read them.
 
         Args:
             deck_serial_number (str): The serial number of the deck.
@@ -66,7 +165,7 @@ class SettingsManager:
         Returns:
             dict: The deck settings loaded from the file.
         """
-        return copy.deepcopy(self._load_deck_settings_cached(deck_serial_number))
+        return self.get_deck_settings_snapshot(deck_serial_number).thaw()
     
     def save_deck_settings(self, deck_serial_number: str, settings: dict) -> None:
         """
@@ -80,26 +179,33 @@ class SettingsManager:
         Returns:
             None
         """
-        path = os.path.join(gl.DATA_PATH, "settings", "decks", f"{deck_serial_number}.json")
-        self.save_settings_to_file(path, settings)
+        self.save_settings_to_file(self.get_deck_settings_path(deck_serial_number), settings)
 
-        self.invalidate_all_caches()
+    def get_app_settings_path(self) -> str:
+        return os.path.join(gl.DATA_PATH, "settings", "settings.json")
+
+    def get_app_settings_snapshot(self) -> SettingsSnapshot:
+        """Read-only app settings, for code that doesn't modify them"""
+        return self.get_snapshot(self.get_app_settings_path())
 
-    @lru_cache
     def get_app_settings(self) -> dict:
-        path = os.path.join(gl.DATA_PATH, "settings", "settings.json")
-        settings =  self.load_settings_from_file(path)
-        if settings == None:
-            settings = {}
-            self.save_settings_to_file(path, settings)
-        return settings
+        """
+        The app settings as a mutable dict - the same one until they get saved, so changes
+        are visible to the next caller. Code that only reads should use get_app_settings_snapshot().
+        """
+        path = os.path.abspath(self.get_app_settings_path())
+        with self.lock:
+            settings = self.working_copies.get(path)
+            if settings is None:
+                settings = self.get_snapshot(path).thaw()
+                self.working_copies[path] = settings
+            return settings
+
+    def subscribe_app_settings(self, callback: callable) -> None:
+        self.subscribe(self.get_app_settings_path(), callback)
     
     def save_app_settings(self, settings: dict) -> None:
-        path = os.path.join(gl.DATA_PATH, "settings", "settings.json")
-        self.save_settings_to_file(path, settings)
-
-        # Invalidate get_app_settings cache
-        self.get_app_settings.cache_clear()
+        self.save_settings_to_file(self.get_app_settings_path(), settings)
 
     def get_static_settings(self) -> dict:
         """
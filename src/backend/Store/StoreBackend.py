@@ -38,6 +38,7 @@ from gi.repository import GLib
 # Import own modules
 from autostart import is_flatpak
 from src.backend.Store.StoreCache import StoreCache
+from src.backend.Store.StoreHttpClient import StoreHttpClient
 from src.backend.PluginManager.PluginBase import PluginBase
 from src.backend.DeckManagement.HelperMethods import recursive_hasattr
 from src.backend.Utils.AtomicSaveUtils import atomic_write, atomic_save_json
@@ -73,9 +74,17 @@ class StoreBackend:
     SDPLUSWALLPAPERS_FILE = "SDPlusBarWallpapers.json"
     PAGES_FILE = "Pages.json"
 
+    # Assets downloaded and extracted at the same time by the update_all_* methods
+    MAX_PARALLEL_UPDATES = 4
+
 
     def __init__(self):
         self.store_cache = StoreCache()
+        self.http = StoreHttpClient(timeout=self.DOWNLOAD_TIMEOUT)
+
+        # Install scripts and pip share the python environment, git its global config
+        self.install_script_lock = threading.Lock()
+        self.git_config_lock = threading.Lock()
 
         self.official_store_branch_cache: str = None
 
@@ -166,7 +175,7 @@ class StoreBackend:
             user_name = self.get_user_name(repo_url)
             repo_name = self.get_repo_name(repo_url)
             url = f"https://api.github.com/repos/{user_name}/{repo_name}/branches?per_page=100"
-            response = requests.get(url, timeout=self.REQUEST_TIMEOUT)
+            response = await self.http.get_async(url, timeout=self.REQUEST_TIMEOUT)
 
             if response.status_code != 200:
                 log.error(f"Failed to fetch branches for {repo_url}: {response.status_code}")
@@ -187,7 +196,7 @@ class StoreBackend:
             user_name = self.get_user_name(repo_url)
             repo_name = self.get_repo_name(repo_url)
             url = f"https://api.github.com/repos/{user_name}/{repo_name}/tags?per_page=100"
-            response = requests.get(url, timeout=self.REQUEST_TIMEOUT)
+            response = await self.http.get_async(url, timeout=self.REQUEST_TIMEOUT)
 
             if response.status_code != 200:
                 log.error(f"Failed to fetch tags for {repo_url}: {response.status_code}")
@@ -210,11 +219,17 @@ class StoreBackend:
         self.official_store_branch_cache = v
         return v
 
-    async def request_from_url(self, url: str) -> requests.Response:
+    async def request_from_url(self, url: str, headers: dict = None) -> requests.Response:
+        """
+        GET on the shared session. Returns the response on 200, and on 304 if conditional
+        headers were passed, otherwise a NoConnectionError.
+        """
         try:
-            req = requests.get(url, stream=True, timeout=self.DOWNLOAD_TIMEOUT)
+            req = await self.http.get_async(url, headers=headers, timeout=self.DOWNLOAD_TIMEOUT)
             if req.status_code == 200:
                 return req
+            if req.status_code == 304 and headers:
+                return req
             log.error(f"Request to {url} failed with status code {req.status_code}")
             return NoConnectionError()
         except requests.exceptions.RequestException as e:
@@ -252,7 +267,8 @@ class StoreBackend:
             str: The content of the remote file.
 
         Note:
-            - The function uses an LRU cache to improve performance by caching previously retrieved files.
+            - Files are cached in the StoreCache. Recent ones are used as they are, older ones and
+              force_refetch send the stored ETag/Last-Modified so an unchanged file costs a 304.
             - If the file is located in a different domain than github.com, the function will replace the domain
               with raw.githubusercontent.com.
         """
@@ -260,46 +276,41 @@ class StoreBackend:
         if data_type == "content":
             byte_suffix = "b"
 
-        is_cached = False
-        if not force_refetch:
-            is_cached = self.store_cache.is_cached(
-                url=repo_url,
-                branch=branch_name,
-                path=file_path
-            )
-        if is_cached:
+        is_cached = self.store_cache.is_cached(url=repo_url, branch=branch_name, path=file_path)
+        if is_cached and not force_refetch and self.store_cache.is_fresh(url=repo_url, branch=branch_name, path=file_path):
             with self.store_cache.open_cache_file(url=repo_url, branch=branch_name, path=file_path, mode=f"r{byte_suffix}") as f:
                 return f.read()
-        else:
-            pass
+
+        headers = None
+        if is_cached:
+            validators = self.store_cache.get_validators(url=repo_url, branch=branch_name, path=file_path)
+            headers = self.http.get_conditional_headers(validators) or None
 
         url = self.build_url(repo_url, file_path, branch_name)
 
-        answer = await self.request_from_url(url)
+        answer = await self.request_from_url(url, headers=headers)
 
         if isinstance(answer, NoConnectionError):
             return answer
         
         if answer is None:
             return
-        
-        with self.store_cache.open_cache_file(url=repo_url, branch=branch_name, path=file_path, mode=f"w{byte_suffix}") as f:
-            if answer is None:
-                return
-            if data_type == "text":
-                f.write(answer.text)
-            elif data_type == "content":
-                f.write(answer.content)
-
-        if data_type == "text":
-            return answer.text
-        elif data_type == "content":
-            return answer.content
+
+        if answer.status_code == 304:
+            self.store_cache.mark_revalidated(url=repo_url, branch=branch_name, path=file_path)
+            with self.store_cache.open_cache_file(url=repo_url, branch=branch_name, path=file_path, mode=f"r{byte_suffix}") as f:
+                return f.read()
+
+        data = answer.text if data_type == "text" else answer.content
+        self.store_cache.write_cache_file(url=repo_url, branch=branch_name, path=file_path, data=data,
+                                          validators=self.http.get_validators(answer))
+
+        return data
         
     async def get_last_commit(self, repo_url: str, branch_name: str = "main") -> str:
         url = f"https://api.github.com/repos/{self.get_user_name(repo_url)}/{self.get_repo_name(repo_url)}/commits?sha={branch_name}&per_page=1"
         try:
-            response = requests.get(url, timeout=self.REQUEST_TIMEOUT)
+            response = await self.http.get_async(url, timeout=self.REQUEST_TIMEOUT)
         except requests.exceptions.RequestException as e:
             log.error(e)
             return
@@ -332,7 +343,12 @@ class StoreBackend:
             log.error(e)
             return None, n_stores_with_errors
 
-    async def process_store_data(self, filename: str, process_func: callable, get_custom_func: callable, data_class, include_images=True, flatten_func: callable = None):
+    async def process_store_data(self, filename: str, process_func: callable, get_custom_func: callable, data_class, include_images=True, flatten_func: callable = None, on_result: callable = None):
+        """
+        Prepares all entries of the given store file concurrently.
+        on_result(entry, index) is called with every entry as soon as it is ready, index is its position
+        in the store so it can be put in place. The returned list keeps the store order.
+        """
         n_stores_with_errors = 0
         data_list = []
 
@@ -361,30 +377,41 @@ class StoreBackend:
                 }
                 prepare_tasks.append(process_func(asset, include_images, False))
 
-        results = await asyncio.gather(*prepare_tasks)
+        async def prepare(index: int, task):
+            return index, await task
+
+        results = [None] * len(prepare_tasks)
+        for next_done in asyncio.as_completed([prepare(i, task) for i, task in enumerate(prepare_tasks)]):
+            index, result = await next_done
+            results[index] = result
+            if on_result is not None and isinstance(result, data_class):
+                on_result(result, index)
+
         results = [result for result in results if isinstance(result, data_class)]
 
         return results
 
-    async def get_all_plugins_async(self, include_images: bool = True) -> int:
-        return await self.process_store_data(self.PLUGIN_FILE, self.prepare_plugin, self.get_custom_plugins, PluginData, include_images)
+    async def get_all_plugins_async(self, include_images: bool = True, on_result: callable = None) -> int:
+        return await self.process_store_data(self.PLUGIN_FILE, self.prepare_plugin, self.get_custom_plugins, PluginData, include_images,
+                                             on_result=on_result)
 
-    async def get_all_icons(self) -> int:
-        return await self.process_store_data(self.ICON_FILE, self.prepare_icon, None, IconData)
+    async def get_all_icons(self, on_result: callable = None) -> int:
+        return await self.process_store_data(self.ICON_FILE, self.prepare_icon, None, IconData, on_result=on_result)
 
-    async def get_all_wallpapers(self) -> int:
-        return await self.process_store_data(self.WALLPAPERS_FILE, self.prepare_wallpaper, None, WallpaperData)
+    async def get_all_wallpapers(self, on_result: callable = None) -> int:
+        return await self.process_store_data(self.WALLPAPERS_FILE, self.prepare_wallpaper, None, WallpaperData, on_result=on_result)
     
-    async def get_all_sd_plus_bar_wallpapers(self) -> int:
-        return await self.process_store_data(self.SDPLUSWALLPAPERS_FILE, self.prepare_sd_plus_bar_wallpaper, None, SDPlusBarWallpaperData)
+    async def get_all_sd_plus_bar_wallpapers(self, on_result: callable = None) -> int:
+        return await self.process_store_data(self.SDPLUSWALLPAPERS_FILE, self.prepare_sd_plus_bar_wallpaper, None, SDPlusBarWallpaperData,
+                                             on_result=on_result)
 
-    async def get_all_pages(self) -> int:
+    async def get_all_pages(self, on_result: callable = None) -> int:
         # Scanned once instead of per entry, prepare_page would otherwise read every
         # page of the user for every page in the store
         self.installed_page_commits = StorePages.get_installed_commits()
 
         return await self.process_store_data(self.PAGES_FILE, self.prepare_page, None, PageData,
-                                             flatten_func=self.flatten_page_entries)
+                                             flatten_func=self.flatten_page_entries, on_result=on_result)
 
     @staticmethod
     def flatten_page_entries(entries: list[dict]) -> list[dict]:
@@ -924,15 +951,15 @@ class StoreBackend:
             return
         return split[2]
     
-    def get_all_plugins(self, include_images: bool = True) -> list[PluginData]:
-        return asyncio.run(self.get_all_plugins_async(include_images))
+    def get_all_plugins(self, include_images: bool = True, on_result: callable = None) -> list[PluginData]:
+        return asyncio.run(self.get_all_plugins_async(include_images, on_result))
     
     ## Install
     async def subp_call(self, args):
-        return subprocess.call(args)
+        return await asyncio.to_thread(subprocess.call, args)
     
     async def os_sys(self, args):
-        return os.system(args)
+        return await asyncio.to_thread(os.system, args)
     
     def get_main_folder_of_zip(self, zip_path: str) -> str:
         extracted_folder_name = None
@@ -956,6 +983,17 @@ class StoreBackend:
         
         return extracted_folder_name
     
+    def download_file(self, url: str, path: str) -> bool:
+        """Blocking, streams the file to disk"""
+        with self.http.stream(url, timeout=self.DOWNLOAD_TIMEOUT) as resp:
+            if resp.status_code != 200:
+                log.error(f"Failed to download {url}: {resp.status_code}")
+                return False
+            with atomic_write(path, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1024 * 64):
+                    f.write(chunk)
+        return True
+
     async def download_repo(self, repo_url:str, directory:str, commit_sha:str = None, branch_name:str = None):
         if not is_flatpak() and gl.argparser.parse_args().devel:
             await self.clone_repo(repo_url, directory, commit_sha, branch_name)
@@ -975,17 +1013,18 @@ class StoreBackend:
             # Create cache dir
             os.makedirs(os.path.join(gl.DATA_PATH, "cache"), exist_ok=True)
             zip_path = os.path.join(gl.DATA_PATH, "cache", f"{projectname}-{sha}.zip")
-            with requests.get(zip_url, stream=True, timeout=self.DOWNLOAD_TIMEOUT) as resp:
-                if resp.status_code != 200:
-                    log.error(f"Failed to download {zip_url}: {resp.status_code}")
-                    return NoConnectionError()
-                with atomic_write(zip_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=1024 * 64):
-                        f.write(chunk)
+            if not await self.http.run(self.download_file, zip_url, zip_path):
+                return NoConnectionError()
         except (requests.exceptions.RequestException, TypeError) as e:
             log.error(e)
             return NoConnectionError()
-        
+
+        await asyncio.to_thread(self.extract_repo_zip, projectname, sha, directory)
+
+        return 200
+
+    def extract_repo_zip(self, projectname: str, sha: str, directory: str):
+        """Blocking, moves the content of the downloaded archive into directory"""
         ## Extract
         if os.path.exists(os.path.join(gl.DATA_PATH, "cache", f"{projectname}-{sha}")):
             shutil.rmtree(os.path.join(gl.DATA_PATH, "cache", f"{projectname}-{sha}"))
@@ -1017,9 +1056,12 @@ class StoreBackend:
         path = os.path.join(directory, "VERSION")
         with atomic_write(path, "w") as f:
             f.write(sha)
-        
-        return 200
     
+    def add_git_safe_directory(self, local_path: str):
+        # git fails if two processes write the global config at once
+        with self.git_config_lock:
+            subprocess.call(["git", "config", "--global", "--add", "safe.directory", os.path.abspath(local_path)])
+
     async def clone_repo(self, repo_url:str, local_path:str, commit_sha:str = None, branch_name:str = None):
         # if branch_name == None and commit_sha == None:
             # Set branch_name to main branch's name
@@ -1043,7 +1085,7 @@ class StoreBackend:
 
         # Add repository to the safe directory list to avoid dubious ownership warnings
         # FIXME: Check if not already added
-        await self.subp_call(["git", "config", "--global", "--add", "safe.directory", os.path.abspath(local_path)])
+        await asyncio.to_thread(self.add_git_safe_directory, local_path)
 
         # Run git pull to create .git/FETCH_HEAD. This allows us to check for available updates
         await self.os_sys(f"cd '{local_path}' && git pull")
@@ -1066,33 +1108,59 @@ class StoreBackend:
         
         
     async def install_plugin(self, plugin_data:PluginData, auto_update: bool = False):
-        url = plugin_data.github
-
         local_path = os.path.join(gl.PLUGIN_DIR, plugin_data.plugin_id)
 
-        response = await self.download_repo(repo_url=url, directory=local_path, commit_sha=plugin_data.commit_sha, branch_name=plugin_data.branch)
-
-        # Run install script if present. Make sure to use python binary used to run this process to not break venv dependency installations
-        if os.path.isfile(os.path.join(local_path, "__install__.py")):
-            subprocess.run(f"{sys.executable} {os.path.join(local_path, '__install__.py')}", shell=True, start_new_session=True)
-
-        # Install requirements from requirements.txt
-        if os.path.isfile(os.path.join(local_path, "requirements.txt")):
-            subprocess.run(f"{sys.executable} -m pip install -r {os.path.join(local_path, 'requirements.txt')}", shell=True, start_new_session=True)
+        response = await self.fetch_plugin(plugin_data)
 
         if response == 404:
             return 404
         
+        self.reload_plugins([plugin_data.plugin_id])
+
+        log.success(f"Plugin {plugin_data.plugin_id} installed successfully under: {local_path} with sha: {plugin_data.commit_sha}")
+
+    async def fetch_plugin(self, plugin_data: PluginData):
+        """
+        Downloads the plugin and runs its install steps without loading it.
+        Safe to run for several plugins at once.
+        """
+        local_path = os.path.join(gl.PLUGIN_DIR, plugin_data.plugin_id)
+
+        response = await self.download_repo(repo_url=plugin_data.github, directory=local_path, commit_sha=plugin_data.commit_sha, branch_name=plugin_data.branch)
+
+        await asyncio.to_thread(self.run_plugin_install_scripts, local_path)
+
+        return response
+
+    def run_plugin_install_scripts(self, local_path: str):
+        """Blocking, one plugin at a time - they all install into the same environment"""
+        with self.install_script_lock:
+            # Run install script if present. Make sure to use python binary used to run this process to not break venv dependency installations
+            if os.path.isfile(os.path.join(local_path, "__install__.py")):
+                subprocess.run(f"{sys.executable} {os.path.join(local_path, '__install__.py')}", shell=True, start_new_session=True)
+
+            # Install requirements from requirements.txt
+            if os.path.isfile(os.path.join(local_path, "requirements.txt")):
+                subprocess.run(f"{sys.executable} -m pip install -r {os.path.join(local_path, 'requirements.txt')}", shell=True, start_new_session=True)
+
+    def reload_plugins(self, installed_plugin_ids: list[str]):
+        """Loads the installed plugins and refreshes the action index, ui and pages once for all of them"""
         # Update plugin manager
         gl.plugin_manager.load_plugins()
         gl.plugin_manager.init_plugins()
         gl.plugin_manager.generate_action_index()
-        plugins = gl.plugin_manager.get_plugins()
 
         # Update ui
         if recursive_hasattr(gl, "app.main_win.sidebar.action_chooser"):
             GLib.idle_add(gl.app.main_win.sidebar.action_chooser.plugin_group.update)
 
+        self.reload_active_pages()
+
+        # Notify plugin actions
+        for plugin_id in installed_plugin_ids:
+            gl.signal_manager.trigger_signal(Signals.PluginInstall, plugin_id)
+
+    def reload_active_pages(self):
         ## Update page
         for controller in gl.deck_manager.deck_controller:
             ## Checks required to prevent errors after auto-update
@@ -1101,13 +1169,12 @@ class StoreBackend:
                     # Load action objects
                     controller.active_page.load_action_objects()
                     controller.load_page(controller.active_page)
-
-        # Notify plugin actions
-        gl.signal_manager.trigger_signal(Signals.PluginInstall, plugin_data.plugin_id)
-
-        log.success(f"Plugin {plugin_data.plugin_id} installed successfully under: {local_path} with sha: {plugin_data.commit_sha}")
         
-    def uninstall_plugin(self, plugin_id:str, remove_from_pages:bool = False, remove_files:bool = True) -> bool:
+    def uninstall_plugin(self, plugin_id:str, remove_from_pages:bool = False, remove_files:bool = True, reload: bool = True) -> bool:
+        """
+        reload=False skips regenerating the action index and reloading the pages,
+        for callers that do that once after a batch.
+        """
         ## 1. Remove all action objects in all pages
         for deck_controller in gl.deck_manager.deck_controller:
             # Track all keys controlled by this plugin
@@ -1145,7 +1212,8 @@ class StoreBackend:
         # plugin_obj = gl.plugin_manager.get_plugin_by_id(plugin_id)
         gl.plugin_manager.remove_plugin_from_list(plugin)
 
-        gl.plugin_manager.generate_action_index()
+        if reload:
+            gl.plugin_manager.generate_action_index()
 
 
         del plugin
@@ -1162,14 +1230,8 @@ class StoreBackend:
         # for controller in gl.deck_manager.deck_controller:
             # controller.active_page.update_inputs_with_actions_from_plugin(plugin_id)
 
-        ## Update page
-        for controller in gl.deck_manager.deck_controller:
-            ## Checks required to prevent errors after auto-update
-            if hasattr(controller, "active_page"):
-                if controller.active_page is not None:
-                    # Load action objects
-                    controller.active_page.load_action_objects()
-                    controller.load_page(controller.active_page)
+        if reload:
+            self.reload_active_pages()
 
     async def download_page(self, page_data:PageData) -> str:
         """
@@ -1205,7 +1267,7 @@ class StoreBackend:
 
         await self.uninstall_icon(icon_data)
 
-        await self.download_repo(repo_url=icon_data.github, directory=icon_path, commit_sha=icon_data.commit_sha)
+        return await self.download_repo(repo_url=icon_data.github, directory=icon_path, commit_sha=icon_data.commit_sha)
 
     async def uninstall_icon(self, icon_data:IconData):
         folder_name = icon_data.icon_id
@@ -1217,7 +1279,7 @@ class StoreBackend:
 
         await self.uninstall_wallpaper(wallpaper_data)
 
-        await self.download_repo(repo_url=wallpaper_data.github, directory=wallpaper_path, commit_sha=wallpaper_data.commit_sha)
+        return await self.download_repo(repo_url=wallpaper_data.github, directory=wallpaper_path, commit_sha=wallpaper_data.commit_sha)
 
     async def uninstall_wallpaper(self, wallpaper_data:WallpaperData):
         folder_name = wallpaper_data.wallpaper_id
@@ -1271,21 +1333,67 @@ class StoreBackend:
 
         return plugins_to_update
     
-    async def update_all_plugins(self) -> int:
+    async def run_updates(self, assets: list, install_func: callable, get_id: callable, on_progress: callable = None) -> list:
+        """
+        Runs install_func for all assets, at most MAX_PARALLEL_UPDATES at a time.
+        on_progress(asset_id, status) is called with "downloading", "done" or "failed" for every asset.
+        Returns the assets that were installed.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_UPDATES)
+
+        def report(asset_id: str, status: str):
+            log.info(f"Update of {asset_id}: {status}")
+            if on_progress is not None:
+                on_progress(asset_id, status)
+
+        async def run(asset):
+            asset_id = get_id(asset)
+            async with semaphore:
+                report(asset_id, "downloading")
+                try:
+                    response = await install_func(asset)
+                except Exception as e:
+                    log.exception(e)
+                    response = None
+                    failed = True
+                else:
+                    failed = isinstance(response, NoConnectionError) or response == 404
+            report(asset_id, "failed" if failed else "done")
+            return None if failed else asset
+
+        results = await asyncio.gather(*[run(asset) for asset in assets], return_exceptions=True)
+        installed = []
+        for asset, result in zip(assets, results):
+            if isinstance(result, BaseException):
+                log.error(f"Update of {get_id(asset)} failed: {result}")
+                continue
+            if result is not None:
+                installed.append(result)
+        return installed
+
+    async def update_all_plugins(self, on_progress: callable = None) -> int:
         """
         Returns number of updated plugins
         """
         plugins_to_update = await self.get_plugins_to_update()
         if isinstance(plugins_to_update, NoConnectionError):
             return plugins_to_update
+        if not plugins_to_update:
+            return 0
+
+        # Touches the plugin manager and the pages, so one after the other - but without reloading after each
         for plugin in plugins_to_update:
             try:
-                self.uninstall_plugin(plugin.plugin_id, remove_from_pages=False, remove_files=False)
+                self.uninstall_plugin(plugin.plugin_id, remove_from_pages=False, remove_files=False, reload=False)
             except Exception as e:
                 log.error(e)
-            await self.install_plugin(plugin)
+
+        updated = await self.run_updates(plugins_to_update, self.fetch_plugin, lambda plugin: plugin.plugin_id, on_progress)
+
+        # Also brings back the ones that failed, their old files are still there
+        self.reload_plugins([plugin.plugin_id for plugin in updated])
         
-        return len(plugins_to_update)
+        return len(updated)
 
     async def get_icons_to_update(self):
         icons = await self.get_all_icons()
@@ -1303,17 +1411,16 @@ class StoreBackend:
                 
         return icons_to_update
     
-    async def update_all_icons(self) -> int:
+    async def update_all_icons(self, on_progress: callable = None) -> int:
         """
         Returns number of updated icons
         """
         icons_to_update = await self.get_icons_to_update()
         if isinstance(icons_to_update, NoConnectionError):
             return icons_to_update
-        for icon in icons_to_update:
-            await self.install_icon(icon)
+        updated = await self.run_updates(icons_to_update, self.install_icon, lambda icon: icon.icon_id, on_progress)
 
-        return len(icons_to_update)
+        return len(updated)
     
     async def get_wallpapers_to_update(self):
         wallpapers = await self.get_all_wallpapers()
@@ -1331,27 +1438,33 @@ class StoreBackend:
 
         return wallpapers_to_update
     
-    async def update_all_wallpapers(self) -> int:
+    async def update_all_wallpapers(self, on_progress: callable = None) -> int:
         """
         Returns number of updated wallpapers
         """
         wallpapers_to_update = await self.get_wallpapers_to_update()
         if isinstance(wallpapers_to_update, NoConnectionError):
             return wallpapers_to_update
-        for wallpaper in wallpapers_to_update:
-            await self.install_wallpaper(wallpaper)
+        updated = await self.run_updates(wallpapers_to_update, self.install_wallpaper, lambda wallpaper: wallpaper.wallpaper_id, on_progress)
 
-        return len(wallpapers_to_update)
+        return len(updated)
 
-    async def update_everything(self) -> int:
+    async def update_everything(self, on_progress: callable = None) -> int:
         """
         Returns number of updated assets
         """
-        n_plugins = await self.update_all_plugins()
-        n_icons = await self.update_all_icons()
-        n_wallpapers = await self.update_all_wallpapers()
+        results = await asyncio.gather(
+            self.update_all_plugins(on_progress),
+            self.update_all_icons(on_progress),
+            self.update_all_wallpapers(on_progress),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.error(f"Failed to update assets: {result}")
 
+        n_plugins, n_icons, n_wallpapers = results
         if isinstance(n_plugins, NoConnectionError) or isinstance(n_icons, NoConnectionError):
             return NoConnectionError()
 
-        return n_plugins + n_icons + n_wallpapers
+        return sum(n for n in results if isinstance(n, int))
@@ -1,3 +1,4 @@
+import atexit
 import json
 import os
 import threading
@@ -5,7 +6,14 @@ import time
 from loguru import logger as log
 
 import globals as gl
-from src.backend.Utils.AtomicSaveUtils import atomic_save_json
+from src.backend.Utils.AtomicSaveUtils import atomic_save_json, atomic_write
+
+# Files without an ETag or Last-Modified are refetched after this, the others get revalidated
+DAYS_TO_KEEP = 3
+# Revalidatable files nobody asked for in this long are removed anyway
+DAYS_TO_KEEP_UNUSED = 30
+# Seconds to wait for more changes before writing files.json, a store page fetches hundreds of files
+SAVE_DELAY = 1
 
 class StoreCache:
     def __init__(self):
@@ -15,6 +23,11 @@ class StoreCache:
         self.files_dir = os.path.join(self.CACHE_PATH, "files")
 
         self.write_lock = threading.Lock()
+        # Guards self.files, the store pages fetch from several threads
+        self.files_lock = threading.RLock()
+        self.save_timer: threading.Timer = None
+        # Don't lose the index if the app quits before the timer fires
+        atexit.register(self.flush)
 
         self.files = self.get_files()
         self.remove_old_cache_files()
@@ -33,23 +46,49 @@ class StoreCache:
             return {}
         
     def set_files(self, files: dict):
+        """Makes files the index, it is written once no further change came in for SAVE_DELAY seconds"""
+        with self.files_lock:
+            self.files = files
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+            self.save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+
+    def flush(self) -> None:
+        """Writes pending changes of the index now"""
+        # The snapshot is taken under write_lock, so an older one can never be written over a newer one
         with self.write_lock:
-            atomic_save_json(self.files_json, files.copy(), indent=4)
+            with self.files_lock:
+                if self.save_timer is None:
+                    return
+                self.save_timer.cancel()
+                self.save_timer = None
+                files = {string: entry.copy() for string, entry in self.files.items()}
+            try:
+                atomic_save_json(self.files_json, files, indent=4)
+            except OSError as e:
+                log.error(f"Failed to save store cache index: {e}")
 
     def remove_old_cache_files(self):
-        DAYS_TO_KEEP = 3
-        for string in self.files.copy():
-            path = self.files[string].get("path")
-            if not os.path.exists(path):
-                continue
-            date = self.files[string].get("date")
-            if date is None:
-                os.remove(path)
-                self.files.pop(string)
-
-            if time.time() - date > DAYS_TO_KEEP * 24 * 60 * 60:
-                os.remove(path)
-                self.files.pop(string)
+        with self.files_lock:
+            for string in list(self.files):
+                path = self.files[string].get("path")
+                if path is None or not os.path.exists(path):
+                    self.files.pop(string)
+                    continue
+
+                date = self.files[string].get("date")
+                if date is None:
+                    max_age = 0
+                elif self.has_validators(string):
+                    max_age = DAYS_TO_KEEP_UNUSED * 24 * 60 * 60
+                else:
+                    max_age = DAYS_TO_KEEP * 24 * 60 * 60
+
+                if date is None or time.time() - date > max_age:
+                    os.remove(path)
+                    self.files.pop(string)
 
         self.set_files(self.files)
 
@@ -89,36 +128,82 @@ class StoreCache:
         # return os.path.join(self.files_dir, self.generate_cache_string(url, path, branch, data_type))
 
         cache_string = self.generate_cache_string(url, path, branch, data_type)
-        if cache_string in self.files:
-            return self.files[cache_string].get("path")
-        
-        else:
+        with self.files_lock:
+            if cache_string in self.files:
+                return self.files[cache_string].get("path")
+
             path = os.path.join(self.files_dir, cache_string)
             self.files[cache_string] = {
                 "path": path,
                 "date": time.time()
             }
-            self.set_files(self.files)
-            return path
+        self.set_files(self.files)
+        return path
     
     def is_cached(self, url: str, path: str, branch: str = "main", data_type: str = "text") -> bool:
         cache_string = self.generate_cache_string(url, path, branch, data_type)
-        if cache_string not in self.files:
+        with self.files_lock:
+            entry = self.files.get(cache_string)
+        if entry is None or entry.get("path") is None:
             return False
         
-        if self.files[cache_string].get("path") is None:
+        return os.path.exists(entry.get("path"))
+
+    def is_fresh(self, url: str, path: str, branch: str = "main", data_type: str = "text") -> bool:
+        """Whether the cached file is recent enough to be used without asking the server"""
+        cache_string = self.generate_cache_string(url, path, branch, data_type)
+        with self.files_lock:
+            date = self.files.get(cache_string, {}).get("date")
+        if date is None:
             return False
-        
-        return os.path.exists(self.files[cache_string].get("path"))
+        return time.time() - date <= DAYS_TO_KEEP * 24 * 60 * 60
 
-    def open_cache_file(self, url: str, path: str, branch: str = "main", data_type: str = "text", mode: str = "r") -> str:
+    def has_validators(self, cache_string: str) -> bool:
+        with self.files_lock:
+            entry = self.files.get(cache_string, {})
+            return bool(entry.get("etag") or entry.get("last-modified"))
+
+    def get_validators(self, url: str, path: str, branch: str = "main", data_type: str = "text") -> dict:
+        """The ETag and Last-Modified the cached file was served with"""
+        cache_string = self.generate_cache_string(url, path, branch, data_type)
+        with self.files_lock:
+            entry = self.files.get(cache_string, {})
+            return {key: entry[key] for key in ("etag", "last-modified") if entry.get(key)}
+
+    def mark_revalidated(self, url: str, path: str, branch: str = "main", data_type: str = "text") -> None:
+        """The server confirmed the cached file is still current"""
+        cache_string = self.generate_cache_string(url, path, branch, data_type)
+        with self.files_lock:
+            if cache_string not in self.files:
+                return
+            self.files[cache_string]["date"] = time.time()
+        self.set_files(self.files)
+
+    def write_cache_file(self, url: str, path: str, data: str | bytes, branch: str = "main", data_type: str = "text", validators: dict = None) -> None:
         cache_path = self.get_cache_path(url, path, branch, data_type)
         os.makedirs(os.path.dirname(cache_path), exist_ok=True)
 
-        self.files[self.generate_cache_string(url, path, branch, data_type)] = {
-            "path": cache_path,
-            "date": time.time()
-        }
+        with atomic_write(cache_path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+
+        with self.files_lock:
+            self.files[self.generate_cache_string(url, path, branch, data_type)] = {
+                "path": cache_path,
+                "date": time.time(),
+                **(validators or {})
+            }
         self.set_files(self.files)
+
+    def open_cache_file(self, url: str, path: str, branch: str = "main", data_type: str = "text", mode: str = "r") -> str:
+        cache_path = self.get_cache_path(url, path, branch, data_type)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+        if "r" not in mode:
+            with self.files_lock:
+                self.files[self.generate_cache_string(url, path, branch, data_type)] = {
+                    "path": cache_path,
+                    "date": time.time()
+                }
+            self.set_files(self.files)
         
         return open(cache_path, mode)
\ No newline at end of file
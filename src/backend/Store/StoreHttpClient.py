@@ -0,0 +1,96 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Parallel requests to the store, GitHub starts to throttle far above this
+MAX_CONCURRENT_REQUESTS = 16
+
+
+class StoreHttpClient:
+    """
+    One pooled requests session for all store requests.
+    The blocking calls run on a small executor so async callers don't stall their loop,
+    its size bounds how many requests are in flight at once - across all loops, the store
+    pages each run their own asyncio.run.
+    """
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS, timeout: tuple = (10, 30)):
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_concurrent, pool_maxsize=max_concurrent)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="store-http")
+
+        self.stats_lock = threading.Lock()
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    def get(self, url: str, headers: dict = None, timeout: tuple = None) -> requests.Response:
+        """Blocking GET on the shared session, the body is read before returning"""
+        with self._track_in_flight():
+            return self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+
+    @contextmanager
+    def stream(self, url: str, timeout: tuple = None):
+        """Blocking streamed GET for large downloads, counts as in flight until the block is left"""
+        with self._track_in_flight():
+            with self.session.get(url, stream=True, timeout=timeout or self.timeout) as response:
+                yield response
+
+    @contextmanager
+    def _track_in_flight(self):
+        with self.stats_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            with self.stats_lock:
+                self.in_flight -= 1
+
+    async def get_async(self, url: str, headers: dict = None, timeout: tuple = None) -> requests.Response:
+        return await self.run(self.get, url, headers, timeout)
+
+    async def run(self, func: callable, *args):
+        """Runs a blocking function that talks to the network on the request executor"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    @staticmethod
+    def get_validators(response: requests.Response) -> dict:
+        """The ETag and Last-Modified of a response, whatever the server sent"""
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["last-modified"] = response.headers["Last-Modified"]
+        return validators
+
+    @staticmethod
+    def get_conditional_headers(validators: dict) -> dict:
+        """Request headers that let the server answer 304 if nothing changed"""
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last-modified"):
+            headers["If-Modified-Since"] = validators["last-modified"]
+        return headers
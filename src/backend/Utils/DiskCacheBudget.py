@@ -0,0 +1,111 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import threading
+
+from loguru import logger as log
+
+
+class DiskCacheBudget:
+    """
+    Keeps the files of a cache folder below a byte budget. The mtime of a file marks its last use,
+    the least recently used files are deleted first - down to 3/4 of the budget, so not every
+    write has to prune.
+    """
+    def __init__(self, directory: str, budget_bytes: int, suffix: str = "", recursive: bool = False):
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        self.suffix = suffix
+        # Also count the files in sub folders
+        self.recursive = recursive
+        # Size of the folder, counted on the first write
+        self.n_bytes: int = None
+        self.lock = threading.Lock()
+
+    def touch(self, path: str) -> None:
+        """Marks path as just used"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def add(self, path: str, keep: tuple[str] = ()) -> None:
+        """Counts the newly written path and prunes the folder if that went over the budget, sparing keep"""
+        try:
+            n_bytes = os.path.getsize(path)
+        except OSError:
+            return
+
+        with self.lock:
+            if self.n_bytes is None:
+                self.n_bytes = sum(size for _, size, _ in self.list_files())
+            else:
+                self.n_bytes += n_bytes
+            if self.n_bytes > self.budget_bytes:
+                self._prune(keep=(path, *keep))
+
+    def remove(self, path: str) -> None:
+        try:
+            n_bytes = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self.lock:
+            if self.n_bytes is not None:
+                self.n_bytes = max(0, self.n_bytes - n_bytes)
+
+    def list_files(self) -> list[tuple[str, int, float]]:
+        """(path, size, mtime) of the files in the folder"""
+        files = []
+        if self.recursive:
+            directories = [root for root, _, _ in os.walk(self.directory)]
+        else:
+            directories = [self.directory]
+
+        entries = []
+        for directory in directories:
+            try:
+                entries.extend(os.scandir(directory))
+            except OSError:
+                continue
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((entry.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _prune(self, keep: tuple[str]) -> None:
+        files = self.list_files()
+        total = sum(size for _, size, _ in files)
+        target = self.budget_bytes * 3 // 4
+        n_removed = 0
+        for path, size, _ in sorted(files, key=lambda file: file[2]):
+            if total <= target:
+                break
+            if path in keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                log.warning(f"Failed to remove cached file {path}: {e}")
+                continue
+            total -= size
+            n_removed += 1
+        self.n_bytes = total
+        log.debug(f"[disk-cache] pruned {self.directory} removed={n_removed} bytes={total}")
@@ -0,0 +1,205 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import atexit
+import json
+import os
+import shutil
+import threading
+
+from loguru import logger as log
+
+from src.backend.Utils.AtomicSaveUtils import atomic_write
+
+# Changes to a file within this many seconds end up in a single write
+SAVE_DELAY = 0.5
+
+
+class JsonFileEntry:
+    def __init__(self, data: dict, stat_key: tuple = None, valid: bool = False, text: str = None):
+        self.data = data
+        # (mtime_ns, size) of the file data was read from or written to, None if there is no file
+        self.stat_key = stat_key
+        # Whether that file is known to hold valid json
+        self.valid = valid
+        # data as json, kept to hand out copies without walking the dict
+        self.text = text
+        # Not written yet
+        self.dirty = False
+
+
+class JsonFileStore:
+    """
+    Parsed json files, shared by everything that reads the same file.
+    A file is only read again if its mtime or size changed. Saves are written behind,
+    a burst of changes results in one write instead of one per change.
+    """
+    def __init__(self, save_delay: float = SAVE_DELAY):
+        self.save_delay = save_delay
+
+        self.entries: dict[str, JsonFileEntry] = {}
+        self.timers: dict[str, threading.Timer] = {}
+        self.lock = threading.RLock()
+
+        # Don't lose the changes if the app quits before a timer fires
+        atexit.register(self.flush_all)
+
+    @staticmethod
+    def _get_key(path: str) -> str:
+        return os.path.abspath(path)
+
+    @staticmethod
+    def _get_stat_key(path: str) -> tuple | None:
+        try:
+            stat = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path: str) -> dict:
+        """The dict of the file, shared - changes show up for every reader of it"""
+        return self._get_entry(path).data
+
+    def get_copy(self, path: str) -> dict:
+        """A private copy for callers that modify the data before deciding what to save"""
+        with self.lock:
+            entry = self._get_entry(path)
+            if entry.text is None:
+                entry.text = json.dumps(entry.data)
+            return json.loads(entry.text)
+
+    def _get_entry(self, path: str) -> JsonFileEntry:
+        key = self._get_key(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            # Unwritten changes are newer than the file
+            if entry is not None and (entry.dirty or entry.stat_key == self._get_stat_key(path)):
+                return entry
+
+            entry = self._load(path)
+            self.entries[key] = entry
+            return entry
+
+    def _load(self, path: str) -> JsonFileEntry:
+        stat_key = self._get_stat_key(path)
+        if stat_key is None:
+            return JsonFileEntry({})
+
+        try:
+            with open(path) as f:
+                text = f.read()
+            data = json.loads(text)
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
+            log.error(f"Invalid json in {path}: {e}")
+            self._keep_corrupt_file(path)
+            # Remember the stat anyway, so the broken file isn't parsed over and over
+            return JsonFileEntry({}, stat_key)
+
+        return JsonFileEntry(data, stat_key, valid=True, text=text)
+
+    @staticmethod
+    def _keep_corrupt_file(path: str) -> None:
+        """Copies a file that didn't parse aside, the next save would overwrite it"""
+        corrupt_path = f"{path}.corrupt"
+        try:
+            shutil.copy2(path, corrupt_path)
+        except OSError as e:
+            log.error(f"Failed to keep a copy of {path}: {e}")
+            return
+        log.warning(f"Kept a copy of {path} in {corrupt_path}")
+
+    def put(self, path: str, data: dict) -> None:
+        """Makes data the content of the file, it gets written within save_delay seconds"""
+        key = self._get_key(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = JsonFileEntry(data)
+                self.entries[key] = entry
+
+            entry.data = data
+            entry.text = None
+            entry.dirty = True
+
+            # Not restarted on every change, a steady stream of edits still gets written regularly
+            if key not in self.timers:
+                self._start_timer(key, path)
+
+    def _start_timer(self, key: str, path: str) -> None:
+        timer = threading.Timer(self.save_delay, self.flush, args=(path,))
+        timer.daemon = True
+        self.timers[key] = timer
+        timer.start()
+
+    def flush(self, path: str) -> None:
+        """Writes pending changes of the file now"""
+        key = self._get_key(path)
+        with self.lock:
+            timer = self.timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+
+            entry = self.entries.get(key)
+            if entry is None or not entry.dirty:
+                return
+
+            try:
+                text = json.dumps(entry.data, indent=4)
+            except RuntimeError as e:
+                # The dict was changed by another thread while it got serialized
+                log.warning(f"{path} changed while saving, retrying: {e}")
+                entry.dirty = False
+                self.put(path, entry.data)
+                return
+
+            try:
+                self._make_backup(path, entry)
+                with atomic_write(path, "w") as f:
+                    f.write(text)
+            except Exception as e:
+                # Runs on the timer thread, nobody else would see the error. Keep the changes and try again
+                log.error(f"Failed to save {path}, retrying: {e}")
+                self._start_timer(key, path)
+                return
+
+            entry.dirty = False
+            entry.text = text
+            entry.stat_key = self._get_stat_key(path)
+            entry.valid = True
+
+    def flush_all(self) -> None:
+        with self.lock:
+            paths = [path for path, entry in self.entries.items() if entry.dirty]
+        for path in paths:
+            self.flush(path)
+
+    def _make_backup(self, path: str, entry: JsonFileEntry) -> None:
+        """Called before path gets overwritten, subclasses can keep the previous version"""
+
+    def forget(self, path: str) -> None:
+        """Drops the file including unwritten changes, for files that get deleted"""
+        key = self._get_key(path)
+        with self.lock:
+            timer = self.timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self.entries.pop(key, None)
+
+    def evict(self, path: str) -> None:
+        """Drops the parsed file to free memory, unless it has unwritten changes"""
+        key = self._get_key(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and not entry.dirty:
+                del self.entries[key]
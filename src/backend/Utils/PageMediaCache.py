@@ -0,0 +1,62 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+
+class PageMediaCache:
+    """
+    Decoded page media keyed on (path, mtime, is_svg), so re-visiting a page doesn't re-decode
+    it from disk every time. Holds up to max_entries images, the least recently used ones are
+    dropped first. GIFs/videos aren't cached here since they animate.
+
+    get() returns the cached image itself, callers copy it before handing it out.
+    """
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.cache: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, path: str, mtime: float, is_svg: bool, decode: callable) -> Image.Image:
+        """The cached image, decode() is only called if there is none yet"""
+        key = (path, mtime, is_svg)
+        with self.lock:
+            image = self.cache.get(key)
+            if image is not None:
+                self.cache.move_to_end(key)
+                return image
+
+        image = decode()
+        with self.lock:
+            self.cache[key] = image
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return image
+
+    def contains(self, path: str) -> bool:
+        with self.lock:
+            return any(key[0] == path for key in self.cache)
+
+    def discard(self, path: str) -> int:
+        """Drops all images of path, returns their size in bytes"""
+        n_bytes = 0
+        with self.lock:
+            for key in [key for key in self.cache if key[0] == path]:
+                image = self.cache.pop(key)
+                n_bytes += image.width * image.height * len(image.getbands())
+        return n_bytes
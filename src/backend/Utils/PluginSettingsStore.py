@@ -0,0 +1,129 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import copy
+import threading
+
+from loguru import logger as log
+
+from src.backend.Utils.JsonFileStore import JsonFileStore
+
+SETTINGS_FILE_VERSION = "2.0"
+
+
+class PluginSettingsStore:
+    """
+    The settings of one plugin, kept in a settings file of the form {"file-version": "2.0", "settings": {...}}.
+    The parsed file comes from a JsonFileStore, so it is only read again if it changed on disk and
+    written behind. Files in the old format without the envelope are converted on the first read.
+    """
+    # Shared by the settings of all plugins, created on first use
+    _shared_file_store: JsonFileStore = None
+    _shared_file_store_lock = threading.Lock()
+
+    @classmethod
+    def get_shared_file_store(cls) -> JsonFileStore:
+        with cls._shared_file_store_lock:
+            if cls._shared_file_store is None:
+                cls._shared_file_store = JsonFileStore()
+            return cls._shared_file_store
+
+    @classmethod
+    def flush_shared_file_store(cls) -> None:
+        """Writes the pending changes of all plugins"""
+        with cls._shared_file_store_lock:
+            file_store = cls._shared_file_store
+        if file_store is not None:
+            file_store.flush_all()
+
+    def __init__(self, path: str, file_store: JsonFileStore = None):
+        self.path = path
+        self.file_store = file_store
+        # The file content last seen in the file store, a different object means it was changed on disk
+        self.content: dict = None
+        self.lock = threading.RLock()
+        self.callbacks: list[callable] = []
+
+    def get_file_store(self) -> JsonFileStore:
+        if self.file_store is None:
+            self.file_store = self.get_shared_file_store()
+        return self.file_store
+
+    def get_settings(self) -> dict:
+        """A copy of the settings, an empty dict if there is no settings file"""
+        with self.lock:
+            content = self._get_content()
+            settings = copy.deepcopy(self._get_settings_from_content(content))
+
+            if content and content.get("file-version") != SETTINGS_FILE_VERSION:
+                # Is the old format, convert it
+                self._put_content({
+                    "file-version": SETTINGS_FILE_VERSION,
+                    "settings": content
+                })
+            return settings
+
+    def set_settings(self, settings: dict) -> None:
+        """Makes settings the new settings, the file is written within the save delay of the file store"""
+        with self.lock:
+            content = self._get_content()
+            old_settings = self._get_settings_from_content(content)
+
+            if content.get("file-version") == SETTINGS_FILE_VERSION:
+                new_content = content.copy()
+            else:
+                new_content = {"file-version": SETTINGS_FILE_VERSION}
+            # The caller may keep modifying its dict until the write happens
+            new_content["settings"] = copy.deepcopy(settings)
+
+            self._put_content(new_content)
+
+        if settings != old_settings:
+            self._notify_changed(settings)
+
+    @staticmethod
+    def _get_settings_from_content(content: dict) -> dict:
+        if content.get("file-version") == SETTINGS_FILE_VERSION:
+            return content.get("settings", {})
+        # Old format without the envelope
+        return content
+
+    def _get_content(self) -> dict:
+        content = self.get_file_store().get(self.path)
+        if content is not self.content:
+            previous = self.content
+            self.content = content
+            if previous is not None:
+                # Edited outside of set_settings
+                self._notify_changed(self._get_settings_from_content(content))
+        return content
+
+    def _put_content(self, content: dict) -> None:
+        self.content = content
+        self.get_file_store().put(self.path, content)
+
+    def connect_changed(self, callback: callable) -> None:
+        if callback not in self.callbacks:
+            self.callbacks.append(callback)
+
+    def disconnect_changed(self, callback: callable) -> None:
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def _notify_changed(self, settings: dict) -> None:
+        for callback in list(self.callbacks):
+            try:
+                callback(copy.deepcopy(settings))
+            except Exception as e:
+                log.error(f"Error in settings callback of {self.path}: {e}")
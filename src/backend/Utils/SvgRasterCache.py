@@ -0,0 +1,157 @@
+"""
+Author: Core447
+Year: 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This programm comes with ABSOLUTELY NO WARRANTY!
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from loguru import logger as log
+from PIL import Image
+
+from src.backend.Utils.AtomicSaveUtils import atomic_write
+from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
+
+# A 192x192 icon takes ~144 KB
+MEMORY_BUDGET_BYTES = 48 * 1024 * 1024
+# The same icon as a PNG is ~10-30 KB
+DISK_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class SvgRasterCache:
+    """
+    Rasterized SVGs keyed by (path, mtime, width, height), shared by key media,
+    the icon browser and the thumbnails. Kept in memory up to a byte budget and,
+    if a folder is given, as PNGs on disk so they survive a restart. The folder is
+    kept below its own byte budget, the least recently used PNGs are deleted first.
+
+    get() hands out copies, callers are free to modify or close them.
+    """
+    def __init__(self, disk_dir: str = None, budget_bytes: int = MEMORY_BUDGET_BYTES,
+                 disk_budget_bytes: int = DISK_BUDGET_BYTES):
+        self.disk_dir = disk_dir
+        self.budget_bytes = budget_bytes
+        self.disk_budget = DiskCacheBudget(disk_dir, disk_budget_bytes, suffix=".png") if disk_dir is not None else None
+        self.cache_bytes = 0
+        self.cache: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+
+    def get(self, svg_path: str, width: int, height: int, render: callable) -> Image.Image:
+        """The cached raster, render() is only called if there is none yet"""
+        stat = os.stat(svg_path)
+        key = (os.path.abspath(svg_path), stat.st_mtime_ns, width, height)
+
+        with self.lock:
+            image = self.cache.get(key)
+            if image is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return image.copy()
+
+        image = self._load_from_disk(key)
+        if image is not None:
+            with self.lock:
+                self.disk_hits += 1
+        else:
+            image = render()
+            image.load()
+            with self.lock:
+                self.misses += 1
+            self._save_to_disk(key, image)
+
+        self._remember(key, image)
+        return image.copy()
+
+    def _remember(self, key: tuple, image: Image.Image) -> None:
+        n_bytes = image.width * image.height * len(image.getbands())
+        with self.lock:
+            old = self.cache.pop(key, None)
+            if old is not None:
+                self.cache_bytes -= old.width * old.height * len(old.getbands())
+            self.cache[key] = image
+            self.cache_bytes += n_bytes
+
+            while self.cache_bytes > self.budget_bytes and len(self.cache) > 1:
+                dropped = self.cache.popitem(last=False)[1]
+                self.cache_bytes -= dropped.width * dropped.height * len(dropped.getbands())
+
+    def _get_disk_path(self, key: tuple) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.disk_dir, f"{name}.png")
+
+    def _load_from_disk(self, key: tuple) -> Image.Image | None:
+        if self.disk_dir is None:
+            return None
+        path = self._get_disk_path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with Image.open(path) as image:
+                image = image.copy()
+        except OSError as e:
+            log.warning(f"Failed to read cached svg raster {path}: {e}")
+            return None
+        self.disk_budget.touch(path)
+        return image
+
+    def _save_to_disk(self, key: tuple, image: Image.Image) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._get_disk_path(key)
+        try:
+            with atomic_write(path, "wb") as f:
+                image.save(f, "PNG")
+        except (OSError, ValueError) as e:
+            log.warning(f"Failed to cache svg raster of {key[0]}: {e}")
+            return
+
+        self.disk_budget.add(path)
+
+    def contains(self, svg_path: str) -> bool:
+        """Whether a raster of svg_path is in memory, at any size"""
+        svg_path = os.path.abspath(svg_path)
+        with self.lock:
+            return any(key[0] == svg_path for key in self.cache)
+
+    def discard(self, svg_path: str) -> int:
+        """Drops the rasters of svg_path from memory, the PNGs on disk stay. Returns the bytes freed"""
+        svg_path = os.path.abspath(svg_path)
+        n_bytes = 0
+        with self.lock:
+            for key in [key for key in self.cache if key[0] == svg_path]:
+                image = self.cache.pop(key)
+                n_image_bytes = image.width * image.height * len(image.getbands())
+                self.cache_bytes -= n_image_bytes
+                n_bytes += n_image_bytes
+        return n_bytes
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+            self.cache_bytes = 0
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self.cache),
+                "bytes": self.cache_bytes,
+                "disk_bytes": None if self.disk_budget is None else self.disk_budget.n_bytes,
+            }
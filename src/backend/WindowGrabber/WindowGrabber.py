@@ -132,30 +132,19 @@ class WindowGrabber:
                 continue
 
             found_page = False
-            for page_path in gl.page_manager.get_pages():
-                info = gl.page_manager.get_auto_change_settings(page_path)
-                wm_regex = info.get("wm-class", ".*")
-                title_regex = info.get("title", ".*")
-                enabled = info.get("enable", False)
-                decks = info.get("decks", [])
-                if not enabled:
-                    continue
-
-                if self.get_is_window_matching(window, wm_regex, title_regex):
-                    if not deck_controller.deck.is_open():
-                        continue
-                    if deck_controller.serial_number() not in decks:
-                        continue
-
-                    if deck_controller.active_page.json_path != page_path:
-                        log.debug(f"Auto changing page: {page_path} on deck {deck_controller.deck.get_serial_number()}")
-                        page = gl.page_manager.get_page(page_path, deck_controller)
-                        if not deck_controller.page_auto_loaded:
-                            deck_controller.last_manual_loaded_page_path = deck_controller.active_page.json_path
-                        deck_controller.load_page(page)
-                    deck_controller.page_auto_loaded = True
-                    found_page = True
-                    break
+            # Already narrowed down to the pages enabled for this deck
+            page_path = None
+            if deck_controller.deck.is_open():
+                page_path = gl.page_manager.auto_change_index.find_page(deck_controller.serial_number(), window)
+            if page_path is not None:
+                if deck_controller.active_page.json_path != page_path:
+                    log.debug(f"Auto changing page: {page_path} on deck {deck_controller.deck.get_serial_number()}")
+                    page = gl.page_manager.get_page(page_path, deck_controller)
+                    if not deck_controller.page_auto_loaded:
+                        deck_controller.last_manual_loaded_page_path = deck_controller.active_page.json_path
+                    deck_controller.load_page(page)
+                deck_controller.page_auto_loaded = True
+                found_page = True
 
             if not found_page:
                 if deck_controller is None:
@@ -166,7 +155,7 @@ class WindowGrabber:
                     return
 
                 if deck_controller.page_auto_loaded:
-                    active_page_change_info = gl.page_manager.get_auto_change_settings(deck_controller.active_page.json_path)
+                    active_page_change_info = gl.page_manager.auto_change_index.get_settings(deck_controller.active_page.json_path)
                     if active_page_change_info.get("stay-on-page", True):
                         continue
                     deck_controller.page_auto_loaded = False
@@ -25,6 +25,7 @@ import os
 from loguru import logger as log
 
 # Import own modules
+from src.backend.DeckManagement.HelperMethods import is_video, is_image, is_svg
 from src.windows.AssetManager.ChooserPage import ChooserPage
 from src.windows.AssetManager.CustomAssets.FlowBox import CustomAssetChooserFlowBox
 from src.windows.AssetManager.CustomAssets.AssetPreview import AssetPreview
@@ -82,16 +83,34 @@ class CustomAssetChooser(ChooserPage):
     
     def add_files(self, files: list) -> None:
         gl.asset_manager.set_cursor_from_name("wait")
+        local_paths = []
         for path in files:
 
             url = path.get_uri()
             path = path.get_path()
 
+            if path is not None:
+                # Imported together below
+                local_paths.append(path)
+                continue
+
             # gl.asset_manager_backend.add_custom_media_set_by_ui(url=url, path=path)
             threading.Thread(target=gl.asset_manager_backend.add_custom_media_set_by_ui, args=(url, path), name="add_custom_media_set_by_ui").start()
 
+        if local_paths:
+            threading.Thread(target=self.add_local_files, args=(local_paths,), name="add_local_files").start()
+
         gl.asset_manager.set_cursor_from_name("default")
 
+    def add_local_files(self, paths: list[str]) -> None:
+        paths = [path for path in paths if is_video(path) or is_image(path) or is_svg(path)]
+        known_ids = {asset["id"] for asset in gl.asset_manager_backend.get_all()}
+        for asset_id in gl.asset_manager_backend.add_many(paths):
+            if asset_id is None or asset_id in known_ids:
+                continue
+            known_ids.add(asset_id)
+            self.add_asset(gl.asset_manager_backend.get_by_id(asset_id))
+
     def show_for_path(self, path):
         if not self.build_finished:
             self.build_task_finished_tasks.append(lambda: self.asset_chooser.show_for_path(path))
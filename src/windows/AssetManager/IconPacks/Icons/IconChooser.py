@@ -72,6 +72,8 @@ class IconChooserPage(ChooserPage):
         self.scroll_to_selected: bool = False
         self.pack: "IconPack" = None
         self.icons: list["Icon"] = []
+        # Built in the search thread the first time they are needed
+        self.search_indexes: list[IconSearch.SearchIndex] = None
         self.icon_objects: dict[str, IconObject] = {}
         self.all_packs: bool = False
 
@@ -289,21 +291,23 @@ class IconChooserPage(ChooserPage):
         icons = gl.icon_pack_manager.get_all_icons()
         # Creating the wrappers takes a moment for a few thousand icons
         icon_objects = {icon.path: IconObject(icon) for icon in icons}
+        search_indexes = IconSearch.get_indexes(icons)
 
-        GLib.idle_add(self.finish_load_all_packs, load_id, icons, icon_objects)
+        GLib.idle_add(self.finish_load_all_packs, load_id, icons, icon_objects, search_indexes)
 
-    def finish_load_all_packs(self, load_id: int, icons: list["Icon"], icon_objects: dict) -> bool:
+    def finish_load_all_packs(self, load_id: int, icons: list["Icon"], icon_objects: dict, search_indexes: list) -> bool:
         if load_id != self.load_id:
             # The user has already switched to something else
             return False
 
-        self.apply_icons(icons, icon_objects=icon_objects)
+        self.apply_icons(icons, icon_objects=icon_objects, search_indexes=search_indexes)
         self.set_loading(False)
 
         return False
 
-    def apply_icons(self, icons: list["Icon"], icon_objects: dict = None) -> None:
+    def apply_icons(self, icons: list["Icon"], icon_objects: dict = None, search_indexes: list = None) -> None:
         self.icons = icons
+        self.search_indexes = search_indexes
         self.icon_objects = icon_objects or {icon.path: IconObject(icon) for icon in icons}
 
         if self.all_packs:
@@ -344,7 +348,13 @@ class IconChooserPage(ChooserPage):
 
     @log.catch
     def search_thread(self, search_id: int, icons: list["Icon"], query: str, all_packs: bool) -> None:
-        matches = IconSearch.search_icons(icons, query, match_pack_name=all_packs)
+        indexes = self.search_indexes if icons is self.icons else None
+        if indexes is None:
+            # Cached per pack, so this is only slow the very first time
+            indexes = IconSearch.get_indexes(icons)
+            if icons is self.icons:
+                self.search_indexes = indexes
+        matches = IconSearch.search_icons(icons, query, match_pack_name=all_packs, indexes=indexes)
         GLib.idle_add(self.show_results, search_id, matches)
 
     def show_results(self, search_id: int, icons: list["Icon"]) -> bool:
@@ -25,6 +25,10 @@ from collections import OrderedDict
 
 from loguru import logger as log
 
+# Import own modules
+from src.backend.DeckManagement.HelperMethods import is_svg, svg_to_pil
+from src.backend.DeckManagement.ImageHelpers import image2pixbuf
+
 # Import typing
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -151,8 +155,12 @@ class IconTextureLoader:
             path, render_size = key
             pixbuf = None
             try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(path), render_size, render_size)
-            except GLib.Error as e:
+                if is_svg(str(path)):
+                    # Shares the rasters with the keys and the thumbnails
+                    pixbuf = image2pixbuf(svg_to_pil(str(path), render_size, render_size))
+                else:
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(path), render_size, render_size)
+            except Exception as e:
                 log.warning(f"Failed to load icon {path}: {e}")
 
             if pixbuf is None:
@@ -19,6 +19,12 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, GdkPixbuf, Pango
 
+# Import own modules
+from src.backend.DeckManagement.ImageHelpers import image2pixbuf
+
+# Import globals
+import globals as gl
+
 class Preview(Gtk.FlowBoxChild):
     def __init__(self, image_path: str = None, text:str = None, can_be_deleted: bool = False):
         super().__init__()
@@ -29,6 +35,7 @@ class Preview(Gtk.FlowBoxChild):
         self.set_margin_bottom(5)
 
         self.pixbuf: GdkPixbuf.Pixbuf = None
+        self.image_path: str = None
         self.can_be_deleted = can_be_deleted
 
         self._build()
@@ -64,15 +71,26 @@ class Preview(Gtk.FlowBoxChild):
         self.overlay.add_overlay(self.remove_button)
 
     def set_image(self, path:str):
-        path = str(path)
+        # Previews get rebound, only the thumbnail of the latest path may be shown
+        self.image_path = None if path is None else str(path)
 
-        if path is None:
-            self.pixbuf = GdkPixbuf.Pixbuf.new(width=250, height=180)
+        if self.image_path is None:
+            self.pixbuf = None
+            self.picture.set_pixbuf(None)
+            return
+        # Loaded in the background so big grids don't block the ui
+        path = self.image_path
+        gl.media_manager.get_thumbnail_async(path, lambda image: self.on_thumbnail_loaded(path, image))
+
+    def on_thumbnail_loaded(self, path: str, image):
+        if image is None:
+            return
+        if path != self.image_path:
+            # Finished after the preview was rebound to another path
+            image.close()
             return
-        self.pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path,
-                                                              width=250,
-                                                              height=180,
-                                                              preserve_aspect_ratio=True)
+        self.pixbuf = image2pixbuf(image)
+        image.close()
         self.picture.set_pixbuf(self.pixbuf)
 
     def set_text(self, text:str):
@@ -57,19 +57,16 @@ class IconPage(StorePage):
     @log.catch
     def load(self):
         self.set_loading()
-        icons: list[IconData] = asyncio.run(self.store.backend.get_all_icons())
+        icons: list[IconData] = asyncio.run(self.store.backend.get_all_icons(on_result=self.add_icon))
         if isinstance(icons, NoConnectionError):
             self.show_connection_error()
             return
-        for icon in icons:
-            if icon.is_compatible:
-                section = self.compatible_section
-            else:
-                section = self.incompatible_section
-            GLib.idle_add(section.append_child, IconPreview(icon_page=self, icon_data=icon))
 
         self.set_loaded()
 
+    def add_icon(self, icon: IconData, index: int = None):
+        self.append_preview(IconPreview(icon_page=self, icon_data=icon), icon.is_compatible, index)
+
 
 class IconPreview(StorePreview):
     def __init__(self, icon_page:IconPage, icon_data:IconData):
@@ -59,19 +59,16 @@ class PagesPage(StorePage):
     @log.catch
     def load(self):
         self.set_loading()
-        pages: list[PageData] = asyncio.run(self.store.backend.get_all_pages())
+        pages: list[PageData] = asyncio.run(self.store.backend.get_all_pages(on_result=self.add_page))
         if isinstance(pages, NoConnectionError):
             self.show_connection_error()
             return
-        for page in pages:
-            if page.is_compatible:
-                section = self.compatible_section
-            else:
-                section = self.incompatible_section
-            GLib.idle_add(section.append_child, PagePreview(pages_page=self, page_data=page))
 
         self.set_loaded()
 
+    def add_page(self, page: PageData, index: int = None):
+        self.append_preview(PagePreview(pages_page=self, page_data=page), page.is_compatible, index)
+
 
 class PagePreview(StorePreview):
     def __init__(self, pages_page: PagesPage, page_data: PageData):
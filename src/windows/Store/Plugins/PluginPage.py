@@ -56,21 +56,16 @@ class PluginPage(StorePage):
     @log.catch
     def load(self):
         self.set_loading()
-        plugins: list[PluginData] = self.store.backend.get_all_plugins()
+        plugins: list[PluginData] = self.store.backend.get_all_plugins(on_result=self.add_plugin)
         if isinstance(plugins, NoConnectionError):
             self.show_connection_error()
             return
-        for plugin in plugins:
-            if not plugin:
-                continue
-            if plugin.is_compatible:
-                section = self.compatible_section
-            else:
-                section = self.incompatible_section
-            GLib.idle_add(section.append_child, PluginPreview(plugin_page=self, plugin_data=plugin))
 
         self.set_loaded()
 
+    def add_plugin(self, plugin: PluginData, index: int = None):
+        self.append_preview(PluginPreview(plugin_page=self, plugin_data=plugin), plugin.is_compatible, index)
+
     def check_required_version(self, app_version_to_check: str, is_min_app_version: bool = False):
         if is_min_app_version:
             if app_version_to_check is None:
@@ -55,19 +55,16 @@ class SDPlusBarWallpaperPage(StorePage):
     @log.catch
     def load(self):
         self.set_loading()
-        wallpapers = asyncio.run(self.store.backend.get_all_sd_plus_bar_wallpapers())
+        wallpapers = asyncio.run(self.store.backend.get_all_sd_plus_bar_wallpapers(on_result=self.add_wallpaper))
         if isinstance(wallpapers, NoConnectionError):
             self.show_connection_error()
             return
-        for wallpaper in wallpapers:
-            if wallpaper.is_compatible:
-                section = self.compatible_section
-            else:
-                section = self.incompatible_section
-            GLib.idle_add(section.append_child, SDPlusBarWallpaperPreview(wallpaper_page=self, wallpaper_data=wallpaper))
 
         self.set_loaded()
 
+    def add_wallpaper(self, wallpaper: SDPlusBarWallpaperData, index: int = None):
+        self.append_preview(SDPlusBarWallpaperPreview(wallpaper_page=self, wallpaper_data=wallpaper), wallpaper.is_compatible, index)
+
 
 class SDPlusBarWallpaperPreview(StorePreview):
     def __init__(self, wallpaper_page:SDPlusBarWallpaperPage, wallpaper_data:SDPlusBarWallpaperData):
@@ -93,6 +93,7 @@ class StorePage(Gtk.Stack):
         self.add_titled(self.no_connection_page, "Error", "Error")
 
     def set_loading(self):
+        self.showing_results = False
         GLib.idle_add(self.section_stack.set_visible, False)
         # GLib.idle_add(self.bottom_box.set_visible, False)
         GLib.idle_add(self.loading_box.set_visible, True)
@@ -108,6 +109,19 @@ class StorePage(Gtk.Stack):
         GLib.idle_add(self.section_switcher.set_visible, True)
         GLib.idle_add(self.hide_stack_switcher_if_all_compatible)
 
+    def append_preview(self, preview, compatible: bool, index: int = None):
+        """
+        Adds a preview while the store is still resolving the others.
+        The first one already replaces the spinner, the rest stream in behind it.
+        index is the position in the store, previews arrive in the order they got ready.
+        """
+        section = self.compatible_section if compatible else self.incompatible_section
+        GLib.idle_add(section.append_child, preview, index)
+
+        if not getattr(self, "showing_results", False):
+            self.showing_results = True
+            self.set_loaded()
+
     def hide_stack_switcher_if_all_compatible(self):
         if not self.incompatible_section.are_items_present():
             self.section_switcher.set_visible(False)
@@ -60,7 +60,9 @@ class StorePageSection(Gtk.Stack):
 
         self.set_visible_child(self.nothing_here)
 
-    def append_child(self, item):
+    def append_child(self, item, index: int = None):
+        # Keeps the store order among items the sorting doesn't tell apart
+        item.store_index = index
         self.flow_box.append(item)
         self.set_visible_child(self.main_box)
 
@@ -117,10 +119,15 @@ class StorePageSection(Gtk.Stack):
             return (name_score * 0.7) + (author_score * 0.25) + (description_score * 0.05)
 
         if search_string == "":
-            return (item_a.name_label.get_text() > item_b.name_label.get_text()) - \
+            order = (item_a.name_label.get_text() > item_b.name_label.get_text()) - \
                 (item_a.name_label.get_text() < item_b.name_label.get_text())
-
-        score_a = get_weighted_score(item_a)
-        score_b = get_weighted_score(item_b)
-
-        return (score_b > score_a) - (score_b < score_a)
\ No newline at end of file
+        else:
+            score_a = get_weighted_score(item_a)
+            score_b = get_weighted_score(item_b)
+            order = (score_b > score_a) - (score_b < score_a)
+
+        if order == 0:
+            index_a = getattr(item_a, "store_index", None) or 0
+            index_b = getattr(item_b, "store_index", None) or 0
+            order = (index_a > index_b) - (index_a < index_b)
+        return order
\ No newline at end of file
@@ -55,19 +55,16 @@ class WallpaperPage(StorePage):
     @log.catch
     def load(self):
         self.set_loading()
-        wallpapers = asyncio.run(self.store.backend.get_all_wallpapers())
+        wallpapers = asyncio.run(self.store.backend.get_all_wallpapers(on_result=self.add_wallpaper))
         if isinstance(wallpapers, NoConnectionError):
             self.show_connection_error()
             return
-        for wallpaper in wallpapers:
-            if wallpaper.is_compatible:
-                section = self.compatible_section
-            else:
-                section = self.incompatible_section
-            GLib.idle_add(section.append_child, WallpaperPreview(wallpaper_page=self, wallpaper_data=wallpaper))
 
         self.set_loaded()
 
+    def add_wallpaper(self, wallpaper: WallpaperData, index: int = None):
+        self.append_preview(WallpaperPreview(wallpaper_page=self, wallpaper_data=wallpaper), wallpaper.is_compatible, index)
+
 
 class WallpaperPreview(StorePreview):
     def __init__(self, wallpaper_page:WallpaperPage, wallpaper_data:WallpaperData):
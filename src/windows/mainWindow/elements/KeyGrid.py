@@ -28,12 +28,14 @@ from gi.repository import Gtk, Adw, Gdk, GLib, Gio
 # Import Python modules 
 from loguru import logger as log
 import os
+import threading
+from PIL import Image
 
 # Imort globals
 import globals as gl
 
 # Import own modules
-from src.backend.DeckManagement.ImageHelpers import image2pixbuf
+from src.backend.DeckManagement.ImageHelpers import image2texture
 from src.backend.DeckManagement.HelperMethods import recursive_hasattr
 
 class KeyGrid(Gtk.Grid):
@@ -48,6 +50,11 @@ class KeyGrid(Gtk.Grid):
 
         self.selected_key = None # The selected key, indicated by a blue frame around it
 
+        # Images rendered since the last frame, applied together on the next frame clock tick
+        self.pending_images: dict[tuple[int, int], Image.Image] = {}
+        self.pending_images_lock = threading.Lock()
+        self.pending_images_scheduled = False
+
         [y, x] = self.deck_controller.deck.key_layout()
         self.buttons = [[None] * y for i in range(x)]
 
@@ -91,6 +98,9 @@ class KeyGrid(Gtk.Grid):
             if not isinstance(identifier, Input.Key):
                 continue
             x, y = identifier.coords
+            with self.pending_images_lock:
+                # Queued before the grid got hidden, older than this one
+                self.pending_images.pop((x, y), None)
             self.buttons[x][y].set_image(image)
 
             try:
@@ -98,6 +108,32 @@ class KeyGrid(Gtk.Grid):
             except KeyError:
                 pass
         
+    def queue_key_image(self, x: int, y: int, image: Image.Image) -> None:
+        """
+        Can be called from any thread. Only the latest image of a key is shown, at most once per
+        frame - an animated key does not need more updates than the window can draw.
+        """
+        with self.pending_images_lock:
+            self.pending_images[(x, y)] = image
+            if self.pending_images_scheduled:
+                return
+            self.pending_images_scheduled = True
+        GLib.idle_add(self.schedule_pending_images, priority=GLib.PRIORITY_HIGH)
+
+    def schedule_pending_images(self) -> bool:
+        self.add_tick_callback(self.on_pending_images_tick)
+        return False
+
+    def on_pending_images_tick(self, widget, frame_clock) -> bool:
+        # Only called while the grid is mapped, everything queued meanwhile is applied at once
+        with self.pending_images_lock:
+            pending = self.pending_images
+            self.pending_images = {}
+            self.pending_images_scheduled = False
+        for (x, y), image in pending.items():
+            self.buttons[x][y].set_image(image)
+        return GLib.SOURCE_REMOVE
+
     def select_key(self, x: int, y: int):
         self.buttons[x][y].on_focus_in()
         self.buttons[x][y].image.grab_focus()
@@ -135,7 +171,7 @@ class KeyButton(Gtk.Frame):
 
         self.key_grid = key_grid
 
-        self.pixbuf = None
+        self.texture: Gdk.Texture = None
 
         # self.button = Gtk.Button(hexpand=True, vexpand=True, css_classes=["key-button"])
         # self.set_child(self.button)
@@ -288,21 +324,19 @@ class KeyButton(Gtk.Frame):
         
 
     def set_image(self, image):
-        self.pixbuf = image2pixbuf(image.convert("RGBA"), force_transparency=True)
-        GLib.idle_add(self.show_pixbuf, self.pixbuf, priority=GLib.PRIORITY_HIGH)
-        # image.close()
-        # image = None
-        # del image
+        # Main thread only, see KeyGrid.queue_key_image
+        self.texture = image2texture(image)
+        self.image.set_from_paintable(self.texture)
 
         # update righthand side key preview if possible
         if recursive_hasattr(gl, "app.main_win.sidebar"):
-            self.set_icon_selector_previews(self.pixbuf)
+            self.set_icon_selector_previews(self.texture)
 
-    def set_icon_selector_previews(self, pixbuf):
+    def set_icon_selector_previews(self, texture):
         if not recursive_hasattr(gl, "app.main_win.sidebar"):
             return
         sidebar = gl.app.main_win.sidebar
-        if pixbuf is None:
+        if texture is None:
             return
         if sidebar.key_editor.label_editor.label_group.expander.active_identifier != self.identifier:
             return
@@ -312,14 +346,10 @@ class KeyButton(Gtk.Frame):
         if child.deck_controller != self.key_grid.deck_controller:
             return
         # Update icon selector on the top of the right are
-        GLib.idle_add(sidebar.key_editor.icon_selector.set_pixbuf_and_del, pixbuf, priority=GLib.PRIORITY_HIGH)
+        sidebar.key_editor.icon_selector.set_texture(texture)
         # Update icon selector in margin editor
         # GLib.idle_add(sidebar.key_editor.image_editor.image_group.expander.margin_row.icon_selector.image.set_from_pixbuf, pixbuf)
 
-    def show_pixbuf(self, pixbuf):
-        self.pixbuf = pixbuf
-        self.image.set_from_pixbuf(self.pixbuf)
-
     def on_click(self, gesture, n_press, x, y):
         if gesture.get_current_button() == 1 and n_press == 1:
             # Single left click
@@ -365,8 +395,8 @@ class KeyButton(Gtk.Frame):
         # Update settings on the righthand side of the screen
         self.update_sidebar()
         # Update preview
-        if self.pixbuf is not None:
-            self.set_icon_selector_previews(self.pixbuf)
+        if self.texture is not None:
+            self.set_icon_selector_previews(self.texture)
         # self.set_css_classes(["key-button-frame"])
         # self.button.set_css_classes(["key-button-new-small"])
         self.set_border_active(True)
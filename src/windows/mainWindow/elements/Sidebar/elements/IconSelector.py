@@ -22,7 +22,7 @@ from src.backend.DeckManagement.HelperMethods import add_default_keys
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, Gdk, GLib
 
 # Import own modules
 from src.backend.DeckManagement.ImageHelpers import image2pixbuf
@@ -98,6 +98,13 @@ class IconSelector(Gtk.Box):
         self.set_pixbuf_and_del(pixbuf)
         return False
 
+    def set_texture(self, texture: Gdk.Texture):
+        self.image.set_paintable(texture)
+
+        # Same as in set_pixbuf_and_del
+        self.image.set_visible(False)
+        self.image.set_visible(True)
+
     def set_pixbuf_and_del(self, pixbuf, task_id: int = None):
         self.image.set_pixbuf(pixbuf)
         pixbuf = None
@@ -29,6 +29,7 @@ from src.windows.mainWindow.deckSwitcher import DeckSwitcher
 from src.windows.mainWindow.elements.PageSelector import PageSelector
 from src.windows.Store.Store import Store
 from src.windows.Settings.Settings import Settings
+from src.backend.PluginManager.BackendHost import BackendHost
 
 # Import globals
 import globals as gl
@@ -112,6 +113,7 @@ class HeaderBar(Gtk.HeaderBar):
     def on_quit(self, action, parameter):
         # Close all decks
         gl.deck_manager.close_all()
+        BackendHost.stop_all()
         # TODO: Find better way - sys.exit doesn't work because it waits for the threads to finish
         os._exit(0)
 
@@ -0,0 +1,85 @@
+"""
+Manual benchmark for the per-call overhead of the plugin logger.
+Not part of the automated suite: the numbers depend on the machine and only mean
+something relative to each other.
+
+    python3 tests/manual_logger_benchmark.py
+
+Compares the old log method, which ran inspect.stack() on every call, with the
+current one, which leaves the caller lookup to loguru. Both write to the same
+kind of sink with the redaction patcher installed, like in the app. The last
+row is a level no sink wants, which loguru drops before looking at the caller.
+"""
+import inspect
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import globals as gl
+
+from loguru import logger as log
+
+from src.backend import LogRedaction
+from src.backend.Logger import Logger, LoggerConfig, Loglevel
+
+CALLS = 20_000
+
+
+def make_logger(name: str, data_path: str, base_log_level: str) -> Logger:
+    return Logger(
+        LoggerConfig(
+            name=name,
+            log_file_path=os.path.join(data_path, "bench.log"),
+            base_log_level=base_log_level,
+            rotation="3 days",
+            retention=None,
+            compression=None,
+        ),
+        [
+            Loglevel("DEBUG", "debug", 10, "<bold><blue>"),
+            Loglevel("INFO", "info", 20, "<bold><white>"),
+            Loglevel("WARNING", "warning", 30, "<bold><yellow>"),
+        ]
+    )
+
+
+def legacy_info(message):
+    """The log method as it was before, for comparison"""
+    caller = inspect.stack()[1]
+    relative_path = os.path.relpath(caller.filename, gl.DATA_PATH)
+    relative_path = os.path.splitext(relative_path)[0].replace(os.sep, ".")
+    log.log("BENCH_INFO", message, file_name=relative_path, function=caller.function, line=caller.lineno)
+
+
+def measure(method: callable) -> float:
+    start = time.perf_counter()
+    for i in range(CALLS):
+        method("Button pressed on key 3x1")
+    return (time.perf_counter() - start) / CALLS * 1_000_000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as data_path:
+        gl.DATA_PATH = data_path
+
+        log.remove()
+        log.configure(patcher=LogRedaction.patch_record)
+        plugin_logger = make_logger("BENCH", data_path, "DEBUG")
+
+        print(f"{CALLS} calls each, microseconds per call")
+        print(f"  inspect.stack (old)   {measure(legacy_info):8.2f}")
+        print(f"  loguru depth (new)    {measure(plugin_logger.info):8.2f}")
+
+        log.remove()
+        filtered_logger = make_logger("BENCH_QUIET", data_path, "WARNING")
+        print(f"  filtered out          {measure(filtered_logger.debug):8.2f}")
+
+        log.complete()
+        log.remove()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Tests for the per deck pool that runs action ticks and event callbacks.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import threading
+import time
+import unittest
+
+from src.backend.DeckManagement.Subclasses.ActionWorkerPool import (
+    BLOCKED_EVENT_TIMEOUT, LANE_EVENT, ActionWorkerPool
+)
+
+
+class TestActionWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ActionWorkerPool(name="test", event_workers=2, tick_workers=2)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.pool.shutdown()
+
+    def wait_until(self, condition: callable, timeout: float = 5) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return condition()
+
+    def test_calls_of_one_input_run_in_order(self):
+        calls = []
+        for i in range(50):
+            self.pool.submit("key", calls.append, i, lane=LANE_EVENT)
+        self.assertTrue(self.wait_until(lambda: len(calls) == 50))
+        self.assertEqual(calls, list(range(50)))
+
+    def test_calls_of_one_input_dont_overlap(self):
+        running = []
+        overlaps = []
+
+        def call():
+            if running:
+                overlaps.append(True)
+            running.append(True)
+            time.sleep(0.01)
+            running.pop()
+
+        for _ in range(10):
+            self.pool.submit("key", call)
+        self.assertTrue(self.wait_until(lambda: self.pool.get_queue_depth(LANE_EVENT) == 0))
+        self.assertEqual(overlaps, [])
+
+    def test_ticks_are_coalesced(self):
+        started = threading.Event()
+
+        def tick():
+            started.set()
+            self.release.wait(5)
+
+        self.assertTrue(self.pool.submit_tick("key", tick))
+        self.assertTrue(started.wait(5))
+        self.assertFalse(self.pool.submit_tick("key", tick))
+        self.assertFalse(self.pool.submit_tick("key", tick))
+        # Other inputs tick as usual
+        self.assertTrue(self.pool.submit_tick("other", lambda: None))
+
+        self.assertEqual(self.pool.get_stats()["skipped_ticks"], 2)
+        self.release.set()
+        self.assertTrue(self.wait_until(lambda: self.pool.submit_tick("key", lambda: None)))
+
+    def test_key_up_is_not_stuck_behind_blocked_key_down(self):
+        key_up = threading.Event()
+        # A plugin that waits in key down until the key is released
+        self.pool.submit("key", lambda: key_up.wait(10))
+        self.pool.submit("key", key_up.set)
+        self.assertTrue(key_up.wait(BLOCKED_EVENT_TIMEOUT + 2))
+        self.assertGreaterEqual(self.pool.get_stats()["overflow_threads"], 1)
+
+    def test_blocked_workers_dont_starve_other_inputs(self):
+        for i in range(2):
+            self.pool.submit(f"slow-{i}", self.release.wait, 10)
+        handled = threading.Event()
+        self.pool.submit("fast", handled.set)
+        self.assertTrue(handled.wait(BLOCKED_EVENT_TIMEOUT + 2))
+
+    def test_error_does_not_stop_the_queue(self):
+        calls = []
+
+        def fail():
+            raise ValueError("broken action")
+
+        self.pool.submit("key", fail)
+        self.pool.submit("key", calls.append, 1)
+        self.assertTrue(self.wait_until(lambda: calls == [1]))
+
+    def test_shutdown(self):
+        calls = []
+        self.pool.submit("key", self.release.wait, 5)
+        self.pool.submit("key", calls.append, 1)
+        self.pool.shutdown()
+        self.release.set()
+
+        self.assertFalse(self.pool.submit("key", calls.append, 2))
+        self.assertFalse(self.pool.submit_tick("key", calls.append, 3))
+        time.sleep(0.1)
+        # Queued calls are dropped
+        self.assertEqual(calls, [])
+        self.assertEqual(self.pool.get_queue_depth(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
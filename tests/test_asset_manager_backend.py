@@ -0,0 +1,130 @@
+"""
+Tests that the lookup tables of the asset manager stay in sync with its list
+when assets are added and removed, and that imports are saved once.
+
+Needs the app's dependencies (GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from PIL import Image
+    from src.backend.AssetManagerBackend import AssetManagerBackend
+    from src.backend.DeckManagement.HelperMethods import sha256
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestAssetManagerBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gl = SimpleNamespace(
+            DATA_PATH=self.tmp.name,
+            media_manager=SimpleNamespace(generate_thumbnail=lambda path: Image.open(path)),
+            page_manager=mock.Mock(),
+        )
+        patcher = mock.patch("src.backend.AssetManagerBackend.gl", self.gl)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.backend = AssetManagerBackend.__new__(AssetManagerBackend)
+        self.backend.JSON_PATH = os.path.join(self.tmp.name, "Assets.json")
+        self.backend.SAVE_DELAY = 0.05
+        self.backend.__init__()
+
+    def tearDown(self):
+        self.backend.flush()
+        self.tmp.cleanup()
+
+    def make_image(self, name: str, color: str) -> str:
+        path = os.path.join(self.tmp.name, "import", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Image.new("RGB", (8, 8), color).save(path)
+        return path
+
+    def read_json(self) -> list:
+        with open(self.backend.JSON_PATH) as f:
+            return json.load(f)
+
+    def assert_indexed(self, asset: dict) -> None:
+        self.assertIs(self.backend.get_by_id(asset["id"]), asset)
+        self.assertIs(self.backend.get_by_sha256(asset["sha256"]), asset)
+        self.assertIs(self.backend.get_by_name(asset["name"]), asset)
+        self.assertIs(self.backend.get_by_internal_path(asset["internal-path"]), asset)
+
+    def test_add_and_remove_keep_indexes_in_sync(self):
+        path = self.make_image("red.png", "red")
+        asset_id = self.backend.add(path)
+        asset = self.backend.get_by_id(asset_id)
+        self.assert_indexed(asset)
+        self.assertTrue(os.path.isfile(asset["internal-path"]))
+
+        self.backend.remove_asset_by_id(asset_id)
+        self.assertEqual(list(self.backend), [])
+        self.assertIsNone(self.backend.get_by_id(asset_id))
+        self.assertIsNone(self.backend.get_by_sha256(asset["sha256"]))
+        self.assertIsNone(self.backend.get_by_name(asset["name"]))
+        self.assertIsNone(self.backend.get_by_internal_path(asset["internal-path"]))
+
+    def test_add_hashed_returns_existing_asset(self):
+        path = self.make_image("red.png", "red")
+        hash = sha256(path)
+        first = self.backend.add_hashed(path, hash)
+        self.assertEqual(self.backend.add_hashed(path, hash), first)
+        self.assertEqual(len(self.backend), 1)
+
+    def test_concurrent_adds_of_one_file_add_it_once(self):
+        path = self.make_image("red.png", "red")
+        hash = sha256(path)
+        ids = []
+        threads = [threading.Thread(target=lambda: ids.append(self.backend.add_hashed(path, hash))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(ids)), 1)
+        self.assertEqual(len(self.backend), 1)
+        self.assertEqual(os.listdir(os.path.join(self.tmp.name, "Assets", "AssetManager", "Assets")), ["red.png"])
+
+    def test_add_many_is_saved_once(self):
+        paths = [self.make_image(f"{color}.png", color) for color in ("red", "green", "blue")]
+        with mock.patch("src.backend.AssetManagerBackend.atomic_save_json") as save:
+            ids = self.backend.add_many(paths + [os.path.join(self.tmp.name, "missing.png")])
+            self.assertEqual(save.call_count, 0)
+            time.sleep(0.3)
+        self.assertEqual(save.call_count, 1)
+
+        self.assertIsNone(ids[-1])
+        for path, asset_id in zip(paths, ids):
+            asset = self.backend.get_by_id(asset_id)
+            self.assertEqual(asset["original-path"], path)
+            self.assert_indexed(asset)
+
+    def test_burst_of_adds_is_written_once(self):
+        with mock.patch("src.backend.AssetManagerBackend.atomic_save_json") as save:
+            for color in ("red", "green", "blue"):
+                self.backend.add(self.make_image(f"{color}.png", color))
+            time.sleep(0.3)
+        self.assertEqual(save.call_count, 1)
+
+        self.backend.add(self.make_image("white.png", "white"))
+        self.backend.flush()
+        self.assertEqual(len(self.read_json()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
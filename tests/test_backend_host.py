@@ -0,0 +1,172 @@
+"""
+Tests for the shared backend process, with a small plugin backend written to a temp dir.
+
+The host process runs the backends through the plugin tools, like the plugin venvs do. A minimal
+stand-in for their BackendBase is put on its path, so only rpyc is needed.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import os
+import tempfile
+import textwrap
+import time
+import unittest
+from unittest import mock
+
+try:
+    import rpyc
+    from src.backend.PluginManager.BackendHost import BackendHost
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+# Has the hooks the host process replaces, standing alone it would connect to the frontend itself
+PLUGIN_TOOLS = textwrap.dedent("""
+    import rpyc
+
+    class BackendBase(rpyc.Service):
+        def __init__(self):
+            self.frontend = None
+            self.connect_to_frontend()
+            self.start_server()
+            self.register_to_frontend()
+
+        def connect_to_frontend(self):
+            raise NotImplementedError("only usable in the backend host")
+
+        def start_server(self):
+            pass
+
+        def register_to_frontend(self):
+            pass
+
+        def on_disconnect(self, conn):
+            pass
+""")
+
+BACKEND = textwrap.dedent("""
+    import os
+    from streamcontroller_plugin_tools import BackendBase
+
+    class Backend(BackendBase):
+        def get_pid(self):
+            return os.getpid()
+
+        def greet(self):
+            return self.frontend.get_name()
+
+    backend = Backend()
+""")
+
+
+class Frontend(rpyc.Service if IMPORT_ERROR is None else object):
+    def __init__(self, name: str):
+        self.name = name
+
+    def get_name(self) -> str:
+        return self.name
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestBackendHost(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.backend_path = os.path.join(self.tmp.name, "backend.py")
+        with open(self.backend_path, "w") as f:
+            f.write(BACKEND)
+
+        plugin_tools_dir = os.path.join(self.tmp.name, "site", "streamcontroller_plugin_tools")
+        os.makedirs(plugin_tools_dir)
+        with open(os.path.join(plugin_tools_dir, "__init__.py"), "w") as f:
+            f.write(PLUGIN_TOOLS)
+        python_path = os.pathsep.join(filter(None, [os.path.dirname(plugin_tools_dir), os.environ.get("PYTHONPATH")]))
+        patcher = mock.patch.dict(os.environ, {"PYTHONPATH": python_path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.host = BackendHost("com.example.test")
+
+    def tearDown(self):
+        self.host.stop()
+        self.tmp.cleanup()
+
+    def test_instances_share_one_process_and_connection(self):
+        spawns = BackendHost.spawn_count
+        connections, backends = zip(*[
+            self.host.create_instance(f"action-{i}", self.backend_path, Frontend(f"action-{i}"))
+            for i in range(5)
+        ])
+
+        self.assertEqual(BackendHost.spawn_count, spawns + 1)
+        self.assertEqual(len(set(map(id, connections))), 1)
+        pids = {backend.get_pid() for backend in backends}
+        self.assertEqual(len(pids), 1)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_backends_talk_to_their_own_frontend(self):
+        _, first = self.host.create_instance("first", self.backend_path, Frontend("first"))
+        _, second = self.host.create_instance("second", self.backend_path, Frontend("second"))
+
+        self.assertEqual(first.greet(), "first")
+        self.assertEqual(second.greet(), "second")
+
+    def test_release_instance(self):
+        self.host.create_instance("action", self.backend_path, Frontend("action"))
+        self.host.release_instance("action")
+
+        self.assertEqual(self.host.instances, set())
+        self.assertEqual(self.host.connection.root.get_instance_count(), 0)
+
+    def test_host_stops_once_idle(self):
+        self.host.IDLE_TIMEOUT = 0.1
+        self.host.create_instance("first", self.backend_path, Frontend("first"))
+        self.host.create_instance("second", self.backend_path, Frontend("second"))
+        process = self.host.process
+
+        self.host.release_instance("first")
+        time.sleep(0.3)
+        self.assertTrue(self.host.is_running())
+
+        self.host.release_instance("second")
+        process.wait(timeout=5)
+        self.assertFalse(self.host.is_running())
+
+        # Started again for the next backend
+        _, backend = self.host.create_instance("third", self.backend_path, Frontend("third"))
+        self.assertEqual(backend.greet(), "third")
+
+    def test_new_backend_cancels_idle_stop(self):
+        self.host.IDLE_TIMEOUT = 0.2
+        self.host.create_instance("first", self.backend_path, Frontend("first"))
+        process = self.host.process
+        self.host.release_instance("first")
+        self.host.create_instance("second", self.backend_path, Frontend("second"))
+        time.sleep(0.4)
+        self.assertIs(self.host.process, process)
+        self.assertTrue(self.host.is_running())
+
+    def test_stop_all(self):
+        with mock.patch.dict(BackendHost.hosts, {("com.example.test", None): self.host}):
+            self.host.create_instance("action", self.backend_path, Frontend("action"))
+            process = self.host.process
+            BackendHost.stop_all()
+        process.wait(timeout=5)
+        self.assertFalse(self.host.is_running())
+
+    def test_broken_backend_raises(self):
+        broken_path = os.path.join(self.tmp.name, "broken.py")
+        with open(broken_path, "w") as f:
+            f.write("raise ImportError('missing dependency')\n")
+
+        with self.assertRaises(RuntimeError):
+            self.host.create_instance("broken", broken_path, Frontend("broken"))
+        # The host survives it
+        _, backend = self.host.create_instance("working", self.backend_path, Frontend("working"))
+        self.assertEqual(backend.greet(), "working")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the backend launch handshake.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import asyncio
+import threading
+import time
+import unittest
+
+from src.backend.PluginManager.BackendReadiness import BackendReadiness
+
+
+class TestBackendReadiness(unittest.TestCase):
+    def setUp(self):
+        self.readiness = BackendReadiness("test backend")
+        self.readiness.start("com.example.test")
+
+    def test_waiter_wakes_up_right_away(self):
+        threading.Timer(0.05, self.readiness.set_ready).start()
+
+        start = time.monotonic()
+        self.assertTrue(self.readiness.wait(5))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_async_wait(self):
+        async def wait():
+            asyncio.get_running_loop().call_later(0.05, self.readiness.set_ready)
+            return await self.readiness.wait_async(5)
+
+        self.assertTrue(asyncio.run(wait()))
+
+    def test_wait_times_out(self):
+        self.assertFalse(self.readiness.wait(0.05))
+        self.assertFalse(asyncio.run(self.readiness.wait_async(0.05)))
+        # Timing out a waiter doesn't resolve the launch
+        self.readiness.set_ready()
+        self.assertTrue(self.readiness.is_ready())
+
+    def test_timeout_callback(self):
+        fired = threading.Event()
+        self.readiness.expire_after(0.05, fired.set)
+        self.assertTrue(fired.wait(2))
+
+    def test_timeout_callback_skipped_once_ready(self):
+        fired = threading.Event()
+        self.readiness.expire_after(0.05, fired.set)
+        self.readiness.set_ready()
+        self.assertFalse(fired.wait(0.2))
+
+    def test_failed_launch(self):
+        self.readiness.set_failed()
+        self.assertFalse(self.readiness.wait(5))
+
+        # A relaunch is waited for again
+        self.readiness.start("com.example.test")
+        self.assertFalse(self.readiness.future.done())
+
+    def test_cold_start_is_recorded(self):
+        time.sleep(0.02)
+        self.readiness.set_ready()
+
+        self.assertGreaterEqual(self.readiness.latency, 0.02)
+        stats = BackendReadiness.get_cold_start_stats()["com.example.test"]
+        self.assertGreaterEqual(stats["count"], 1)
+        self.assertGreaterEqual(stats["max"], 0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
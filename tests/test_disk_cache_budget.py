@@ -0,0 +1,64 @@
+"""
+Tests for the byte budget of cache folders.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import os
+import tempfile
+import time
+import unittest
+
+from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
+
+
+class TestDiskCacheBudget(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.budget = DiskCacheBudget(self.tmp.name, budget_bytes=4000, suffix=".png")
+        self.n_files = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name: str, n_bytes: int = 1000) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * n_bytes)
+        # Distinct mtimes, coarse file systems would tie otherwise
+        self.n_files += 1
+        os.utime(path, (time.time(), time.time() + self.n_files))
+        self.budget.add(path)
+        return path
+
+    def test_least_recently_used_files_are_removed(self):
+        paths = [self.write(f"{i}.png") for i in range(4)]
+        os.utime(paths[0], (time.time(), time.time() + 100))
+        self.write("new.png")
+
+        remaining = sorted(os.listdir(self.tmp.name))
+        self.assertEqual(remaining, ["0.png", "3.png", "new.png"])
+        self.assertEqual(self.budget.n_bytes, 3000)
+
+    def test_new_file_is_kept_even_if_too_big(self):
+        self.write("small.png")
+        self.write("big.png", n_bytes=5000)
+        self.assertEqual(os.listdir(self.tmp.name), ["big.png"])
+
+    def test_other_files_are_ignored(self):
+        with open(os.path.join(self.tmp.name, "notes.txt"), "wb") as f:
+            f.write(b"x" * 10000)
+        self.write("a.png")
+        self.assertEqual(self.budget.n_bytes, 1000)
+        self.assertIn("notes.txt", os.listdir(self.tmp.name))
+
+    def test_remove(self):
+        path = self.write("a.png")
+        self.budget.remove(path)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.budget.n_bytes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests that icon packs read their categories lazily, reuse the structure cache
+while the pack is unchanged and read it again once it changed.
+
+Needs the app's dependencies (GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.IconPackManagement import IconPack as icon_pack_module
+    from src.backend.IconPackManagement.IconPack import IconPack
+    from src.backend.IconPackManagement.IconPackManager import Gio, IconPackManager
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestIconPackStructure(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmp.name, "data")
+        patcher = mock.patch.object(icon_pack_module, "gl", SimpleNamespace(DATA_PATH=self.data_path))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.pack_path = os.path.join(self.tmp.name, "pack")
+        os.makedirs(self.pack_path)
+        with open(os.path.join(self.pack_path, "manifest.json"), "w") as f:
+            json.dump({"name": "Test Pack", "icons": "icons"}, f)
+        for category, names in {"Arrows": ["up.png", "down.png"], "Media": ["play.png"]}.items():
+            for name in names:
+                self.add_icon(category, name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add_icon(self, category: str, name: str) -> None:
+        folder = os.path.join(self.pack_path, "icons", category)
+        os.makedirs(folder, exist_ok=True)
+        open(os.path.join(folder, name), "w").close()
+
+    def bump_mtime(self, category: str) -> None:
+        # mtimes can be too coarse to tell two writes within a test apart
+        folder = os.path.join(self.pack_path, "icons", category)
+        stat = os.stat(folder)
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_categories_are_loaded_lazily(self):
+        pack = IconPack(self.pack_path)
+        self.assertIsNone(pack.categories)
+        self.assertFalse(os.path.exists(pack.get_structure_cache_path()))
+
+        icons = pack.get_category_icons("Arrows")
+        self.assertEqual(sorted(icon.name for icon in icons), ["down", "up"])
+        # Only the requested category has icon objects
+        self.assertEqual(list(pack.pack_structure), ["Arrows"])
+        self.assertIs(pack.get_category_icons("Arrows"), icons)
+
+    def test_unchanged_pack_uses_structure_cache(self):
+        IconPack(self.pack_path).get_categories()
+
+        pack = IconPack(self.pack_path)
+        with mock.patch.object(pack, "scan_categories", side_effect=AssertionError("scanned again")):
+            self.assertEqual(sorted(pack.get_categories()), ["Arrows", "Media"])
+
+    def test_changed_pack_is_scanned_again(self):
+        IconPack(self.pack_path).get_categories()
+        self.add_icon("Media", "pause.png")
+        self.bump_mtime("Media")
+
+        pack = IconPack(self.pack_path)
+        with mock.patch.object(pack, "scan_categories", wraps=pack.scan_categories) as scan:
+            icons = pack.get_category_icons("Media")
+        scan.assert_called_once()
+        self.assertEqual(sorted(icon.name for icon in icons), ["pause", "play"])
+
+    def test_manager_drops_changed_pack(self):
+        manager = IconPackManager()
+        monitor = mock.Mock()
+        manager.watch_pack = lambda pack: manager.monitors.__setitem__(pack.path, [monitor])
+
+        pack = manager.get_pack(self.pack_path)
+        self.assertIs(manager.get_pack(self.pack_path), pack)
+
+        # Attribute changes don't touch the structure
+        manager.on_pack_changed(None, None, None, Gio.FileMonitorEvent.ATTRIBUTE_CHANGED, self.pack_path)
+        self.assertIs(manager.get_pack(self.pack_path), pack)
+
+        manager.on_pack_changed(None, None, None, Gio.FileMonitorEvent.CREATED, self.pack_path)
+        monitor.cancel.assert_called_once()
+        self.assertIsNot(manager.get_pack(self.pack_path), pack)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,10 @@ from src.backend.IconPackManagement import IconSearch
 class FakePack:
     def __init__(self, name: str):
         self.name = name
+        self.path = f"/tmp/{name}"
+
+    def get_search_signature(self) -> tuple:
+        return ()
 
 
 def make_icon(name: str, category: str = "", pack: str = "Test Pack") -> Icon:
@@ -116,5 +120,21 @@ class TestIconSearch(unittest.TestCase):
         self.assertEqual(self.search(icons, "", match_pack_name=True), ["arrow", "bell", "alarm"])
 
 
+class TestIconSearchIndex(TestIconSearch):
+    """Runs every search again through the index, which must not change any result"""
+    def search(self, icons: list[Icon], query: str, match_pack_name: bool = False) -> list[str]:
+        indexes = [IconSearch.SearchIndex(icons)]
+        return [icon.name for icon in IconSearch.search_icons(icons, query, match_pack_name=match_pack_name,
+                                                              indexes=indexes)]
+
+    def test_extended_query_reuses_candidates(self):
+        icons = [make_icon("battery-low"), make_icon("bat"), make_icon("weather")]
+        index = IconSearch.SearchIndex(icons)
+        for query in ["b", "ba", "bat", "batt", "battery"]:
+            expected = [icon.name for icon in IconSearch.search_icons(icons, query)]
+            found = [icon.name for icon in IconSearch.search_icons(icons, query, indexes=[index])]
+            self.assertEqual(found, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests that the key images rendered during a page switch are held back and written
+to the deck together, once per key.
+
+Needs the app's dependencies (StreamDeck, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.DeckManagement.DeckController import MediaPlayerThread
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestImageBatch(unittest.TestCase):
+    def setUp(self):
+        self.page = object()
+        self.written = []
+
+        deck = mock.MagicMock()
+        deck.set_key_image.side_effect = lambda key_index, image: self.written.append((key_index, image))
+        controller = SimpleNamespace(active_page=self.page, deck=deck, serial_number=lambda: "test")
+
+        with mock.patch("src.backend.DeckManagement.DeckController.gl"):
+            self.player = MediaPlayerThread(controller)
+        self.player._finish_page_switch_timer = lambda: None
+        self.player._record_key_write_time = lambda duration: None
+
+    def test_batch_writes_each_key_once(self):
+        with self.player.image_batch():
+            for key_index in range(4):
+                self.player.add_image_task(key_index, f"old-{key_index}".encode())
+            # Rendered again before the batch is closed, only the last image counts
+            for key_index in range(4):
+                self.player.add_image_task(key_index, f"new-{key_index}".encode())
+
+            self.player.perform_media_player_tasks()
+            self.assertEqual(self.written, [])
+
+        self.player.perform_media_player_tasks()
+        self.assertEqual(sorted(self.written), [(i, f"new-{i}".encode()) for i in range(4)])
+
+    def test_nested_batch_waits_for_the_outermost(self):
+        with self.player.image_batch():
+            with self.player.image_batch():
+                self.player.add_image_task(0, b"image")
+            self.player.perform_media_player_tasks()
+            self.assertEqual(self.written, [])
+
+        self.player.perform_media_player_tasks()
+        self.assertEqual(self.written, [(0, b"image")])
+
+
+if __name__ == "__main__":
+    unittest.main()
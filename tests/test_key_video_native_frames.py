@@ -0,0 +1,80 @@
+"""
+Tests for the device-ready frame payloads of key videos.
+
+Needs the app's dependencies (OpenCV, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import unittest
+from unittest import mock
+
+try:
+    from src.backend.DeckManagement.Subclasses import key_video_cache
+    from src.backend.DeckManagement.Subclasses.KeyVideo import InputVideo
+    from src.backend.DeckManagement.Subclasses.key_video_cache import VideoFrameCache
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+SIGNATURE_A = ("deck-a", 0)
+SIGNATURE_B = ("deck-b", 90)
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestNativeFrames(unittest.TestCase):
+    def setUp(self):
+        self.cache = VideoFrameCache.__new__(VideoFrameCache)
+        self.cache.do_caching = True
+        self.cache.native_frames = key_video_cache.OrderedDict()
+        self.cache.native_frames_bytes = 0
+        self.cache._native_lock = key_video_cache.threading.Lock()
+
+    def test_signatures_dont_evict_each_other(self):
+        self.cache.set_native_frame(SIGNATURE_A, 0, b"a0")
+        self.cache.set_native_frame(SIGNATURE_B, 0, b"b0")
+        self.assertEqual(self.cache.get_native_frame(SIGNATURE_A, 0), b"a0")
+        self.assertEqual(self.cache.get_native_frame(SIGNATURE_B, 0), b"b0")
+        self.assertIsNone(self.cache.get_native_frame(SIGNATURE_A, 1))
+
+    def test_payloads_stay_within_the_byte_budget(self):
+        with mock.patch.object(key_video_cache, "NATIVE_FRAMES_MAX_BYTES", 30):
+            for i in range(5):
+                self.cache.set_native_frame(SIGNATURE_A, i, bytes(10))
+            # Used recently, so it is kept over frame 3
+            self.cache.get_native_frame(SIGNATURE_A, 2)
+            self.cache.set_native_frame(SIGNATURE_A, 5, bytes(10))
+
+        self.assertLessEqual(self.cache.native_frames_bytes, 30)
+        self.assertIsNotNone(self.cache.get_native_frame(SIGNATURE_A, 2))
+        self.assertIsNone(self.cache.get_native_frame(SIGNATURE_A, 3))
+        self.assertIsNotNone(self.cache.get_native_frame(SIGNATURE_A, 5))
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestAdvanceFrame(unittest.TestCase):
+    def setUp(self):
+        self.video = InputVideo.__new__(InputVideo)
+        self.video.fps = 30
+        self.video.loop = True
+        self.video.active_frame = -1
+        self.video._video_start_ts = -1.0
+        self.video._frame_advanced = False
+        self.video.video_cache = mock.Mock(n_frames=100, _is_gif=lambda: False)
+
+    def test_frame_advanced_once_per_tick(self):
+        with mock.patch("src.backend.DeckManagement.Subclasses.KeyVideo.time.perf_counter", side_effect=[10.0, 10.0 + 5.5 / 30]):
+            self.assertEqual(self.video.advance_frame(), 0)
+            # Would be frame 5 if it advanced again
+            self.video.get_next_frame()
+            self.assertEqual(self.video.active_frame, 0)
+            self.video.video_cache.get_frame.assert_called_once_with(0)
+
+            self.video.get_next_frame()
+            self.assertEqual(self.video.active_frame, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests that low priority key writes held back by the write budget wait for the next
+frame instead of keeping the media player loop busy.
+
+Needs the app's dependencies (StreamDeck, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.DeckManagement.DeckController import (
+        TASK_PRIORITY_HIGH, TASK_PRIORITY_LOW, MediaPlayerThread
+    )
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestKeyWriteBudget(unittest.TestCase):
+    def setUp(self):
+        self.page = object()
+        self.written = []
+
+        deck = mock.MagicMock()
+        deck.set_key_image.side_effect = lambda key_index, image: self.written.append(key_index)
+        controller = SimpleNamespace(active_page=self.page, deck=deck, serial_number=lambda: "test")
+
+        with mock.patch("src.backend.DeckManagement.DeckController.gl"):
+            self.player = MediaPlayerThread(controller)
+        self.player._finish_page_switch_timer = lambda: None
+        # One write takes a whole frame, so only one low priority key fits into it
+        self.player.key_write_time = 1 / self.player.FPS
+        self.player.key_writes = 1
+        self.player._record_key_write_time = lambda duration: None
+
+    def add_keys(self, n: int, priority: int, start: int = 0) -> None:
+        for key_index in range(start, start + n):
+            self.player.add_image_task(key_index, f"image-{key_index}".encode(), priority=priority)
+
+    def test_held_back_writes_wait_for_next_frame(self):
+        self.add_keys(4, TASK_PRIORITY_LOW)
+        self.player.perform_media_player_tasks()
+        self.assertEqual(self.written, [0])
+        self.assertEqual(len(self.player.deferred_image_tasks), 3)
+
+        # Nothing to do before the next frame
+        self.assertGreater(self.player._get_wait_time(), 0)
+        self.player.perform_media_player_tasks()
+        self.assertEqual(self.written, [0])
+
+        self.player._deferred_due = time.monotonic()
+        self.assertEqual(self.player._get_wait_time(), 0)
+        self.player.perform_media_player_tasks()
+        self.assertEqual(self.written, [0, 1])
+
+    def test_high_priority_write_is_not_held_back(self):
+        self.add_keys(4, TASK_PRIORITY_LOW)
+        self.player.perform_media_player_tasks()
+
+        self.add_keys(1, TASK_PRIORITY_HIGH, start=3)
+        self.assertEqual(self.player._get_wait_time(), 0)
+        self.player.perform_media_player_tasks()
+        self.assertEqual(self.written, [0, 3])
+        self.assertNotIn(3, self.player.deferred_image_tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
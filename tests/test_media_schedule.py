@@ -0,0 +1,63 @@
+"""
+Tests for the deadline schedule of the media player, which runs the media ticks of
+animated inputs when they are due instead of polling them every frame.
+
+Needs the app's dependencies (StreamDeck, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.DeckManagement.DeckController import MediaPlayerThread
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestMediaSchedule(unittest.TestCase):
+    def setUp(self):
+        controller = SimpleNamespace(active_page=object(), deck=mock.MagicMock(), serial_number=lambda: "test")
+        with mock.patch("src.backend.DeckManagement.DeckController.gl"):
+            self.player = MediaPlayerThread(controller)
+
+    def test_due_keys_are_popped_in_deadline_order(self):
+        self.player.schedule("a", 0.3)
+        self.player.schedule("b", 0.1)
+        self.player.schedule("c", 0.2)
+
+        self.assertEqual(self.player._pop_due(time.monotonic()), [])
+        self.assertEqual(self.player._pop_due(time.monotonic() + 1), ["b", "c", "a"])
+        self.assertEqual(self.player._pop_due(time.monotonic() + 1), [])
+
+    def test_earlier_deadline_wins(self):
+        self.player.schedule("a", 0.5)
+        self.player.schedule("a", 0.1)
+        # A later deadline doesn't push back the one already registered
+        self.player.schedule("a", 0.8)
+
+        self.assertLessEqual(self.player._get_wait_time(), 0.1)
+        self.assertEqual(self.player._pop_due(time.monotonic() + 0.2), ["a"])
+        # The replaced entries are still in the heap but don't run the tick again
+        self.assertEqual(self.player._pop_due(time.monotonic() + 1), [])
+
+    def test_unscheduled_key_is_not_popped(self):
+        self.player.schedule("a", 0.1)
+        self.player.schedule("b", 0.2)
+        self.player.unschedule("a")
+
+        self.assertEqual(self.player._pop_due(time.monotonic() + 1), ["b"])
+
+    def test_nothing_scheduled_waits_for_a_wake_up(self):
+        self.assertIsNone(self.player._get_wait_time())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Tests for the cache of decoded page media.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import importlib.util
+import unittest
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+if HAS_PIL:
+    from PIL import Image
+
+    from src.backend.Utils.PageMediaCache import PageMediaCache
+
+
+@unittest.skipUnless(HAS_PIL, "Pillow is not installed")
+class TestPageMediaCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PageMediaCache(max_entries=2)
+        self.decodes = []
+
+    def get(self, path: str, mtime: float = 1.0):
+        def decode():
+            self.decodes.append(path)
+            return Image.new("RGBA", (8, 8))
+        return self.cache.get(path, mtime, False, decode)
+
+    def test_decoded_once_per_mtime(self):
+        self.get("a.png")
+        self.get("a.png")
+        self.get("a.png", mtime=2.0)
+        self.assertEqual(self.decodes, ["a.png", "a.png"])
+
+    def test_least_recently_used_is_dropped(self):
+        self.get("a.png")
+        self.get("b.png")
+        self.get("a.png")
+        self.get("c.png")
+        self.assertTrue(self.cache.contains("a.png"))
+        self.assertFalse(self.cache.contains("b.png"))
+
+    def test_discard(self):
+        self.get("a.png")
+        self.get("a.png", mtime=2.0)
+        self.assertEqual(self.cache.discard("a.png"), 2 * 8 * 8 * 4)
+        self.assertFalse(self.cache.contains("a.png"))
+        self.assertEqual(self.cache.discard("a.png"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for the parsed page cache and its write-behind.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src.backend.PageManagement.PageStore import PageStore
+from src.backend.Utils.AtomicSaveUtils import atomic_write
+
+
+class TestPageStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "Main.json")
+        self.backup_dir = os.path.join(self.tmp.name, "backups")
+        with open(self.path, "w") as f:
+            json.dump({"keys": {"0x0": {"states": {"0": {"labels": {}}}}}}, f)
+
+        self.store = PageStore(backup_dir=self.backup_dir, save_delay=0.05)
+
+    def tearDown(self):
+        self.store.flush_all()
+        self.tmp.cleanup()
+
+    def read_file(self) -> dict:
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_pages_share_one_dict(self):
+        self.assertIs(self.store.get(self.path), self.store.get(self.path))
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        self.store.get(self.path)
+        with mock.patch("src.backend.Utils.JsonFileStore.json.loads") as loads:
+            self.store.get(self.path)
+        loads.assert_not_called()
+
+    def test_external_change_is_picked_up(self):
+        self.store.get(self.path)
+        with open(self.path, "w") as f:
+            json.dump({"settings": {"changed": True}}, f)
+        self.assertEqual(self.store.get(self.path), {"settings": {"changed": True}})
+
+    def test_copies_are_private(self):
+        copy = self.store.get_copy(self.path)
+        copy["keys"]["0x0"] = {}
+        self.assertIn("states", self.store.get(self.path)["keys"]["0x0"])
+
+    def test_burst_of_saves_is_written_once(self):
+        data = self.store.get(self.path)
+        with mock.patch("src.backend.Utils.JsonFileStore.atomic_write", wraps=atomic_write) as write:
+            for i in range(20):
+                data["keys"]["0x0"]["states"]["0"]["labels"]["center"] = {"text": str(i)}
+                self.store.put(self.path, data)
+            # Unwritten changes win over the file
+            self.assertEqual(self.store.get(self.path)["keys"]["0x0"]["states"]["0"]["labels"]["center"]["text"], "19")
+            time.sleep(0.3)
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(self.read_file()["keys"]["0x0"]["states"]["0"]["labels"]["center"]["text"], "19")
+
+    def test_backup_holds_previous_version(self):
+        self.store.get(self.path)
+        self.store.put(self.path, {"settings": {}})
+        self.store.flush(self.path)
+
+        with open(os.path.join(self.backup_dir, "Main.json")) as f:
+            self.assertIn("keys", json.load(f))
+        self.assertEqual(self.read_file(), {"settings": {}})
+
+    def test_forget_drops_pending_write(self):
+        self.store.put(self.path, {"settings": {}})
+        self.store.forget(self.path)
+        os.remove(self.path)
+        time.sleep(0.2)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_evict_keeps_pending_write(self):
+        page = self.store.get(self.path)
+        self.store.evict(self.path)
+        self.assertIsNot(self.store.get(self.path), page)
+
+        self.store.put(self.path, {"settings": {}})
+        self.store.evict(self.path)
+        self.store.flush(self.path)
+        self.assertEqual(self.read_file(), {"settings": {}})
+
+    def test_failed_write_is_retried(self):
+        self.store.put(self.path, {"settings": {}})
+        with mock.patch("src.backend.Utils.JsonFileStore.atomic_write", side_effect=OSError("disk full")):
+            self.store.flush(self.path)
+        # Still pending, the timer writes it once the disk is writable again
+        self.assertIn("keys", self.read_file())
+        time.sleep(0.3)
+        self.assertEqual(self.read_file(), {"settings": {}})
+
+    def test_missing_file_gives_empty_dict(self):
+        self.assertEqual(self.store.get(os.path.join(self.tmp.name, "missing.json")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
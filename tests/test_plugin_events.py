@@ -0,0 +1,110 @@
+"""
+Tests for plugin events on the shared event loop.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import asyncio
+import threading
+import time
+import unittest
+
+from src.backend.PluginManager.EventHolder import EventHolder
+from src.backend.PluginManager.PluginEventLoop import PluginEventLoop
+
+NESTING = 32
+
+
+def trigger_in_background(holder: EventHolder) -> threading.Thread:
+    # A deadlock fails the test instead of hanging it
+    thread = threading.Thread(target=holder.trigger_event, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestPluginEvents(unittest.TestCase):
+    def test_nested_triggers_are_delivered(self):
+        holders = [EventHolder(plugin_base=None, event_id=f"test::nested-{i}") for i in range(NESTING + 1)]
+        delivered = threading.Event()
+
+        for i in range(NESTING):
+            # Each sync listener triggers the next event from its worker thread
+            holders[i].add_listener(lambda *args, next_holder=holders[i + 1]: next_holder.trigger_event())
+        holders[NESTING].add_listener(lambda *args: delivered.set())
+
+        trigger_in_background(holders[0])
+        self.assertTrue(delivered.wait(5))
+
+    def test_nested_triggers_in_parallel(self):
+        inner = EventHolder(plugin_base=None, event_id="test::inner")
+        outer = EventHolder(plugin_base=None, event_id="test::outer")
+        calls = []
+        inner.add_listener(lambda *args: calls.append(args))
+        outer.add_listener(lambda *args: inner.trigger_event())
+
+        for _ in range(NESTING):
+            trigger_in_background(outer)
+
+        deadline = time.monotonic() + 5
+        while len(calls) < NESTING and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(calls), NESTING)
+
+    def test_slow_listener_does_not_hold_back_other_events(self):
+        release = threading.Event()
+        slow = EventHolder(plugin_base=None, event_id="test::slow")
+        slow.add_listener(lambda *args: release.wait(5))
+        for _ in range(NESTING):
+            slow.trigger_event_nowait()
+            # Not coalesced, every call occupies a listener thread
+            time.sleep(0.005)
+
+        fast = EventHolder(plugin_base=None, event_id="test::fast")
+        called = threading.Event()
+        fast.add_listener(lambda *args: called.set())
+
+        trigger_in_background(fast)
+        try:
+            self.assertTrue(called.wait(1))
+        finally:
+            release.set()
+
+    def test_sync_listeners_beyond_the_cap_are_queued(self):
+        event_loop = PluginEventLoop(max_sync_workers=2)
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+
+        def listener():
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        async def run():
+            await asyncio.get_running_loop().run_in_executor(None, listener)
+
+        futures = [event_loop.submit(run()) for _ in range(6)]
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(max_active, 2)
+
+    def test_trigger_event_returns_none(self):
+        holder = EventHolder(plugin_base=None, event_id="test::result")
+        holder.add_listener(lambda *args: "result")
+        self.assertIsNone(holder.trigger_event())
+
+    def test_listener_gets_event_id_and_args(self):
+        holder = EventHolder(plugin_base=None, event_id="test::args")
+        received = []
+        holder.add_listener(lambda *args: received.append(args))
+        holder.trigger_event(1, "two")
+        self.assertEqual(received, [("test::args", 1, "two")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for the cached plugin settings and their change callbacks.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src.backend.Utils.AtomicSaveUtils import atomic_write
+from src.backend.Utils.JsonFileStore import JsonFileStore
+from src.backend.Utils.PluginSettingsStore import PluginSettingsStore
+
+
+class TestPluginSettingsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "plugins", "com_example_test", "settings.json")
+        self.file_store = JsonFileStore(save_delay=0.05)
+        self.store = PluginSettingsStore(self.path, file_store=self.file_store)
+
+        self.changes = []
+        self.store.connect_changed(self.changes.append)
+
+    def tearDown(self):
+        self.file_store.flush_all()
+        self.tmp.cleanup()
+
+    def write_file(self, content: dict) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(content, f)
+
+    def read_file(self) -> dict:
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_missing_file_gives_empty_settings(self):
+        self.assertEqual(self.store.get_settings(), {})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        self.write_file({"file-version": "2.0", "settings": {"volume": 3}})
+        self.store.get_settings()
+        with mock.patch("src.backend.Utils.JsonFileStore.json.loads") as loads:
+            self.assertEqual(self.store.get_settings(), {"volume": 3})
+        loads.assert_not_called()
+
+    def test_external_edit_is_picked_up_by_mtime(self):
+        self.write_file({"file-version": "2.0", "settings": {"volume": 3}})
+        self.store.get_settings()
+
+        self.write_file({"file-version": "2.0", "settings": {"volume": 7}})
+        # Same size, so only the mtime tells the versions apart
+        os.utime(self.path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        self.assertEqual(self.store.get_settings(), {"volume": 7})
+        self.assertEqual(self.changes, [{"volume": 7}])
+
+    def test_old_format_is_migrated(self):
+        self.write_file({"volume": 3})
+        self.assertEqual(self.store.get_settings(), {"volume": 3})
+        self.file_store.flush(self.path)
+
+        self.assertEqual(self.read_file(), {"file-version": "2.0", "settings": {"volume": 3}})
+        self.assertEqual(self.store.get_settings(), {"volume": 3})
+        self.assertEqual(self.changes, [])
+
+    def test_corrupt_file_is_kept_before_overwrite(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            f.write('{"file-version": "2.0", "settings": {"volume": 3')
+        self.assertEqual(self.store.get_settings(), {})
+
+        self.store.set_settings({"volume": 4})
+        self.file_store.flush(self.path)
+
+        with open(f"{self.path}.corrupt") as f:
+            self.assertIn('"volume": 3', f.read())
+        self.assertEqual(self.read_file(), {"file-version": "2.0", "settings": {"volume": 4}})
+
+    def test_shared_store_is_flushed(self):
+        with mock.patch.object(PluginSettingsStore, "_shared_file_store", self.file_store):
+            self.store.set_settings({"volume": 3})
+            PluginSettingsStore.flush_shared_file_store()
+        self.assertEqual(self.read_file(), {"file-version": "2.0", "settings": {"volume": 3}})
+
+    def test_burst_of_sets_is_written_once(self):
+        with mock.patch("src.backend.Utils.JsonFileStore.atomic_write", wraps=atomic_write) as write:
+            for i in range(20):
+                self.store.set_settings({"volume": i})
+            self.assertFalse(os.path.exists(self.path))
+            # Unwritten changes win over the file
+            self.assertEqual(self.store.get_settings(), {"volume": 19})
+            time.sleep(0.3)
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(self.read_file(), {"file-version": "2.0", "settings": {"volume": 19}})
+
+    def test_settings_are_copies(self):
+        settings = {"volume": 3}
+        self.store.set_settings(settings)
+        settings["volume"] = 4
+        self.store.get_settings()["volume"] = 5
+        self.assertEqual(self.store.get_settings(), {"volume": 3})
+
+    def test_set_settings_notifies_on_change_only(self):
+        self.store.set_settings({"volume": 3})
+        self.store.set_settings({"volume": 3})
+        self.store.disconnect_changed(self.changes.append)
+        self.store.set_settings({"volume": 4})
+        self.assertEqual(self.changes, [{"volume": 3}])
+
+    def test_failing_callback_does_not_stop_the_others(self):
+        def fail(settings):
+            raise ValueError("broken plugin")
+        self.store.callbacks.insert(0, fail)
+
+        self.store.set_settings({"volume": 3})
+        self.assertEqual(self.changes, [{"volume": 3}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests that forgetting what the deck shows makes keys send their image again,
+as needed after a reconnect or USB reset.
+
+Needs the app's dependencies (StreamDeck, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from PIL import Image
+    from src.backend.DeckManagement.DeckController import ControllerKey, DeckController
+    from src.backend.DeckManagement.InputIdentifier import Input
+    from src.backend.DeckManagement.Subclasses.KeyRenderCache import key_render_cache
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+RENDER_KEY = ("test-render-key",)
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestRenderInvalidation(unittest.TestCase):
+    def setUp(self):
+        self.media_player = SimpleNamespace(
+            add_image_task=mock.Mock(),
+            last_key_image_hashes={},
+            last_touchscreen_hashes={},
+            last_screen_hash=None,
+        )
+
+        self.controller = DeckController.__new__(DeckController)
+        self.controller.media_player = self.media_player
+
+        key = ControllerKey.__new__(ControllerKey)
+        key.deck_controller = self.controller
+        key.index = 0
+        key.identifier = None
+        key._suppress_render = False
+        key._render_pending = False
+        key._render_lock = threading.RLock()
+        key._last_img_hash = None
+        key._last_render_key = None
+        key.get_plain_video_signature = lambda: None
+        key.schedule_media_tick = lambda: None
+        key.get_render_key = lambda: RENDER_KEY
+        key.set_ui_key_image = lambda image: None
+        self.key = key
+
+        self.controller.inputs = {Input.Key: [key]}
+        key_render_cache.put(RENDER_KEY, Image.new("RGBA", (72, 72)), b"native")
+
+    def tearDown(self):
+        key_render_cache.clear()
+
+    def test_unchanged_key_is_skipped(self):
+        self.key.update()
+        self.key.update()
+        self.assertEqual(self.media_player.add_image_task.call_count, 1)
+
+    def test_update_resends_after_invalidation(self):
+        self.key.update()
+        self.controller.invalidate_render_caches()
+        self.key.update()
+        self.assertEqual(self.media_player.add_image_task.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
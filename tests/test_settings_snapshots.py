@@ -0,0 +1,102 @@
+"""
+Tests for the read-only settings snapshots: freezing and thawing, and that saving a
+file only publishes a new snapshot for that file.
+
+Needs the app's dependencies, skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend import SettingsManager as settings_manager_module
+    from src.backend.SettingsManager import SettingsManager, SettingsSnapshot, freeze, thaw
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+SETTINGS = {"general": {"hold-time": 0.5, "default-font": {"size": 15}}, "pages": ["a", {"b": [1, 2]}]}
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestFreeze(unittest.TestCase):
+    def test_round_trip(self):
+        frozen = freeze(SETTINGS)
+        self.assertEqual(thaw(frozen), SETTINGS)
+        self.assertIsInstance(frozen["pages"], tuple)
+
+    def test_snapshot_is_read_only(self):
+        snapshot = SettingsSnapshot(SETTINGS, version=1)
+        with self.assertRaises(TypeError):
+            snapshot["general"]["hold-time"] = 1
+        with self.assertRaises(TypeError):
+            snapshot["pages"][1]["b"][0] = 3
+
+        # Thawing hands out a copy that can be changed without touching the snapshot
+        settings = snapshot.thaw()
+        settings["general"]["hold-time"] = 1
+        self.assertEqual(snapshot["general"]["hold-time"], 0.5)
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestPublish(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gl = SimpleNamespace(DATA_PATH=self.tmp.name)
+        patcher = mock.patch.object(settings_manager_module, "gl", self.gl)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.manager = SettingsManager()
+        self.gl.settings_manager = self.manager
+        os.makedirs(os.path.join(self.tmp.name, "settings", "decks"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_bumps_only_that_files_version(self):
+        deck = self.manager.get_deck_settings_snapshot("deck-a")
+        app = self.manager.get_app_settings_snapshot()
+
+        self.manager.save_app_settings({"general": {"hold-time": 1}})
+
+        new_app = self.manager.get_app_settings_snapshot()
+        self.assertEqual(new_app.version, app.version + 1)
+        self.assertEqual(new_app["general"]["hold-time"], 1)
+        self.assertIs(self.manager.get_deck_settings_snapshot("deck-a"), deck)
+
+    def test_subscribers_get_the_new_snapshot(self):
+        received = []
+        self.manager.subscribe_app_settings(received.append)
+        deck_path = self.manager.get_deck_settings_path("deck-a")
+        self.manager.subscribe(deck_path, lambda snapshot: self.fail("deck settings were not saved"))
+
+        self.manager.save_app_settings({"general": {"rolling-labels": False}})
+        self.assertEqual(len(received), 1)
+        self.assertIs(received[0], self.manager.get_app_settings_snapshot())
+
+        # A failing subscriber doesn't keep the others from being called
+        self.manager.subscribe_app_settings(mock.Mock(side_effect=ValueError("broken")))
+        self.manager.subscribe_app_settings(received.append)
+        self.manager.save_app_settings({})
+        self.assertEqual(len(received), 3)
+
+    def test_working_copy_is_dropped_on_save(self):
+        settings = self.manager.get_app_settings()
+        self.assertIs(self.manager.get_app_settings(), settings)
+
+        settings["general"] = {"hold-time": 2}
+        self.manager.save_app_settings(settings)
+        self.assertIsNot(self.manager.get_app_settings(), settings)
+        self.assertEqual(self.manager.get_app_settings()["general"]["hold-time"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
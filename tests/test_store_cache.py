@@ -0,0 +1,83 @@
+"""
+Tests that the index of the store cache is written behind and never goes back to an older state.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.Store import StoreCache as store_cache_module
+    from src.backend.Store.StoreCache import StoreCache
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+URL = "https://github.com/StreamController/StreamController-Store"
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestStoreCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patchers = [
+            mock.patch.object(store_cache_module, "gl", SimpleNamespace(DATA_PATH=self.tmp.name)),
+            mock.patch.object(store_cache_module, "SAVE_DELAY", 0.05),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache = StoreCache()
+        self.cache.flush()
+
+    def tearDown(self):
+        self.cache.flush()
+        self.tmp.cleanup()
+
+    def read_index(self) -> dict:
+        with open(self.cache.files_json) as f:
+            return json.load(f)
+
+    def test_burst_of_writes_is_saved_once(self):
+        with mock.patch.object(store_cache_module, "atomic_save_json", wraps=store_cache_module.atomic_save_json) as save:
+            for i in range(20):
+                self.cache.write_cache_file(URL, f"file-{i}.json", "{}", validators={"etag": f'"{i}"'})
+            self.assertEqual(save.call_count, 0)
+            time.sleep(0.3)
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(len(self.read_index()), 20)
+
+    def test_concurrent_writes_keep_every_entry(self):
+        def write(i: int):
+            self.cache.write_cache_file(URL, f"file-{i}.json", "{}")
+            self.cache.flush()
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.cache.flush()
+
+        self.assertEqual(len(self.read_index()), 16)
+
+    def test_index_survives_reopen(self):
+        self.cache.write_cache_file(URL, "plugins.json", "[]", validators={"etag": '"abc"'})
+        self.cache.flush()
+
+        reopened = StoreCache()
+        self.assertTrue(reopened.is_cached(URL, "plugins.json"))
+        self.assertEqual(reopened.get_validators(URL, "plugins.json"), {"etag": '"abc"'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Tests for the pooled HTTP client of the store, against a local stand-in for GitHub.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.backend.Store.StoreHttpClient import StoreHttpClient
+
+ETAG = '"abc123"'
+LAST_MODIFIED = "Tue, 01 Oct 2024 10:00:00 GMT"
+RESPONSE_DELAY = 0.05
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.requests += 1
+            server.client_ports.add(self.client_address[1])
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(RESPONSE_DELAY)
+
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = f"content of {self.path}".encode()
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestStoreHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.requests = 0
+        self.server.client_ports = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_revalidation_with_etag(self):
+        client = StoreHttpClient()
+
+        response = client.get(f"{self.base_url}/manifest.json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "content of /manifest.json")
+
+        validators = client.get_validators(response)
+        self.assertEqual(validators, {"etag": ETAG, "last-modified": LAST_MODIFIED})
+
+        headers = client.get_conditional_headers(validators)
+        response = client.get(f"{self.base_url}/manifest.json", headers=headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_no_validators_means_no_conditional_headers(self):
+        self.assertEqual(StoreHttpClient.get_conditional_headers({}), {})
+
+    def test_concurrency_is_bounded(self):
+        client = StoreHttpClient(max_concurrent=4)
+
+        async def fetch_all():
+            return await asyncio.gather(*[client.get_async(f"{self.base_url}/slow/{i}") for i in range(24)])
+
+        responses = asyncio.run(fetch_all())
+
+        self.assertEqual([r.text for r in responses], [f"content of /slow/{i}" for i in range(24)])
+        self.assertLessEqual(client.max_in_flight, 4)
+        self.assertLessEqual(self.server.max_active, 4)
+        # Actually parallel, not one after the other
+        self.assertGreater(self.server.max_active, 1)
+
+    def test_connections_are_reused(self):
+        client = StoreHttpClient(max_concurrent=2)
+
+        async def fetch_all():
+            return await asyncio.gather(*[client.get_async(f"{self.base_url}/file/{i}") for i in range(20)])
+
+        asyncio.run(fetch_all())
+
+        self.assertEqual(self.server.requests, 20)
+        self.assertLessEqual(len(self.server.client_ports), 2)
+
+    def test_streamed_download_counts_as_in_flight(self):
+        client = StoreHttpClient()
+        with client.stream(f"{self.base_url}/plugin.zip") as response:
+            self.assertEqual(client.in_flight, 1)
+            self.assertEqual(b"".join(response.iter_content(chunk_size=4)), b"content of /plugin.zip")
+        self.assertEqual(client.in_flight, 0)
+        self.assertEqual(client.max_in_flight, 1)
+
+    def test_usable_from_several_loops(self):
+        # The store pages each run their own asyncio.run
+        client = StoreHttpClient()
+        for _ in range(3):
+            response = asyncio.run(client.get_async(f"{self.base_url}/versions.json"))
+            self.assertEqual(response.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
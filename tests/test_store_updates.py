@@ -0,0 +1,102 @@
+"""
+Tests for the parallel update pipeline of the store.
+
+Needs the app's dependencies (GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from src.backend.Store.StoreBackend import NoConnectionError, StoreBackend
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+def make_plugin(plugin_id: str) -> SimpleNamespace:
+    return SimpleNamespace(plugin_id=plugin_id)
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestStoreUpdates(unittest.TestCase):
+    def setUp(self):
+        self.backend = StoreBackend.__new__(StoreBackend)
+        self.progress = []
+
+    def on_progress(self, asset_id: str, status: str) -> None:
+        self.progress.append((asset_id, status))
+
+    def test_parallel_updates_are_bounded(self):
+        active = 0
+        max_active = 0
+
+        async def install(plugin):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        plugins = [make_plugin(str(i)) for i in range(10)]
+        installed = asyncio.run(self.backend.run_updates(plugins, install, lambda plugin: plugin.plugin_id))
+        self.assertEqual(installed, plugins)
+        self.assertEqual(max_active, StoreBackend.MAX_PARALLEL_UPDATES)
+
+    def test_failed_updates_are_skipped(self):
+        async def install(plugin):
+            if plugin.plugin_id == "raises":
+                raise OSError("disk full")
+            if plugin.plugin_id == "offline":
+                return NoConnectionError()
+            if plugin.plugin_id == "missing":
+                return 404
+
+        plugins = [make_plugin(plugin_id) for plugin_id in ("ok", "raises", "offline", "missing")]
+        installed = asyncio.run(self.backend.run_updates(plugins, install, lambda plugin: plugin.plugin_id, self.on_progress))
+
+        self.assertEqual(installed, plugins[:1])
+        self.assertIn(("ok", "done"), self.progress)
+        for plugin_id in ("raises", "offline", "missing"):
+            self.assertIn((plugin_id, "failed"), self.progress)
+
+    def test_failing_progress_callback_does_not_stop_the_others(self):
+        async def install(plugin):
+            pass
+
+        def on_progress(asset_id: str, status: str):
+            if asset_id == "broken":
+                raise ValueError("broken ui")
+
+        plugins = [make_plugin(plugin_id) for plugin_id in ("broken", "ok")]
+        installed = asyncio.run(self.backend.run_updates(plugins, install, lambda plugin: plugin.plugin_id, on_progress))
+        self.assertEqual(installed, plugins[1:])
+
+    def test_update_all_plugins_counts_only_successes(self):
+        plugins = [make_plugin(plugin_id) for plugin_id in ("a", "b", "c")]
+
+        async def get_plugins_to_update():
+            return plugins
+
+        async def fetch_plugin(plugin):
+            if plugin.plugin_id == "b":
+                return NoConnectionError()
+
+        self.backend.get_plugins_to_update = get_plugins_to_update
+        self.backend.fetch_plugin = fetch_plugin
+        self.backend.uninstall_plugin = mock.Mock()
+        self.backend.reload_plugins = mock.Mock()
+
+        self.assertEqual(asyncio.run(self.backend.update_all_plugins()), 2)
+        self.assertEqual(self.backend.uninstall_plugin.call_count, 3)
+        self.backend.reload_plugins.assert_called_once_with(["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for the rasterized svg cache and the budget of its disk folder.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+if HAS_PIL:
+    from PIL import Image
+
+    from src.backend.Utils.SvgRasterCache import SvgRasterCache
+
+
+@unittest.skipUnless(HAS_PIL, "Pillow is not installed")
+class TestSvgRasterCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk_dir = os.path.join(self.tmp.name, "svg")
+        os.makedirs(self.disk_dir)
+        self.renders = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_svg(self, name: str) -> str:
+        path = os.path.join(self.tmp.name, f"{name}.svg")
+        with open(path, "w") as f:
+            f.write("<svg xmlns='http://www.w3.org/2000/svg'/>")
+        return path
+
+    def render(self, size: int):
+        self.renders += 1
+        # Noise doesn't compress, so every PNG has about the same size
+        return Image.frombytes("RGBA", (size, size), os.urandom(size * size * 4))
+
+    def get(self, cache: "SvgRasterCache", svg_path: str, size: int = 32):
+        return cache.get(svg_path, size, size, lambda: self.render(size))
+
+    def get_disk_bytes(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.disk_dir))
+
+    def test_disk_tier_survives_restart(self):
+        svg_path = self.make_svg("icon")
+        self.get(SvgRasterCache(disk_dir=self.disk_dir), svg_path)
+        self.get(SvgRasterCache(disk_dir=self.disk_dir), svg_path)
+        self.assertEqual(self.renders, 1)
+
+    def test_disk_tier_stays_within_budget(self):
+        # About 4 KB per PNG
+        cache = SvgRasterCache(disk_dir=self.disk_dir, disk_budget_bytes=40 * 1024)
+        for i in range(50):
+            self.get(cache, self.make_svg(f"icon-{i}"))
+
+        self.assertLessEqual(self.get_disk_bytes(), 40 * 1024)
+        self.assertEqual(cache.get_stats()["disk_bytes"], self.get_disk_bytes())
+
+    def test_least_recently_used_png_is_removed_first(self):
+        svg_paths = [self.make_svg(f"icon-{i}") for i in range(4)]
+        cache = SvgRasterCache(disk_dir=self.disk_dir, budget_bytes=0)
+        for svg_path in svg_paths:
+            self.get(cache, svg_path)
+            time.sleep(0.01)
+        # A disk hit makes the first one the most recently used
+        self.get(cache, svg_paths[0])
+        self.assertEqual(self.renders, 4)
+
+        png_bytes = self.get_disk_bytes() // 4
+        cache.disk_budget.budget_bytes = png_bytes * 4 - 1
+        self.get(cache, self.make_svg("icon-new"))
+
+        self.renders = 0
+        self.get(cache, svg_paths[0])
+        self.assertEqual(self.renders, 0)
+        self.get(cache, svg_paths[1])
+        self.assertEqual(self.renders, 1)
+
+    def test_discard_keeps_disk_copy(self):
+        svg_path = self.make_svg("icon")
+        cache = SvgRasterCache(disk_dir=self.disk_dir)
+        self.get(cache, svg_path, 32)
+        self.get(cache, svg_path, 64)
+        self.assertTrue(cache.contains(svg_path))
+
+        self.assertEqual(cache.discard(svg_path), (32 * 32 + 64 * 64) * 4)
+        self.assertFalse(cache.contains(svg_path))
+        self.assertEqual(cache.get_stats()["bytes"], 0)
+
+        self.get(cache, svg_path, 32)
+        self.assertEqual(self.renders, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
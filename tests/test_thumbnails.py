@@ -0,0 +1,66 @@
+"""
+Tests that thumbnails are generated by the right decoder, whatever the case of the extension.
+
+Needs the app's dependencies (GTK, OpenCV), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from PIL import Image
+    from src.backend.MediaManager import MediaManager
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestThumbnails(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.media_manager = MediaManager.__new__(MediaManager)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_image(self, name: str, format: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        Image.new("RGB", (40, 20), "red").save(path, format)
+        return path
+
+    def test_images_are_not_decoded_as_video(self):
+        paths = [
+            self.make_image("upper.JPG", "JPEG"),
+            self.make_image("upper.PNG", "PNG"),
+            self.make_image("image.webp", "WEBP"),
+            self.make_image("image.bmp", "BMP"),
+        ]
+        with mock.patch.object(MediaManager, "generate_video_thumbnail") as video:
+            for path in paths:
+                with self.subTest(path=path):
+                    self.assertEqual(self.media_manager.generate_thumbnail(path).size, (40, 20))
+        video.assert_not_called()
+
+    def test_upper_case_gif(self):
+        path = self.make_image("anim.GIF", "GIF")
+        with mock.patch.object(MediaManager, "generate_gif_thumbnail") as gif:
+            self.media_manager.generate_thumbnail(path)
+        gif.assert_called_once_with(path)
+
+    def test_videos_use_video_decoder(self):
+        path = os.path.join(self.tmp.name, "clip.MP4")
+        open(path, "wb").close()
+        with mock.patch.object(MediaManager, "generate_video_thumbnail") as video:
+            self.media_manager.generate_thumbnail(path)
+        video.assert_called_once_with(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
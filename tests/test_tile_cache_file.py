@@ -0,0 +1,115 @@
+"""
+Tests for the memory-mapped tile file of background videos and its disk budget.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+if HAS_PIL:
+    from PIL import Image
+
+    from src.backend.DeckManagement.Subclasses.TileCacheFile import TileCacheFile
+    from src.backend.Utils.DiskCacheBudget import DiskCacheBudget
+
+N_FRAMES = 4
+KEY_COUNT = 3
+SIZE = (8, 8)
+
+
+@unittest.skipUnless(HAS_PIL, "Pillow is not installed")
+class TestTileCacheFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "3x5", "video_8x8.tiles")
+        self.files = []
+
+    def tearDown(self):
+        for tile_file in self.files:
+            tile_file.close()
+        self.tmp.cleanup()
+
+    def open(self, path: str = None, key_count: int = KEY_COUNT, disk_budget: "DiskCacheBudget" = None) -> "TileCacheFile":
+        tile_file = TileCacheFile(path or self.path, N_FRAMES, key_count, SIZE, 3, disk_budget=disk_budget)
+        self.files.append(tile_file)
+        return tile_file
+
+    def close(self, tile_file: "TileCacheFile") -> None:
+        self.files.remove(tile_file)
+        tile_file.close()
+
+    @staticmethod
+    def make_tiles(color: str, key_count: int = KEY_COUNT) -> list:
+        return [Image.new("RGB", SIZE, color) for _ in range(key_count)]
+
+    def test_written_frames_are_read_back(self):
+        tile_file = self.open()
+        self.assertFalse(tile_file.has_frame(1))
+        self.assertIsNone(tile_file.read_frame(1))
+
+        tile_file.write_frame(1, self.make_tiles("red"))
+        tiles = tile_file.read_frame(1)
+        self.assertEqual(len(tiles), KEY_COUNT)
+        self.assertEqual(tiles[0].getpixel((0, 0)), (255, 0, 0))
+        self.assertFalse(tile_file.is_complete())
+
+        for n in range(N_FRAMES):
+            tile_file.write_frame(n, self.make_tiles("blue"))
+        self.assertTrue(tile_file.is_complete())
+
+    def test_reopen_keeps_frames(self):
+        tile_file = self.open()
+        tile_file.write_frame(2, self.make_tiles("red"))
+        self.close(tile_file)
+
+        tile_file = self.open()
+        self.assertTrue(tile_file.has_frame(2))
+        self.assertEqual(tile_file.read_frame(2)[1].getpixel((0, 0)), (255, 0, 0))
+
+    def test_reopen_with_other_layout_invalidates(self):
+        tile_file = self.open()
+        tile_file.write_frame(2, self.make_tiles("red"))
+        self.close(tile_file)
+
+        tile_file = self.open(key_count=KEY_COUNT + 1)
+        self.assertFalse(tile_file.has_frame(2))
+        tile_file.write_frame(2, self.make_tiles("blue", KEY_COUNT + 1))
+        self.assertTrue(tile_file.has_frame(2))
+
+    def test_least_recently_used_file_is_deleted(self):
+        probe = self.open(path=os.path.join(self.tmp.name, "probe.tiles"))
+        file_size = os.path.getsize(probe.path)
+        self.close(probe)
+        os.remove(probe.path)
+
+        budget = DiskCacheBudget(self.tmp.name, budget_bytes=file_size * 2, suffix=".tiles", recursive=True)
+        paths = [os.path.join(self.tmp.name, "3x5", f"video-{i}_8x8.tiles") for i in range(3)]
+
+        old = self.open(paths[0], disk_budget=budget)
+        self.close(old)
+        os.utime(paths[0], (time.time(), time.time() - 100))
+        # Still open, so it stays even though it is older
+        kept = self.open(paths[1], disk_budget=budget)
+        os.utime(paths[1], (time.time(), time.time() - 200))
+
+        self.open(paths[2], disk_budget=budget)
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(kept.path))
+        self.assertTrue(os.path.exists(paths[2]))
+
+    def test_file_larger_than_budget_is_refused(self):
+        budget = DiskCacheBudget(self.tmp.name, budget_bytes=1024, suffix=".tiles", recursive=True)
+        with self.assertRaises(ValueError):
+            self.open(disk_budget=budget)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
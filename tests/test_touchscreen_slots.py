@@ -0,0 +1,129 @@
+"""
+Tests that the touchscreen strip only recomposes the dial slots whose content
+changed, and that the render key of a dial tells when that is the case.
+
+Needs the app's dependencies (StreamDeck, GTK), skipped without them.
+
+Run with:
+
+    python3 -m unittest discover -s tests -t .
+"""
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from PIL import Image
+    from src.backend.DeckManagement.DeckController import ControllerDialState, ControllerTouchScreenState
+    from src.backend.DeckManagement.InputIdentifier import Input
+except ImportError as e:
+    IMPORT_ERROR = e
+else:
+    IMPORT_ERROR = None
+
+SLOT_WIDTH = 20
+SLOT_HEIGHT = 10
+
+
+def make_label(text: str, color=(255, 255, 255, 255)) -> SimpleNamespace:
+    return SimpleNamespace(
+        text=text, font_size=15, font_name="Roboto", color=color, font_weight=400,
+        style="normal", outline_width=2, outline_color=(0, 0, 0, 255), alignment="center",
+    )
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestTouchRenderKey(unittest.TestCase):
+    def setUp(self):
+        self.labels = {"center": make_label("Volume")}
+        self.color = [0, 0, 0, 0]
+
+        self.state = ControllerDialState.__new__(ControllerDialState)
+        self.state.dial = mock.Mock(get_image_size=lambda: (SLOT_WIDTH, SLOT_HEIGHT))
+        self.state.image = None
+        self.state.video = None
+        self.state.label_manager = mock.Mock(
+            get_has_scroll_labels=lambda: False,
+            get_composed_labels=lambda: self.labels,
+        )
+        self.state.background_manager = mock.Mock(get_composed_color=lambda: self.color)
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.state.get_touch_render_key(), self.state.get_touch_render_key())
+
+    def test_label_change_changes_key(self):
+        key = self.state.get_touch_render_key()
+        self.labels["center"] = make_label("Mute")
+        self.assertNotEqual(self.state.get_touch_render_key(), key)
+
+        key = self.state.get_touch_render_key()
+        self.labels["center"] = make_label("Mute", color=(255, 0, 0, 255))
+        self.assertNotEqual(self.state.get_touch_render_key(), key)
+
+    def test_background_color_change_changes_key(self):
+        key = self.state.get_touch_render_key()
+        self.color = [255, 0, 0, 255]
+        self.assertNotEqual(self.state.get_touch_render_key(), key)
+
+    def test_video_is_always_rendered(self):
+        self.state.video = mock.Mock()
+        self.assertIsNone(self.state.get_touch_render_key())
+
+
+@unittest.skipUnless(IMPORT_ERROR is None, f"app dependencies missing: {IMPORT_ERROR}")
+class TestRebuildCachedImage(unittest.TestCase):
+    def setUp(self):
+        self.render_keys = {0: ("dial-0",), 1: ("dial-1",)}
+        self.rendered = []
+        dials = [self.make_dial(index) for index in self.render_keys]
+
+        controller_touch = mock.Mock()
+        controller_touch.deck_controller.inputs = {Input.Dial: dials}
+        controller_touch.get_dial_image_area = lambda identifier: (
+            identifier.index * SLOT_WIDTH, 0, (identifier.index + 1) * SLOT_WIDTH, SLOT_HEIGHT
+        )
+
+        self.background_key = ("background",)
+        self.state = ControllerTouchScreenState.__new__(ControllerTouchScreenState)
+        self.state.controller_touch = controller_touch
+        self.state.base_image = None
+        self.state.current_image = None
+        self.state.background_key = None
+        self.state.dial_render_keys = {}
+        self.state.get_background_key = lambda: self.background_key
+        self.state.get_background_layer = lambda key: Image.new("RGBA", (2 * SLOT_WIDTH, SLOT_HEIGHT))
+
+    def make_dial(self, index: int) -> SimpleNamespace:
+        def render() -> Image.Image:
+            self.rendered.append(index)
+            return Image.new("RGBA", (SLOT_WIDTH, SLOT_HEIGHT), (255, 0, 0, 255))
+
+        dial_state = SimpleNamespace(
+            get_touch_render_key=lambda: self.render_keys[index],
+            get_rendered_touch_image=render,
+        )
+        return SimpleNamespace(identifier=SimpleNamespace(index=index), get_active_state=lambda: dial_state)
+
+    def test_only_changed_slots_are_recomposed(self):
+        self.state.rebuild_cached_image()
+        self.assertEqual(sorted(self.rendered), [0, 1])
+
+        self.rendered.clear()
+        self.state.rebuild_cached_image()
+        self.assertEqual(self.rendered, [])
+
+        self.render_keys[1] = ("dial-1", "new label")
+        self.state.rebuild_cached_image()
+        self.assertEqual(self.rendered, [1])
+
+    def test_background_change_recomposes_every_slot(self):
+        self.state.rebuild_cached_image()
+        self.rendered.clear()
+
+        self.background_key = ("other background",)
+        self.state.rebuild_cached_image()
+        self.assertEqual(sorted(self.rendered), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()